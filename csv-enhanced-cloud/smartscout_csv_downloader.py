@@ -11,7 +11,7 @@ log in manually just once.
 **Prerequisites:**
 1. Python 3.7+ installed.
 2. Required packages installed:
-   pip install playwright beautifulsoup4 anthropic pdfplumber pytesseract pdf2image
+   pip install playwright beautifulsoup4 lxml anthropic pdfplumber pytesseract pdf2image
    playwright install
 3. Anthropic API key set as environment variable:
    export ANTHROPIC_API_KEY="your-api-key-here"
@@ -31,17 +31,201 @@ log in manually just once.
 """
 import os
 import sys
+import csv
+import re
 import time
+import contextlib
+import functools
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from playwright.sync_api import sync_playwright, expect
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml's C parser is several times faster than html.parser on full report pages
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# selectolax's Lexbor parser is much faster again when only the text is needed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Report data lives in <body>; skipping <head> avoids building its inline styles and scripts
+REPORT_BODY = SoupStrainer('body')
+
+def parse_report_body(html_content: str) -> BeautifulSoup:
+    """
+    Parse only the <body> of a report page, falling back to the whole document if there isn't one.
+    """
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=REPORT_BODY)
+    if not soup.contents:
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+    return soup
+
+def report_text(html_content: str) -> str:
+    """
+    Text of a report page's <body> with scripts and styles removed, via selectolax when available.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html_content)
+        for node in tree.css('script, style'):
+            node.decompose()
+        root = tree.body or tree.root
+        return root.text() if root is not None else ''
+    
+    soup = parse_report_body(html_content)
+    for script in soup(["script", "style"]):
+        script.decompose()
+    return soup.get_text()
+
+# --- Report text patterns ---
+# Compiled once at import; the extractors below run them over every report's full text
+DOLLAR_RE = re.compile(r'\$[\d,]+(?:\.\d{2})?')
+PERCENT_RE = re.compile(r'[+-]?[\d.]+%')
+WHITESPACE_RE = re.compile(r'\s+')
+BRAND_SHARE_RE = re.compile(r'([A-Z][A-Z\s&]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)', re.MULTILINE)
+CATEGORY_SHARE_RE = re.compile(r'([A-Z][a-z\s]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)', re.MULTILINE)
+WEEKLY_REVENUE_RE = re.compile(r'Weekly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?)\s*(?:.*?([+-]?\$?[\d,]+(?:\.\d{2})?)\s*or\s*([+-]?[\d.]+%)|.*?([+-][\d.]+%))?', re.IGNORECASE | re.DOTALL)
+ASIN_RE = re.compile(r'ASIN:?\s*([A-Z0-9]{10})\s*.*?Title:?\s*([^\n]+).*?(?:Sales Rank:?\s*#?([\d,]+))?.*?(?:Monthly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?))?.*?(?:([+-]?[\d.]+%))?', re.IGNORECASE | re.DOTALL)
+SEARCH_TERM_RE = re.compile(r'"([^"]+)"\s*\(#?(\d+),?\s*([\d,]+)\s*searches?\)', re.IGNORECASE)
+KEYWORD_METRICS_RE = re.compile(r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s+([\d,]+|[\d.]+%)', re.IGNORECASE)
+# Looser variants for the DOM's report text, where the rank/searches suffix and colon are optional
+DOM_SEARCH_TERM_RE = re.compile(r'"([^"]+)"\s*\(?#?(\d+)(?:,\s*([\d,]+)\s*searches?)?\)?', re.IGNORECASE)
+DOM_KEYWORD_METRICS_RE = re.compile(r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s*:?\s*([\d,]+|[\d.]+%)', re.IGNORECASE)
+
+# (metrics key, patterns) pairs used by extract_metrics_from_html
+METRIC_PATTERN_GROUPS = [
+    # Revenue patterns
+    ('revenue_data', [
+        r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|M|thousand|K|billion|B))?',
+        r'Revenue:?\s*\$[\d,]+',
+        r'Monthly.*?\$[\d,]+',
+        r'Sales:?\s*\$[\d,]+'
+    ]),
+    # Growth patterns
+    ('growth_data', [
+        r'[+\-]?\d+(?:\.\d+)?%\s*(?:growth|increase|decrease|change)',
+        r'(?:up|down|grew|declined)\s*\d+(?:\.\d+)?%',
+        r'Growth:?\s*[+\-]?\d+(?:\.\d+)?%'
+    ]),
+    # Ranking patterns
+    ('rankings', [
+        r'#\d+(?:\s*(?:rank|position|place))?',
+        r'Rank(?:ed)?:?\s*#?\d+',
+        r'Position:?\s*#?\d+',
+        r'Top\s*\d+'
+    ]),
+    # Score patterns
+    ('scores', [
+        r'Score:?\s*\d+(?:\.\d+)?(?:\s*/\s*\d+)?',
+        r'Rating:?\s*\d+(?:\.\d+)?',
+        r'\d+(?:\.\d+)?\s*(?:out of|/)\s*\d+'
+    ]),
+    # Competition patterns
+    ('competition_data', [
+        r'\d+(?:,\d{3})*\s*(?:sellers|competitors|brands)',
+        r'Competition:?\s*\d+',
+        r'Market share:?\s*\d+(?:\.\d+)?%'
+    ]),
+    # Product count patterns
+    ('product_counts', [
+        r'\d+(?:,\d{3})*\s*(?:products|items|SKUs|listings)',
+        r'Products:?\s*\d+(?:,\d{3})*'
+    ]),
+    # General percentage patterns
+    ('percentages', [
+        r'\d+(?:\.\d+)?%(?!\s*(?:growth|increase|decrease))'
+    ])
+]
+
+# Compiled once; each pattern keeps its own scan because matches overlap
+# (e.g. 'ranked #2' and '#2 position'), which an alternation would drop
+METRIC_PATTERNS = [
+    (key, [re.compile(p, re.IGNORECASE) for p in patterns]) for key, patterns in METRIC_PATTERN_GROUPS
+]
+
+OTHER_FINANCIAL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'\$[\d,]+(?:\.\d{2})?(?!\s*(?:million|thousand|billion))',
+    r'Cost:?\s*\$[\d,]+',
+    r'Price:?\s*\$[\d,]+'
+]]
+
+# Unique matches kept per metrics key
+METRIC_LIMIT = 10
+
+def _first_unique(matches, limit):
+    # First `limit` distinct match strings, in order; stops the scan as soon as the cap is hit
+    found = {}
+    for match in matches:
+        found[match.group()] = None
+        if len(found) >= limit:
+            break
+    return list(found)
+
+def _collect_metric(patterns, text, per_pattern):
+    # Up to `per_pattern` matches from each pattern, deduped in order and capped at METRIC_LIMIT
+    found = {}
+    for pattern in patterns:
+        for match in islice(pattern.finditer(text), per_pattern):
+            found[match.group()] = None
+            if len(found) >= METRIC_LIMIT:
+                return list(found)
+    return list(found)
+
+# Rows kept per table (ASINs, search terms, brand and category shares) in extract_smartscout_data
+STRUCTURED_ROW_LIMIT = 50
+
+def _first_groups(pattern, text: str, limit: int) -> list:
+    # Like pattern.findall(text)[:limit], but the scan stops once `limit` matches are found
+    return [match.groups('') for match in islice(pattern.finditer(text), limit)]
+
+# Spaces and characters that are not allowed in file names all become underscores
+BRAND_SLUG_TABLE = str.maketrans({c: '_' for c in ' \\/:*?"<>|'})
+
+@functools.lru_cache(maxsize=4096)
+def _brand_slug(brand_name: str) -> str:
+    """
+    File name stem for a brand's report and summary, e.g. "Acme Co" -> "acme_co".
+    """
+    return brand_name.lower().translate(BRAND_SLUG_TABLE)
 
 # --- Configuration ---
 # The directory where your browser session data will be stored.
 # This allows you to stay logged in between runs.
 USER_DATA_DIR = "./playwright_user_data"
 SMARTSCOUT_URL = "https://app.smartscout.com/app/tailored-report"
+# Search box on the Brand Reports page, most specific first
+SEARCH_SELECTORS = (
+    'input[placeholder*="search" i]',
+    'input[placeholder*="brand" i]',
+    'input[type="search"]',
+    '.search-input',
+    '[data-testid*="search"]',
+)
+# Concurrent LLM requests when analysing a chunked report
+LLM_CHUNK_WORKERS = 5
 SMARTSCOUT_API_BASE = "https://api.smartscout.com"
+# Resource types the saved HTML never needs; aborting them lets the report settle sooner
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+def launch_report_context(p, headless=False):
+    """
+    Launch the logged-in persistent context used for collecting and downloading reports.
+    """
+    context = p.chromium.launch_persistent_context(USER_DATA_DIR, headless=headless)
+    context.route("**/*", _block_heavy_resources)
+    return context
 
 # API Authentication - check for API key
 SMARTSCOUT_API_KEY = os.getenv('SMARTSCOUT_API_KEY')
@@ -57,6 +241,83 @@ if not SMARTSCOUT_API_KEY:
         except:
             pass
 
+# CLI usage text, written in a single call
+HELP_TEXT = """Usage:
+  For first-time setup (to log in):
+    python smartscout_csv_downloader.py --setup
+
+  🔑 API Authentication Setup (Recommended):
+    python smartscout_csv_downloader.py --setup-api        # Setup SmartScout API key
+
+  To trigger data collection for brand(s):
+    python smartscout_csv_downloader.py --collect "Brand Name"
+    python smartscout_csv_downloader.py --collect "Brand1, Brand2, Brand3"
+    python smartscout_csv_downloader.py --collect brands.txt
+    python smartscout_csv_downloader.py --collect brands.csv --column "Brand Name"
+
+  To download brand report(s):
+    python smartscout_csv_downloader.py "Brand Name"
+    python smartscout_csv_downloader.py "Brand1, Brand2, Brand3"
+    python smartscout_csv_downloader.py brands.txt
+    python smartscout_csv_downloader.py brands.csv --column "Brand Name"
+
+  To generate AI summary from existing HTML:
+    python smartscout_csv_downloader.py --summary "Brand Name"
+    python smartscout_csv_downloader.py --summary "Brand1, Brand2, Brand3"
+    python smartscout_csv_downloader.py --summary brands.txt
+    python smartscout_csv_downloader.py --summary brands.csv --column "Brand Name"
+
+  📊 CSV Examples:
+    python smartscout_csv_downloader.py --collect data.csv                    # Auto-detects 'Brand Name' column
+    python smartscout_csv_downloader.py data.csv --column "Company Name"     # Custom column
+    python smartscout_csv_downloader.py --summary results.csv               # Auto-detects 'Brand Name' column
+
+  🤖 Background Processing:
+    python smartscout_csv_downloader.py --collect data.csv --headless        # No browser windows
+    python smartscout_csv_downloader.py data.csv --headless                  # Background download
+    python smartscout_csv_downloader.py --headless "Brand Name"             # Single brand headless
+
+  🧠 LLM Model Options:
+    python smartscout_csv_downloader.py --summary data.csv --model deepseek  # Use DeepSeek (cheapest)
+    python smartscout_csv_downloader.py --summary data.csv --model openai    # Use OpenAI GPT-4
+    python smartscout_csv_downloader.py --summary data.csv --model gemini    # Use Google Gemini
+    python smartscout_csv_downloader.py --summary data.csv --model anthropic # Use Claude (default)
+    python smartscout_csv_downloader.py --summary data.csv --model openai:gpt-4o  # Specific model
+
+  🔄 Force Regenerate:
+    python smartscout_csv_downloader.py --summary data.csv --force-regenerate      # Recreate existing summaries
+    python smartscout_csv_downloader.py --summary "Brand Name" --force-regenerate # Force single brand
+
+  📁 Custom Folder Paths:
+    python smartscout_csv_downloader.py data.csv --html-folder reports            # Custom HTML folder
+    python smartscout_csv_downloader.py --summary data.csv --summary-folder analysis # Custom summary folder
+    python smartscout_csv_downloader.py data.csv --html-folder /path/to/html --summary-folder /path/to/summaries
+
+  💰 Cost Comparison (approximate):
+    • DeepSeek: ~$0.14 per 1M tokens (cheapest)
+    • OpenAI GPT-4: ~$10-30 per 1M tokens
+    • Gemini Pro: ~$0.50 per 1M tokens
+    • Claude Sonnet: ~$3-15 per 1M tokens
+"""
+
+# Shared HTTP session so concurrent API calls reuse keep-alive connections
+_http_session = None
+
+def get_http_session():
+    """
+    Return the module-wide requests.Session, creating it on first use.
+    """
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _http_session = requests.Session()
+        # Keep enough pooled connections for the batch worker threads
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        _http_session.mount("https://", adapter)
+        _http_session.mount("http://", adapter)
+    return _http_session
+
 def get_brand_data_via_api(brand_name: str, marketplace: str = "US"):
     """
     Fetch brand data using SmartScout API instead of web scraping.
@@ -66,7 +327,7 @@ def get_brand_data_via_api(brand_name: str, marketplace: str = "US"):
         return None
         
     try:
-        import requests
+        session = get_http_session()
         
         headers = {
             'X-Api-Key': SMARTSCOUT_API_KEY,
@@ -82,19 +343,16 @@ def get_brand_data_via_api(brand_name: str, marketplace: str = "US"):
         }
         
         print(f"🔍 Searching for '{brand_name}' via SmartScout API...")
-        response = requests.get(search_url, headers=headers, params=params)
+        response = session.get(search_url, headers=headers, params=params)
         
         if response.status_code == 200:
             search_data = response.json()
             brands = search_data.get('data', [])
             
             if brands:
-                # Find exact match or closest match
-                brand_match = None
-                for brand in brands:
-                    if brand.get('name', '').lower() == brand_name.lower():
-                        brand_match = brand
-                        break
+                # Find exact match (case-insensitive) or closest match
+                wanted = brand_name.lower()
+                brand_match = next((brand for brand in brands if brand.get('name', '').lower() == wanted), None)
                 
                 if not brand_match:
                     brand_match = brands[0]  # Take first result
@@ -106,7 +364,7 @@ def get_brand_data_via_api(brand_name: str, marketplace: str = "US"):
                     detail_params = {'marketplace': marketplace}
                     
                     print(f"📊 Fetching detailed data for brand ID: {brand_id}")
-                    detail_response = requests.get(detail_url, headers=headers, params=detail_params)
+                    detail_response = session.get(detail_url, headers=headers, params=detail_params)
                     
                     if detail_response.status_code == 200:
                         return detail_response.json()
@@ -163,6 +421,31 @@ def setup_api_key():
         print("⏭️  Skipping API setup - will use browser automation")
         return False
 
+# Report PDFs are plain text pages: 150 DPI grayscale is plenty for Tesseract and far fewer pixels than the default
+OCR_DPI = 150
+# LSTM engine only, and treat each page as one uniform block instead of running page-segmentation analysis
+TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+def rasterize_pdf(pdf_path: str) -> list:
+    """
+    Render PDF pages to grayscale images for OCR, letting poppler rasterize several pages at once.
+    """
+    from pdf2image import convert_from_path
+    
+    return convert_from_path(pdf_path, dpi=OCR_DPI, grayscale=True, thread_count=min(4, os.cpu_count() or 1))
+
+def ocr_pages(images) -> list:
+    """
+    OCR page images concurrently, returning their text in page order.
+    """
+    import pytesseract
+    
+    if not images:
+        return []
+    # Each image_to_string call waits on its own tesseract process, so threads are enough to use every core
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(images))) as executor:
+        return list(executor.map(lambda image: pytesseract.image_to_string(image, config=TESSERACT_CONFIG), images))
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Extract text content from PDF file using OCR for image-based PDFs.
@@ -170,14 +453,16 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     try:
         import pdfplumber
         
-        text_content = ""
+        # Page texts are collected and joined once; += on the whole document is quadratic
+        text_parts = []
         
         # First try regular text extraction
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text_content += page_text + "\n"
+                    text_parts.append(page_text)
+        text_content = "\n".join(text_parts)
         
         # If no text found, try OCR approach
         if not text_content.strip():
@@ -187,14 +472,11 @@ def extract_text_from_pdf(pdf_path: str) -> str:
                 from pdf2image import convert_from_path
                 
                 # Convert PDF pages to images
-                images = convert_from_path(pdf_path)
+                images = rasterize_pdf(pdf_path)
                 
-                for i, image in enumerate(images):
-                    print(f"🔍 Processing page {i+1} with OCR...")
-                    # Extract text from image using OCR
-                    page_text = pytesseract.image_to_string(image)
-                    if page_text:
-                        text_content += page_text + "\n"
+                print(f"🔍 Processing {len(images)} pages with OCR...")
+                # Extract text from the page images using OCR
+                text_content = "\n".join(page_text for page_text in ocr_pages(images) if page_text)
                 
                 print(f"✓ OCR completed on {len(images)} pages")
                 
@@ -246,7 +528,6 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
     
     # Fallback to legacy extraction
     print("⚠ Using legacy DOM extraction - consider updating to enhanced version")
-    import re
     
     data = {
         'weekly_revenue': None,
@@ -269,7 +550,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
         # Try to find weekly/monthly revenue
         for revenue in page_data['revenue_elements']:
             # Clean and extract dollar amounts
-            dollar_match = re.search(r'\$[\d,]+(?:\.\d{2})?', revenue)
+            dollar_match = DOLLAR_RE.search(revenue)
             if dollar_match and not data['weekly_revenue']:
                 data['weekly_revenue'] = dollar_match.group()
     
@@ -299,8 +580,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
         text = page_data['report_text']
         
         # Extract search terms from the text
-        search_term_pattern = r'"([^"]+)"\s*\(?#?(\d+)(?:,\s*([\d,]+)\s*searches?)?\)?'
-        search_matches = re.findall(search_term_pattern, text, re.IGNORECASE)
+        search_matches = DOM_SEARCH_TERM_RE.findall(text)
         for match in search_matches:
             data['search_terms'].append({
                 'term': match[0],
@@ -309,8 +589,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
             })
         
         # Extract brand data from tables in the text
-        brand_pattern = r'([A-Z][A-Z\s&]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)'
-        brand_matches = re.findall(brand_pattern, text, re.MULTILINE)
+        brand_matches = BRAND_SHARE_RE.findall(text)
         for match in brand_matches:
             data['brand_data'].append({
                 'brand': match[0].strip(),
@@ -319,8 +598,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
             })
         
         # Extract keyword metrics
-        keyword_metrics_pattern = r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s*:?\s*([\d,]+|[\d.]+%)'
-        keyword_matches = re.findall(keyword_metrics_pattern, text, re.IGNORECASE)
+        keyword_matches = DOM_KEYWORD_METRICS_RE.findall(text)
         for match in keyword_matches:
             data['keyword_metrics'][match[0]] = match[1]
     
@@ -330,8 +608,6 @@ def extract_smartscout_data(text_content: str) -> dict:
     """
     Extract specific SmartScout data structures from text content.
     """
-    import re
-    
     data = {
         'weekly_revenue': None,
         'revenue_change': None,
@@ -345,16 +621,14 @@ def extract_smartscout_data(text_content: str) -> dict:
     }
     
     # Weekly Revenue pattern
-    weekly_rev_pattern = r'Weekly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?)\s*(?:.*?([+-]?\$?[\d,]+(?:\.\d{2})?)\s*or\s*([+-]?[\d.]+%)|.*?([+-][\d.]+%))?'
-    match = re.search(weekly_rev_pattern, text_content, re.IGNORECASE | re.DOTALL)
+    match = WEEKLY_REVENUE_RE.search(text_content)
     if match:
         data['weekly_revenue'] = f"${match.group(1)}"
         if match.group(2):
             data['revenue_change'] = f"{match.group(2)} or {match.group(3)}" if match.group(3) else match.group(4)
     
     # ASIN data extraction
-    asin_pattern = r'ASIN:?\s*([A-Z0-9]{10})\s*.*?Title:?\s*([^\n]+).*?(?:Sales Rank:?\s*#?([\d,]+))?.*?(?:Monthly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?))?.*?(?:([+-]?[\d.]+%))?'
-    asin_matches = re.findall(asin_pattern, text_content, re.IGNORECASE | re.DOTALL)
+    asin_matches = _first_groups(ASIN_RE, text_content, STRUCTURED_ROW_LIMIT)
     for match in asin_matches:
         asin_data = {
             'asin': match[0],
@@ -366,8 +640,7 @@ def extract_smartscout_data(text_content: str) -> dict:
         data['asin_data'].append(asin_data)
     
     # Search terms extraction
-    search_term_pattern = r'"([^"]+)"\s*\(#?(\d+),?\s*([\d,]+)\s*searches?\)'
-    search_matches = re.findall(search_term_pattern, text_content, re.IGNORECASE)
+    search_matches = _first_groups(SEARCH_TERM_RE, text_content, STRUCTURED_ROW_LIMIT)
     for match in search_matches:
         data['search_terms'].append({
             'term': match[0],
@@ -376,8 +649,7 @@ def extract_smartscout_data(text_content: str) -> dict:
         })
     
     # Brand market share data
-    brand_pattern = r'([A-Z][A-Z\s&]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)'
-    brand_matches = re.findall(brand_pattern, text_content, re.MULTILINE)
+    brand_matches = _first_groups(BRAND_SHARE_RE, text_content, STRUCTURED_ROW_LIMIT)
     for match in brand_matches:
         data['brand_data'].append({
             'brand': match[0].strip(),
@@ -386,10 +658,10 @@ def extract_smartscout_data(text_content: str) -> dict:
         })
     
     # Category market share
-    category_pattern = r'([A-Z][a-z\s]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)'
-    category_matches = re.findall(category_pattern, text_content, re.MULTILINE)
+    category_matches = _first_groups(CATEGORY_SHARE_RE, text_content, STRUCTURED_ROW_LIMIT)
+    brand_names = {b['brand'] for b in data['brand_data']}
     for match in category_matches:
-        if match[0].strip() not in [b['brand'] for b in data['brand_data']]:
+        if match[0].strip() not in brand_names:
             data['market_categories'].append({
                 'category': match[0].strip(),
                 'share': match[1],
@@ -397,20 +669,15 @@ def extract_smartscout_data(text_content: str) -> dict:
             })
     
     # Keyword metrics
-    keyword_metrics_pattern = r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s+([\d,]+|[\d.]+%)'
-    keyword_matches = re.findall(keyword_metrics_pattern, text_content, re.IGNORECASE)
+    keyword_matches = KEYWORD_METRICS_RE.findall(text_content)
     for match in keyword_matches:
         data['keyword_metrics'][match[0]] = match[1]
     
     # Revenue numbers (general)
-    revenue_pattern = r'\$[\d,]+(?:\.\d{2})?'
-    revenue_matches = re.findall(revenue_pattern, text_content)
-    data['all_revenue_figures'] = list(set(revenue_matches))[:10]  # Top 10 unique
+    data['all_revenue_figures'] = _first_unique(DOLLAR_RE.finditer(text_content), 10)  # First 10 unique
     
     # Percentage changes (general)
-    percent_pattern = r'[+-]?[\d.]+%'
-    percent_matches = re.findall(percent_pattern, text_content)
-    data['all_percentages'] = list(set(percent_matches))[:15]  # Top 15 unique
+    data['all_percentages'] = _first_unique(PERCENT_RE.finditer(text_content), 15)  # First 15 unique
     
     return data
 
@@ -433,8 +700,8 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
             'other_financial': []
         }
         
-        text_content = ""
-        tables_data = []
+        text_parts = []
+        table_parts = []
         
         # First try regular text extraction
         with pdfplumber.open(pdf_path) as pdf:
@@ -442,12 +709,13 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
                 # Extract text
                 page_text = page.extract_text()
                 if page_text:
-                    text_content += page_text + "\n"
+                    text_parts.append(page_text)
                 
-                # Extract tables (PDFs often have structured data in tables)
-                tables = page.extract_tables()
-                for table in tables:
-                    tables_data.extend([cell for row in table for cell in row if cell])
+                # Extract tables (PDFs often have structured data in tables), one string of cells per page
+                table_text = " ".join(str(cell) for table in page.extract_tables() for row in table for cell in row if cell)
+                if table_text:
+                    table_parts.append(table_text)
+        text_content = "\n".join(text_parts)
         
         # If no text found, try OCR approach
         if not text_content.strip():
@@ -456,13 +724,10 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
                 from pdf2image import convert_from_path
                 
                 # Convert PDF pages to images
-                images = convert_from_path(pdf_path)
+                images = rasterize_pdf(pdf_path)
                 
-                for image in images:
-                    # Extract text from image using OCR
-                    page_text = pytesseract.image_to_string(image)
-                    if page_text:
-                        text_content += page_text + "\n"
+                # Extract text from the page images using OCR
+                text_content = "\n".join(page_text for page_text in ocr_pages(images) if page_text)
                         
             except ImportError:
                 pass  # OCR libraries not available
@@ -470,7 +735,7 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
                 pass  # OCR failed
         
         # Combine text and table data for pattern matching
-        all_content = text_content + " " + " ".join(str(item) for item in tables_data if item)
+        all_content = text_content + " " + " ".join(table_parts)
         
         # Use the new structured extraction
         if all_content.strip():
@@ -499,106 +764,14 @@ def extract_metrics_from_html(html_content: str) -> dict:
     """
     Extract specific metrics from SmartScout report HTML.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-    
-    metrics = {
-        'revenue_data': [],
-        'growth_data': [],
-        'rankings': [],
-        'scores': [],
-        'competition_data': [],
-        'product_counts': [],
-        'percentages': [],
-        'other_financial': []
-    }
-    
-    # Get all text content
-    text = soup.get_text()
-    
-    import re
-    
-    # Revenue patterns
-    revenue_patterns = [
-        r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|M|thousand|K|billion|B))?',
-        r'Revenue:?\s*\$[\d,]+',
-        r'Monthly.*?\$[\d,]+',
-        r'Sales:?\s*\$[\d,]+'
-    ]
-    
-    # Growth patterns  
-    growth_patterns = [
-        r'[+\-]?\d+(?:\.\d+)?%\s*(?:growth|increase|decrease|change)',
-        r'(?:up|down|grew|declined)\s*\d+(?:\.\d+)?%',
-        r'Growth:?\s*[+\-]?\d+(?:\.\d+)?%'
-    ]
-    
-    # Ranking patterns
-    ranking_patterns = [
-        r'#\d+(?:\s*(?:rank|position|place))?',
-        r'Rank(?:ed)?:?\s*#?\d+',
-        r'Position:?\s*#?\d+',
-        r'Top\s*\d+'
-    ]
-    
-    # Score patterns
-    score_patterns = [
-        r'Score:?\s*\d+(?:\.\d+)?(?:\s*/\s*\d+)?',
-        r'Rating:?\s*\d+(?:\.\d+)?',
-        r'\d+(?:\.\d+)?\s*(?:out of|/)\s*\d+'
-    ]
-    
-    # Competition patterns
-    competition_patterns = [
-        r'\d+(?:,\d{3})*\s*(?:sellers|competitors|brands)',
-        r'Competition:?\s*\d+',
-        r'Market share:?\s*\d+(?:\.\d+)?%'
-    ]
-    
-    # Product count patterns
-    product_patterns = [
-        r'\d+(?:,\d{3})*\s*(?:products|items|SKUs|listings)',
-        r'Products:?\s*\d+(?:,\d{3})*'
-    ]
+    # Get all text content (scripts and styles stripped)
+    text = report_text(html_content)
     
-    # General percentage patterns
-    percentage_patterns = [
-        r'\d+(?:\.\d+)?%(?!\s*(?:growth|increase|decrease))'
-    ]
-    
-    # Extract metrics using patterns
-    pattern_groups = [
-        (revenue_patterns, 'revenue_data'),
-        (growth_patterns, 'growth_data'), 
-        (ranking_patterns, 'rankings'),
-        (score_patterns, 'scores'),
-        (competition_patterns, 'competition_data'),
-        (product_patterns, 'product_counts'),
-        (percentage_patterns, 'percentages')
-    ]
-    
-    for patterns, key in pattern_groups:
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            metrics[key].extend(matches[:10])  # Limit matches per pattern
+    # Extract metrics using patterns; each scan stops once its caps are reached
+    metrics = {key: _collect_metric(patterns, text, METRIC_LIMIT) for key, patterns in METRIC_PATTERNS}
     
     # Look for other financial data
-    other_financial_patterns = [
-        r'\$[\d,]+(?:\.\d{2})?(?!\s*(?:million|thousand|billion))',
-        r'Cost:?\s*\$[\d,]+',
-        r'Price:?\s*\$[\d,]+'
-    ]
-    
-    for pattern in other_financial_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        metrics['other_financial'].extend(matches[:5])
-    
-    # Remove duplicates and clean up
-    for key in metrics:
-        metrics[key] = list(set(metrics[key]))[:10]  # Remove dupes, limit to 10
+    metrics['other_financial'] = _collect_metric(OTHER_FINANCIAL_PATTERNS, text, 5)
     
     return metrics
 
@@ -614,7 +787,7 @@ def filter_html_for_llm_processing(html_content: str) -> str:
     - Top products and competitor products
     - Search terms and keyword rankings
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_report_body(html_content)
     
     # Remove all non-essential elements that add tokens but no value
     for element in soup(["script", "style", "link", "meta", "noscript", "iframe", "svg"]):
@@ -711,7 +884,7 @@ def extract_text_from_html(html_content: str) -> str:
     # Apply HTML filtering first to reduce content
     filtered_html = filter_html_for_llm_processing(html_content)
     
-    soup = BeautifulSoup(filtered_html, 'html.parser')
+    soup = BeautifulSoup(filtered_html, HTML_PARSER)
     
     # Remove any remaining script and style elements
     for script in soup(["script", "style"]):
@@ -720,12 +893,43 @@ def extract_text_from_html(html_content: str) -> str:
     # Get text content
     text = soup.get_text()
     
-    # Clean up text - remove extra whitespace and normalize
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = ' '.join(chunk for chunk in chunks if chunk)
-    
-    return text
+    # Clean up text - collapse every whitespace run (newlines included) to one space
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+# Closing tags that make a good place to end a chunk
+CHUNK_BREAK_MARKERS = ('</table>', '</div>', '</section>')
+
+def split_html_chunks(html_content: str, chunk_size: int) -> list:
+    """
+    Split HTML into chunks of about chunk_size characters, preferring to break after a closing table/div/section.
+    """
+    chunks = []
+    # Lines are buffered and joined once per chunk; repeated += on a growing string is quadratic
+    buf = []
+    buf_len = 0
+    buf_has_text = False
+    # Past this size any line is an acceptable break point
+    break_len = chunk_size * 0.8
+    
+    for line in html_content.split('\n'):
+        # If adding this line would exceed chunk size and we have content
+        if buf_len + len(line) > chunk_size and buf_has_text:
+            # Break if the chunk is already big enough, otherwise only at a good breaking point
+            if buf_len > break_len or any(marker in line.lower() for marker in CHUNK_BREAK_MARKERS):
+                chunks.append(''.join(buf).strip())
+                buf = []
+                buf_len = 0
+                buf_has_text = False
+        
+        buf.append(line + '\n')
+        buf_len += len(line) + 1
+        buf_has_text = buf_has_text or bool(line.strip())
+    
+    # Add remaining content
+    if buf_has_text:
+        chunks.append(''.join(buf).strip())
+    
+    return chunks
 
 def process_with_smart_chunking(client, html_content: str, brand_name: str) -> str:
     """
@@ -742,7 +946,6 @@ def process_with_smart_chunking(client, html_content: str, brand_name: str) -> s
         
         # Extract key sections that should stay together
         chunk_size = 120000  # Conservative size to stay under token limits
-        chunks = []
         
         # Try to split on logical HTML boundaries
         section_markers = [
@@ -753,26 +956,7 @@ def process_with_smart_chunking(client, html_content: str, brand_name: str) -> s
             'class="competitor', 'class="search-term'
         ]
         
-        current_chunk = ""
-        lines = working_content.split('\n')
-        
-        for line in lines:
-            # If adding this line would exceed chunk size and we have content
-            if len(current_chunk + line) > chunk_size and current_chunk.strip():
-                # Check if we're at a good breaking point
-                is_good_break = any(marker in line.lower() for marker in ['</table>', '</div>', '</section>'])
-                
-                if is_good_break or len(current_chunk) > chunk_size * 0.8:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = line + '\n'
-                else:
-                    current_chunk += line + '\n'
-            else:
-                current_chunk += line + '\n'
-        
-        # Add remaining content
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        chunks = split_html_chunks(working_content, chunk_size)
         
         print(f"📄 Split into {len(chunks)} intelligent chunks")
         
@@ -886,6 +1070,60 @@ Combine ALL data from chunks below - don't lose any details:
     except Exception as e:
         return f"❌ Error in smart chunking: {str(e)}"
 
+# Per-provider input token budget for the whole HTML payload (chunked or not),
+# leaving headroom for the prompt template and max_tokens of output
+LLM_INPUT_TOKEN_BUDGETS = {
+    "anthropic": 180000,
+    "openai": 120000,
+    "deepseek": 60000,
+    "gemini": 900000
+}
+
+# Content above this many characters is summarized with chunking instead of one request
+LLM_SINGLE_REQUEST_LIMITS = {
+    "anthropic": 150000,
+    "openai": 120000,      # GPT-4 has smaller context
+    "deepseek": 180000,    # DeepSeek has larger context
+    "gemini": 200000       # Gemini Pro has large context
+}
+
+def count_tokens(text: str, model_name: str = None) -> int:
+    """
+    Count tokens with tiktoken when available, otherwise estimate ~4 chars per token.
+    """
+    try:
+        import tiktoken
+        try:
+            encoding = tiktoken.encoding_for_model(model_name) if model_name else tiktoken.get_encoding("cl100k_base")
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return len(encoding.encode(text, disallowed_special=()))
+    except ImportError:
+        return len(text) // 4
+
+def fit_to_budget(metrics: dict, model_provider: str, model_name: str = None) -> dict:
+    """
+    Truncate the HTML payload so it fits the provider's input token budget.
+    Metadata fields (file size, content length) are kept as-is.
+    """
+    html_content = metrics.get('html_content')
+    budget = LLM_INPUT_TOKEN_BUDGETS.get(model_provider, 150000)
+    
+    # Token count never exceeds character count, so short payloads skip tokenizing
+    if not html_content or len(html_content) <= budget:
+        return metrics
+    
+    token_count = count_tokens(html_content, model_name)
+    if token_count <= budget:
+        return metrics
+    
+    keep_chars = int(len(html_content) * budget / token_count)
+    print(f"✂️  Truncating HTML from ~{token_count:,} to ~{budget:,} tokens for {model_provider}")
+    
+    fitted = dict(metrics)
+    fitted['html_content'] = html_content[:keep_chars]
+    return fitted
+
 def get_llm_client(model_provider: str):
     """
     Get the appropriate LLM client based on provider.
@@ -934,20 +1172,37 @@ def get_llm_client(model_provider: str):
     else:
         return None, f"❌ Unsupported model provider: {model_provider}. Supported: anthropic, openai, deepseek, gemini"
 
+# Output tokens each provider is asked for per response; a batched summary request must fit all its analyses in this
+LLM_OUTPUT_TOKEN_LIMITS = {
+    "anthropic": 8000,
+    "openai": 4096,
+    "deepseek": 4096,
+    "gemini": 8192
+}
+
 def call_llm_api(client, model_provider: str, prompt: str, model_name: str = None):
     """
     Make API call to the specified LLM provider.
     """
+    return call_llm_api_checked(client, model_provider, prompt, model_name)[0]
+
+def call_llm_api_checked(client, model_provider: str, prompt: str, model_name: str = None, cap_output: bool = False):
+    """
+    Like call_llm_api, but returns (text, truncated) where truncated is True when the
+    response stopped at the output token limit. cap_output also applies
+    LLM_OUTPUT_TOKEN_LIMITS to Gemini, which otherwise runs with the model default.
+    """
+    max_tokens = LLM_OUTPUT_TOKEN_LIMITS.get(model_provider, 4096)
     try:
         if model_provider == "anthropic":
             model = model_name or "claude-3-5-sonnet-20241022"
             response = client.messages.create(
                 model=model,
-                max_tokens=8000,
+                max_tokens=max_tokens,
                 temperature=0.3,
                 messages=[{"role": "user", "content": prompt}]
             )
-            return response.content[0].text
+            return response.content[0].text, response.stop_reason == "max_tokens"
         
         elif model_provider in ["openai", "deepseek"]:
             if model_provider == "openai":
@@ -958,60 +1213,31 @@ def call_llm_api(client, model_provider: str, prompt: str, model_name: str = Non
             response = client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=4096,
+                max_tokens=max_tokens,
                 temperature=0.3
             )
-            return response.choices[0].message.content
+            choice = response.choices[0]
+            return choice.message.content, choice.finish_reason == "length"
         
         elif model_provider == "gemini":
             model_name = model_name or "gemini-2.5-flash-lite"
             model = client.GenerativeModel(model_name)
-            response = model.generate_content(prompt)
-            return response.text
+            if cap_output:
+                response = model.generate_content(prompt, generation_config={"max_output_tokens": max_tokens})
+            else:
+                response = model.generate_content(prompt)
+            finish_reason = response.candidates[0].finish_reason if response.candidates else None
+            return response.text, getattr(finish_reason, "name", finish_reason) == "MAX_TOKENS"
         
     except Exception as e:
-        return f"❌ Error calling {model_provider} API: {str(e)}"
+        return f"❌ Error calling {model_provider} API: {str(e)}", False
+    return None, False
 
-def summarize_with_llm(text_content: str, brand_name: str, metrics: dict, model_provider: str = "gemini", model_name: str = None) -> str:
+def build_analysis_prompt(brand_name: str, file_size_kb, content_length: int) -> str:
     """
-    Summarize the report content using specified LLM provider.
+    Analysis instructions for one brand report; the report content is appended after it.
     """
-    try:
-        # Get LLM client
-        client, error = get_llm_client(model_provider)
-        if error:
-            return error
-        
-        # Get HTML content if available, otherwise use text_content
-        if metrics.get('html_content'):
-            content_to_analyze = metrics['html_content']
-            content_type = "HTML"
-        else:
-            content_to_analyze = text_content
-            content_type = "text"
-        
-        print(f"📊 Processing {len(content_to_analyze)} characters of {content_type} content with {model_provider}")
-        
-        # Check if content is too large for single request (adjust limits per provider)
-        token_limits = {
-            "anthropic": 150000,
-            "openai": 120000,      # GPT-4 has smaller context
-            "deepseek": 180000,    # DeepSeek has larger context
-            "gemini": 200000       # Gemini Pro has large context
-        }
-        
-        limit = token_limits.get(model_provider, 150000)
-        
-        if len(content_to_analyze) > limit:
-            print(f"📄 Content too large for {model_provider}, using intelligent chunking...")
-            return process_with_smart_chunking_multi_llm(client, content_to_analyze, brand_name, model_provider, model_name, metrics)
-        
-        # Get file size info for the prompt
-        file_size_kb = metrics.get('file_size_kb', 'unknown')
-        content_length = metrics.get('content_length', len(content_to_analyze))
-        
-        # Single request for smaller content
-        prompt = f"""Please analyze this complete SmartScout brand report for "{brand_name}" and create a COMPREHENSIVE PRODUCT COMPARISON ANALYSIS:
+    return f"""Please analyze this complete SmartScout brand report for "{brand_name}" and create a COMPREHENSIVE PRODUCT COMPARISON ANALYSIS:
 
 ## COMPREHENSIVE PRODUCT COMPARISON ANALYSIS: {brand_name}
 **Report Metadata:** File size: {file_size_kb} KB | Content: {content_length:,} characters
@@ -1056,7 +1282,41 @@ def summarize_with_llm(text_content: str, brand_name: str, metrics: dict, model_
 STOP after completing the requested sections. Do not generate additional content.
 
 Complete HTML content:
-{content_to_analyze}"""
+"""
+
+def summarize_with_llm(text_content: str, brand_name: str, metrics: dict, model_provider: str = "gemini", model_name: str = None) -> str:
+    """
+    Summarize the report content using specified LLM provider.
+    """
+    try:
+        # Get LLM client
+        client, error = get_llm_client(model_provider)
+        if error:
+            return error
+        
+        # Get HTML content if available, otherwise use text_content
+        if metrics.get('html_content'):
+            content_to_analyze = metrics['html_content']
+            content_type = "HTML"
+        else:
+            content_to_analyze = text_content
+            content_type = "text"
+        
+        print(f"📊 Processing {len(content_to_analyze)} characters of {content_type} content with {model_provider}")
+        
+        # Check if content is too large for single request (adjust limits per provider)
+        limit = LLM_SINGLE_REQUEST_LIMITS.get(model_provider, 150000)
+        
+        if len(content_to_analyze) > limit:
+            print(f"📄 Content too large for {model_provider}, using intelligent chunking...")
+            return process_with_smart_chunking_multi_llm(client, content_to_analyze, brand_name, model_provider, model_name, metrics)
+        
+        # Get file size info for the prompt
+        file_size_kb = metrics.get('file_size_kb', 'unknown')
+        content_length = metrics.get('content_length', len(content_to_analyze))
+        
+        # Single request for smaller content
+        prompt = build_analysis_prompt(brand_name, file_size_kb, content_length) + content_to_analyze
         
         # Make API call
         result = call_llm_api(client, model_provider, prompt, model_name)
@@ -1069,6 +1329,43 @@ Complete HTML content:
     except Exception as e:
         return f"❌ Error generating summary: {str(e)}"
 
+def _analyze_chunk_multi_llm(client, model_provider: str, brand_name: str, chunk: str, i: int, total: int, model_name: str = None) -> str:
+    """
+    Extract the product/keyword data from one chunk with any provider; errors are returned as text so the synthesis still runs.
+    """
+    print(f"🔍 Processing chunk {i+1}/{total} ({len(chunk)} chars)...")
+    
+    chunk_prompt = f"""Analyze this SmartScout data chunk for "{brand_name}" and extract ALL product/keyword data:
+
+**EXTRACT FROM THIS CHUNK:**
+1. **Product names/titles** with their keywords and search volumes
+2. **Competitor products** with their keywords and search volumes  
+3. **Market share of top subcategories** (percentages and category names)
+4. **Top competitor brands** (names, market shares, changes)
+5. **Top product and competitor searches** (search terms with volumes)
+6. **Top keyword distribution** (keyword rankings 1-3, 4-10, 11-50, etc.)
+7. **TOP PRODUCT VS. TOP COMPETING PRODUCT comparisons:**
+   - Product names (brand product vs competitor product)
+   - Sales ranks for each
+   - Monthly revenue for each  
+   - Search terms and their ranks for each product
+   - Any head-to-head comparison data
+8. **All keywords** with search volume numbers
+9. **All numerical data** (rankings, search volumes, revenue, percentages, etc.)
+10. **Table data** if present (preserve complete table structures)
+
+Format findings clearly. Extract ALL data - don't summarize or skip details.
+
+Chunk {i+1}/{total}:
+{chunk}"""
+    
+    result = call_llm_api(client, model_provider, chunk_prompt, model_name)
+    if result and not result.startswith("❌"):
+        print(f"✅ Processed chunk {i+1}/{total}")
+        return result
+    print(f"⚠ Error processing chunk {i+1}: {result}")
+    return f"Error processing chunk {i+1}: {result}"
+
 def process_with_smart_chunking_multi_llm(client, html_content: str, brand_name: str, model_provider: str, model_name: str = None, metrics: dict = None) -> str:
     """
     Process large HTML content with intelligent chunking for multiple LLM providers.
@@ -1091,65 +1388,17 @@ def process_with_smart_chunking_multi_llm(client, html_content: str, brand_name:
         }
         
         chunk_size = chunk_sizes.get(model_provider, 120000)
-        chunks = []
         
         # Split content into chunks
-        current_chunk = ""
-        lines = working_content.split('\n')
-        
-        for line in lines:
-            if len(current_chunk + line) > chunk_size and current_chunk.strip():
-                is_good_break = any(marker in line.lower() for marker in ['</table>', '</div>', '</section>'])
-                
-                if is_good_break or len(current_chunk) > chunk_size * 0.8:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = line + '\n'
-                else:
-                    current_chunk += line + '\n'
-            else:
-                current_chunk += line + '\n'
-        
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        chunks = split_html_chunks(working_content, chunk_size)
         
         print(f"📄 Split into {len(chunks)} intelligent chunks for {model_provider}")
         
-        # Process each chunk
-        chunk_results = []
-        for i, chunk in enumerate(chunks):
-            print(f"🔍 Processing chunk {i+1}/{len(chunks)} ({len(chunk)} chars)...")
-            
-            chunk_prompt = f"""Analyze this SmartScout data chunk for "{brand_name}" and extract ALL product/keyword data:
-
-**EXTRACT FROM THIS CHUNK:**
-1. **Product names/titles** with their keywords and search volumes
-2. **Competitor products** with their keywords and search volumes  
-3. **Market share of top subcategories** (percentages and category names)
-4. **Top competitor brands** (names, market shares, changes)
-5. **Top product and competitor searches** (search terms with volumes)
-6. **Top keyword distribution** (keyword rankings 1-3, 4-10, 11-50, etc.)
-7. **TOP PRODUCT VS. TOP COMPETING PRODUCT comparisons:**
-   - Product names (brand product vs competitor product)
-   - Sales ranks for each
-   - Monthly revenue for each  
-   - Search terms and their ranks for each product
-   - Any head-to-head comparison data
-8. **All keywords** with search volume numbers
-9. **All numerical data** (rankings, search volumes, revenue, percentages, etc.)
-10. **Table data** if present (preserve complete table structures)
-
-Format findings clearly. Extract ALL data - don't summarize or skip details.
-
-Chunk {i+1}/{len(chunks)}:
-{chunk}"""
-            
-            result = call_llm_api(client, model_provider, chunk_prompt, model_name)
-            if not result.startswith("❌"):
-                chunk_results.append(result)
-                print(f"✅ Processed chunk {i+1}/{len(chunks)}")
-            else:
-                print(f"⚠ Error processing chunk {i+1}: {result}")
-                chunk_results.append(f"Error processing chunk {i+1}: {result}")
+        # Process chunks concurrently; results stay in chunk order for the synthesis
+        with ThreadPoolExecutor(max_workers=max(1, min(LLM_CHUNK_WORKERS, len(chunks)))) as executor:
+            futures = [executor.submit(_analyze_chunk_multi_llm, client, model_provider, brand_name, chunk, i, len(chunks), model_name)
+                       for i, chunk in enumerate(chunks)]
+            chunk_results = [future.result() for future in futures]
         
         # Final synthesis
         print("🔄 Synthesizing all chunk results...")
@@ -1227,36 +1476,39 @@ def process_csv_with_column(csv_file: str, column_name: str, action_type: str, f
         return
     
     try:
-        # Read CSV file
-        df = pd.read_csv(csv_file)
+        # Read only the header first; the other columns are never needed in memory
+        columns = list(pd.read_csv(csv_file, nrows=0).columns)
         print(f"📄 Loaded CSV file: {csv_file}")
-        print(f"📊 Available columns: {list(df.columns)}")
+        print(f"📊 Available columns: {columns}")
         
         # Auto-detect Brand Name column if not specified
         if not column_name:
             # Try common brand column names
             brand_columns = ["Brand Name", "brand name", "Brand", "brand", "Brand_Name", "BRAND NAME"]
             for col in brand_columns:
-                if col in df.columns:
+                if col in columns:
                     column_name = col
                     print(f"✅ Auto-detected brand column: '{column_name}'")
                     break
             
             if not column_name:
                 print(f"❌ No 'Brand Name' column found automatically")
-                print(f"💡 Available columns: {list(df.columns)}")
+                print(f"💡 Available columns: {columns}")
                 print(f"💡 Use --column parameter to specify column name")
                 return
         
         # Check if specified column exists
-        if column_name not in df.columns:
+        if column_name not in columns:
             print(f"❌ Column '{column_name}' not found in CSV file")
-            print(f"💡 Available columns: {list(df.columns)}")
+            print(f"💡 Available columns: {columns}")
             return
         
+        # Load just the brand column as strings, skipping type inference
+        df = pd.read_csv(csv_file, usecols=[column_name], dtype=str, engine='c')
+        
         # Extract brand names from the specified column
-        brands = df[column_name].dropna().astype(str).str.strip().tolist()
-        brands = [brand for brand in brands if brand and brand.lower() != 'nan']
+        brand_series = df[column_name].dropna().astype(str).str.strip()
+        brands = brand_series[(brand_series != '') & (brand_series.str.lower() != 'nan')].tolist()
         
         print(f"✅ Found {len(brands)} brands in column '{column_name}'")
         
@@ -1296,10 +1548,6 @@ def process_brands_with_csv_output(df, brands: list, brand_column: str, csv_file
     
     print(f"🚀 Starting batch {action_type} for {len(brands)} brands with CSV output")
     
-    # Add Brand Data column if it doesn't exist
-    if "Brand Data" not in df.columns:
-        df["Brand Data"] = ""
-    
     # Track processed brands to avoid duplicates
     processed_brands = {}
     brand_results = {"collected": [], "no_button": [], "not_found_in_search": [], "error": []} if action_type == "collect" else None
@@ -1312,92 +1560,96 @@ def process_brands_with_csv_output(df, brands: list, brand_column: str, csv_file
         "errors": []
     } if action_type == "summary" else None
     
-    # Get unique brands while preserving order
-    unique_brands = []
-    seen_brands = set()
-    for brand in brands:
-        brand_clean = brand.strip()
-        if brand_clean and brand_clean.lower() not in seen_brands:
-            unique_brands.append(brand_clean)
-            seen_brands.add(brand_clean.lower())
+    # Get unique brands (case-insensitive) while preserving order and original casing
+    brand_series = pd.Series(brands, dtype=str).str.strip()
+    brand_series = brand_series[brand_series != '']
+    unique_brands = brand_series[~brand_series.str.lower().duplicated()].tolist()
     
     print(f"📊 Processing {len(unique_brands)} unique brands (found {len(brands) - len(unique_brands)} duplicates)")
     
-    # Process each unique brand
-    for i, brand in enumerate(unique_brands, 1):
-        print(f"{'='*60}")
-        print(f"Processing {i}/{len(unique_brands)}: {brand}")
-        print(f"{'='*60}")
+    # Process each unique brand, sharing one browser across them
+    with browser_context(action_type in ("collect", "download"), headless) as context:
+        for i, brand in enumerate(unique_brands, 1):
+            print(f"{'='*60}")
+            print(f"Processing {i}/{len(unique_brands)}: {brand}")
+            print(f"{'='*60}")
         
-        try:
-            brand_data = ""
-            result = None
+            try:
+                brand_data = ""
+                result = None
             
-            if action_type == "collect":
-                result = collect_brand_data(brand, return_result=True, headless=headless)
-                if result:
-                    brand_results[result].append(brand)
-                brand_data = f"Collect Status: {result}" if result else "Collect Status: unknown"
+                if action_type == "collect":
+                    result = collect_brand_data(brand, return_result=True, headless=headless, context=context)
+                    if result:
+                        brand_results[result].append(brand)
+                    brand_data = f"Collect Status: {result}" if result else "Collect Status: unknown"
                 
-            elif action_type == "download":
-                download_html_only(brand, headless=headless)
-                brand_data = "Download Status: completed"
+                elif action_type == "download":
+                    download_html_only(brand, headless=headless, context=context)
+                    brand_data = "Download Status: completed"
                 
-            elif action_type == "summary":
-                model_provider = getattr(sys.modules[__name__], '_current_model_provider', 'gemini')
-                model_name = getattr(sys.modules[__name__], '_current_model_name', None)
-                summary = summarize_html(brand, model_provider, model_name, force_regenerate)
+                elif action_type == "summary":
+                    model_provider = getattr(sys.modules[__name__], '_current_model_provider', 'gemini')
+                    model_name = getattr(sys.modules[__name__], '_current_model_name', None)
+                    summary = summarize_html(brand, model_provider, model_name, force_regenerate)
                 
-                # Track the status of this summary operation
-                status = globals().get('_summary_status', 'unknown')
-                if status == 'existing':
-                    summary_status["existing_summary_found"].append(brand)
-                elif status == 'generated':
-                    summary_status["new_summary_generated"].append(brand)
-                elif status == 'html_missing':
-                    summary_status["html_file_missing"].append(brand)
-                elif status == 'error':
-                    summary_status["errors"].append(brand)
+                    # Track the status of this summary operation
+                    status = globals().get('_summary_status', 'unknown')
+                    if status == 'existing':
+                        summary_status["existing_summary_found"].append(brand)
+                    elif status == 'generated':
+                        summary_status["new_summary_generated"].append(brand)
+                    elif status == 'html_missing':
+                        summary_status["html_file_missing"].append(brand)
+                    elif status == 'error':
+                        summary_status["errors"].append(brand)
                 
-                if summary and not summary.startswith("❌"):
-                    brand_data = summary
-                else:
-                    brand_data = "Summary Status: error or not available"
+                    if summary and not summary.startswith("❌"):
+                        brand_data = summary
+                    else:
+                        brand_data = "Summary Status: error or not available"
             
-            # Store result for this brand
-            processed_brands[brand.lower()] = brand_data
+                # Store result for this brand
+                processed_brands[brand.lower()] = brand_data
             
-            # Small delay between brands - skip delay for summary operations that used existing files
-            if action_type == "summary":
-                used_existing = globals().get('_used_existing_summary', False)
-                if i < len(unique_brands) and not used_existing:
-                    print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
-                    time.sleep(3)
-                elif i < len(unique_brands):
-                    print()  # Just add a line break for clean output
-            else:
-                # For non-summary operations, always delay
-                if i < len(unique_brands):
-                    print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
-                    time.sleep(3)
+                # Small delay between brands - skip delay for summary operations that used existing files
+                if action_type == "summary":
+                    used_existing = globals().get('_used_existing_summary', False)
+                    if i < len(unique_brands) and not used_existing:
+                        print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
+                        time.sleep(3)
+                    elif i < len(unique_brands):
+                        print()  # Just add a line break for clean output
+                else:
+                    # For non-summary operations, always delay
+                    if i < len(unique_brands):
+                        print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
+                        time.sleep(3)
                 
-        except Exception as e:
-            print(f"❌ Error processing {brand}: {e}")
-            processed_brands[brand.lower()] = f"Error: {str(e)}"
-            if action_type == "collect":
-                brand_results["error"].append(brand)
-            continue
+            except Exception as e:
+                print(f"❌ Error processing {brand}: {e}")
+                processed_brands[brand.lower()] = f"Error: {str(e)}"
+                if action_type == "collect":
+                    brand_results["error"].append(brand)
+                continue
     
-    # Update all rows in the dataframe
+    # Stream the original CSV through, filling Brand Data; rows for unprocessed brands keep their value
     print(f"\n🔄 Updating CSV with brand data...")
-    for index, row in df.iterrows():
-        brand_name = str(row[brand_column]).strip()
-        if brand_name and brand_name.lower() in processed_brands:
-            df.at[index, "Brand Data"] = processed_brands[brand_name.lower()]
-    
-    # Save updated CSV
     output_file = csv_file.replace('.csv', '_with_brand_data.csv')
-    df.to_csv(output_file, index=False)
+    with open(csv_file, 'r', newline='', encoding='utf-8-sig') as src, \
+         open(output_file, 'w', newline='', encoding='utf-8') as out:
+        reader = csv.DictReader(src)
+        fieldnames = list(reader.fieldnames)
+        if "Brand Data" not in fieldnames:
+            fieldnames.append("Brand Data")
+        
+        writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        for row in reader:
+            key = (row.get(brand_column) or '').strip().lower()
+            if key in processed_brands:
+                row["Brand Data"] = processed_brands[key]
+            writer.writerow(row)
     
     print(f"{'='*60}")
     print(f"✅ Batch {action_type} completed for {len(unique_brands)} unique brands")
@@ -1526,6 +1778,7 @@ def process_brand_list_internal(brands: list, action_type: str, force_regenerate
         "already_available": [], 
         "no_button_unknown": [], 
         "not_found_in_search": [], 
+        "rate_limited": [],
         "error": []
     } if action_type == "collect" else None
     
@@ -1535,45 +1788,47 @@ def process_brand_list_internal(brands: list, action_type: str, force_regenerate
         "error": []
     } if action_type == "download" else None
     
-    for i, brand in enumerate(brands, 1):
-        print(f"{'='*60}")
-        print(f"Processing {i}/{len(brands)}: {brand}")
-        print(f"{'='*60}")
+    # One browser for the whole batch; each brand gets its own page in it
+    with browser_context(action_type in ("collect", "download"), headless) as context:
+        for i, brand in enumerate(brands, 1):
+            print(f"{'='*60}")
+            print(f"Processing {i}/{len(brands)}: {brand}")
+            print(f"{'='*60}")
         
-        try:
-            if action_type == "collect":
-                result = collect_brand_data(brand, return_result=True, headless=headless)
-                if result:
-                    collect_results[result].append(brand)
-            elif action_type == "download": 
-                result = download_html_only(brand, headless=headless, return_result=True)
-                if result:
-                    download_results[result].append(brand)
-            elif action_type == "summary":
-                summarize_html(brand, force_regenerate=force_regenerate)
+            try:
+                if action_type == "collect":
+                    result = collect_brand_data(brand, return_result=True, headless=headless, context=context)
+                    if result:
+                        collect_results[result].append(brand)
+                elif action_type == "download": 
+                    result = download_html_only(brand, headless=headless, return_result=True, context=context)
+                    if result:
+                        download_results[result].append(brand)
+                elif action_type == "summary":
+                    summarize_html(brand, force_regenerate=force_regenerate)
                 
-            # Small delay between brands to avoid overwhelming the server
-            # Skip delay for summary operations that used existing files
-            if action_type == "summary":
-                used_existing = globals().get('_used_existing_summary', False)
-                if i < len(brands) and not used_existing:
-                    print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
-                    time.sleep(3)
-                elif i < len(brands):
-                    print()  # Just add a line break for clean output
-            else:
-                # For non-summary operations, always delay
-                if i < len(brands):
-                    print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
-                    time.sleep(3)
+                # Small delay between brands to avoid overwhelming the server
+                # Skip delay for summary operations that used existing files
+                if action_type == "summary":
+                    used_existing = globals().get('_used_existing_summary', False)
+                    if i < len(brands) and not used_existing:
+                        print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
+                        time.sleep(3)
+                    elif i < len(brands):
+                        print()  # Just add a line break for clean output
+                else:
+                    # For non-summary operations, always delay
+                    if i < len(brands):
+                        print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
+                        time.sleep(3)
                 
-        except Exception as e:
-            print(f"❌ Error processing {brand}: {e}")
-            if action_type == "collect":
-                collect_results["error"].append(brand)
-            elif action_type == "download":
-                download_results["error"].append(brand)
-            continue
+            except Exception as e:
+                print(f"❌ Error processing {brand}: {e}")
+                if action_type == "collect":
+                    collect_results["error"].append(brand)
+                elif action_type == "download":
+                    download_results["error"].append(brand)
+                continue
     
     print(f"{'='*60}")
     print(f"✅ Batch {action_type} completed for {len(brands)} brands")
@@ -1584,33 +1839,27 @@ def process_brand_list_internal(brands: list, action_type: str, force_regenerate
         print(f"{'='*60}")
         print(f"✅ Data Collection Triggered: {len(collect_results['collected'])} brands")
         if collect_results['collected']:
-            for brand in collect_results['collected']:
-                print(f"   • {brand}")
+            print("\n".join(f"   • {brand}" for brand in collect_results['collected']))
         
         print(f"\n⏳ Currently Analyzing: {len(collect_results['analyzing'])} brands")
         if collect_results['analyzing']:
-            for brand in collect_results['analyzing']:
-                print(f"   • {brand}")
+            print("\n".join(f"   • {brand}" for brand in collect_results['analyzing']))
                 
         print(f"\n📋 Already Available: {len(collect_results['already_available'])} brands")
         if collect_results['already_available']:
-            for brand in collect_results['already_available']:
-                print(f"   • {brand}")
+            print("\n".join(f"   • {brand}" for brand in collect_results['already_available']))
         
         print(f"\nℹ️  No Button Found (Status Unknown): {len(collect_results['no_button_unknown'])} brands") 
         if collect_results['no_button_unknown']:
-            for brand in collect_results['no_button_unknown']:
-                print(f"   • {brand}")
+            print("\n".join(f"   • {brand}" for brand in collect_results['no_button_unknown']))
                 
         print(f"\n🔍 Not Found in Search: {len(collect_results['not_found_in_search'])} brands")
         if collect_results['not_found_in_search']:
-            for brand in collect_results['not_found_in_search']:
-                print(f"   • {brand}")
+            print("\n".join(f"   • {brand}" for brand in collect_results['not_found_in_search']))
                 
         print(f"\n❌ Errors: {len(collect_results['error'])} brands")
         if collect_results['error']:
-            for brand in collect_results['error']:
-                print(f"   • {brand}")
+            print("\n".join(f"   • {brand}" for brand in collect_results['error']))
                 
         successful_collects = len(collect_results['collected'])
         total_brands = len(brands)
@@ -1649,9 +1898,42 @@ def process_brand_list_internal(brands: list, action_type: str, force_regenerate
     
     print(f"{'='*60}")
 
-def collect_brand_data(brand_name: str, return_result=False, headless=False):
+def find_visible(page, selectors: list, timeout: int = 5000):
+    """
+    Wait once for any of the selectors to be visible, then return (locator, selector) for the first
+    visible one in list order, or (None, None) if none shows up within timeout ms.
+    """
+    try:
+        # A selector list is matched by the DOM engine in one query, so this is a single wait
+        page.locator(f"{', '.join(selectors)} >> visible=true").first.wait_for(state="visible", timeout=timeout)
+    except Exception:
+        return None, None
+    for selector in selectors:
+        locator = page.locator(f"{selector} >> visible=true").first
+        if locator.is_visible():
+            return locator, selector
+    return None, None
+
+@contextlib.contextmanager
+def browser_context(enabled=True, headless=False):
+    """
+    Launch the logged-in browser context once for a batch, or yield None when enabled is False.
+    """
+    if not enabled:
+        yield None
+        return
+    with sync_playwright() as p:
+        context = launch_report_context(p, headless)
+        try:
+            yield context
+        finally:
+            context.close()
+
+def collect_brand_data(brand_name: str, return_result=False, headless=False, context=None):
     """
     Look for and click 'Collect {Brand Name}'s Data Now' button without downloading report.
+    If a browser context is passed it is reused (only a page is opened and closed);
+    otherwise a persistent context is launched for this call.
     """
     # Create html folder if it doesn't exist (for consistency)
     html_folder = globals().get('_html_folder', 'html')
@@ -1659,12 +1941,27 @@ def collect_brand_data(brand_name: str, return_result=False, headless=False):
         os.makedirs(html_folder)
         print(f"📁 Created {html_folder} folder")
     
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(USER_DATA_DIR, headless=headless, slow_mo=500 if not headless else 100)
+    owns_context = context is None
+    with sync_playwright() if owns_context else contextlib.nullcontext() as p:
+        if owns_context:
+            context = launch_report_context(p, headless)
         page = context.new_page()
         print(f"Navigating to the Brand Reports page: {SMARTSCOUT_URL}")
-        page.goto(SMARTSCOUT_URL)
+        response = page.goto(SMARTSCOUT_URL)
         try:
+            # Surface throttling so callers can back off (Retry-After in seconds, if given)
+            if response is not None and response.status == 429:
+                retry_after = response.headers.get('retry-after')
+                try:
+                    globals()['_last_retry_after'] = float(retry_after)
+                except (TypeError, ValueError):
+                    globals()['_last_retry_after'] = None
+                print(f"🚦 SmartScout rate limit hit (HTTP 429, Retry-After: {retry_after or 'n/a'})")
+                result = "rate_limited"
+                if return_result:
+                    return result
+                return
+            
             # 1. Search for the brand in existing reports
             print(f"Searching for brand: '{brand_name}'")
             
@@ -1673,34 +1970,16 @@ def collect_brand_data(brand_name: str, return_result=False, headless=False):
             time.sleep(2)
             
             # Look for search functionality
-            search_selectors = [
-                'input[placeholder*="search" i]',
-                'input[placeholder*="brand" i]',
-                'input[type="search"]',
-                '.search-input',
-                '[data-testid*="search"]'
-            ]
-            
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = page.locator(selector).first
-                    if search_input.is_visible(timeout=2000):
-                        print(f"Found search input with selector: {selector}")
-                        break
-                except:
-                    continue
+            search_input, selector = find_visible(page, SEARCH_SELECTORS, timeout=5000)
+            if search_input:
+                print(f"Found search input with selector: {selector}")
             
             if search_input and search_input.is_visible():
                 print(f"🔍 Searching for brand: {brand_name}")
                 search_input.fill(brand_name)
                 search_input.press("Enter")
                 
-                # Wait for search results
-                print(f"Waiting for search results...")
-                time.sleep(5)  # Simple 5-second wait for results to appear
-                
-                # Look for the brand name in search results
+                # Wait for the brand name to show up in search results
                 print(f"Looking for '{brand_name}' in search results...")
                 # EXACT MATCHES ONLY - No partial matching to prevent "Solvite" matching "Solvitek"
                 brand_selectors = [
@@ -1708,41 +1987,28 @@ def collect_brand_data(brand_name: str, return_result=False, headless=False):
                     f'[title="{brand_name}"]',  # Exact title match only
                 ]
                 
-                brand_link = None
-                # Try multiple times with scrolling to find brands further down
-                found = False
-                for attempt in range(5):  # Increased attempts to allow for scrolling
-                    print(f"Search attempt {attempt + 1}/5...")
-                    
-                    # Try to find the brand without scrolling first
-                    for selector in brand_selectors:
-                        try:
-                            brand_link = page.locator(selector).first
-                            if brand_link.is_visible(timeout=2000):
-                                print(f"✅ Found brand link with selector: {selector}")
-                                found = True
-                                break
-                        except:
-                            continue
-                    
-                    if found:  # Exit if found
+                brand_link, selector = find_visible(page, brand_selectors, timeout=10000)
+                # If not found, scroll down to load more results, up to 4 times
+                for attempt in range(4):
+                    if brand_link:
                         break
-                    
-                    # If not found, scroll down to load more results
-                    if attempt < 4:  # Don't scroll after last attempt
-                        print(f"⏳ Brand not found yet, scrolling down to load more results...")
-                        # Scroll to bottom of page to trigger loading more results
-                        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        time.sleep(2)  # Wait for more results to load
+                    print(f"⏳ Brand not found yet, scrolling down to load more results ({attempt + 1}/4)...")
+                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                    brand_link, selector = find_visible(page, brand_selectors, timeout=2000)
+                if brand_link:
+                    print(f"✅ Found brand link with selector: {selector}")
                 
                 if brand_link and brand_link.is_visible():
                     print(f"📊 Clicking on '{brand_name}' to open brand page...")
                     brand_link.click()
                     
-                    # Wait for brand page to load
+                    # Wait for brand page to load and its requests to settle
                     print("⏳ Waiting for brand page to load...")
                     page.wait_for_load_state("domcontentloaded", timeout=30000)
-                    time.sleep(3)
+                    try:
+                        page.wait_for_load_state("networkidle", timeout=10000)
+                    except Exception:
+                        pass  # Page keeps polling; the button lookup below still waits for it
                 else:
                     print(f"❌ Could not find '{brand_name}' in search results")
                     result = "no_brand_found"
@@ -1777,15 +2043,9 @@ def collect_brand_data(brand_name: str, return_result=False, headless=False):
                 '[class*="collect"]'
             ]
             
-            collect_button = None
-            for selector in collect_button_selectors:
-                try:
-                    collect_button = page.locator(selector).first
-                    if collect_button.is_visible(timeout=2000):
-                        print(f"✅ Found collect data button with selector: {selector}")
-                        break
-                except:
-                    continue
+            collect_button, selector = find_visible(page, collect_button_selectors, timeout=3000)
+            if collect_button:
+                print(f"✅ Found collect data button with selector: {selector}")
             
             if collect_button and collect_button.is_visible():
                 print(f"🎯 Clicking 'Collect {brand_name}'s Data Now' button...")
@@ -1833,15 +2093,19 @@ def collect_brand_data(brand_name: str, return_result=False, headless=False):
             print(f"❌ An error occurred: {str(e)}")
             result = "error"
         finally:
-            context.close()
+            if owns_context:
+                context.close()
+            else:
+                page.close()
         
         if return_result:
             return result
 
-def download_html_only(brand_name: str, headless=False, return_result=False, html_folder=None, force_regenerate=False):
+def download_html_only(brand_name: str, headless=False, return_result=False, html_folder=None, force_regenerate=False, context=None):
     """
     Download HTML report and save to html folder without summarizing.
     If force_regenerate=False, will check existing file size first and skip if complete.
+    A passed-in browser context is reused instead of launching a new one.
     """
     # Use provided folder path or fall back to global/default
     if html_folder is None:
@@ -1851,7 +2115,7 @@ def download_html_only(brand_name: str, headless=False, return_result=False, htm
         print(f"📁 Created {html_folder} folder")
     
     # Check if file already exists and is complete (unless force_regenerate=True)
-    html_filename = f"{brand_name.replace(' ', '_').lower()}_report.html"
+    html_filename = f"{_brand_slug(brand_name)}_report.html"
     html_file_path = os.path.join(html_folder, html_filename)
     
     if not force_regenerate and os.path.exists(html_file_path):
@@ -1880,13 +2144,18 @@ def download_html_only(brand_name: str, headless=False, return_result=False, htm
         
         print("💾 Saving HTML content...")
         html_content = page.content()
-        html_file = os.path.join(html_folder, f"{brand_name.replace(' ', '_').lower()}_report.html")
+        html_file = os.path.join(html_folder, f"{_brand_slug(brand_name)}_report.html")
         
-        with open(html_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # Encode once and write through a large buffer to a temp file, then rename it
+        # into place so a crash mid-write never leaves a truncated report behind
+        data = html_content.encode("utf-8")
+        tmp_file = html_file + ".tmp"
+        with open(tmp_file, "wb", buffering=1 << 20) as f:
+            f.write(data)
+        os.replace(tmp_file, html_file)
         
         # Check file size
-        file_size = os.path.getsize(html_file)
+        file_size = len(data)
         file_size_kb = file_size // 1024
         
         if file_size < 300_000:  # Less than 300KB
@@ -1897,8 +2166,10 @@ def download_html_only(brand_name: str, headless=False, return_result=False, htm
             print(f"✅ Download completed! File size looks good.")
             return "downloaded"
     
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(USER_DATA_DIR, headless=headless, slow_mo=500 if not headless else 100)
+    owns_context = context is None
+    with sync_playwright() if owns_context else contextlib.nullcontext() as p:
+        if owns_context:
+            context = launch_report_context(p, headless)
         page = context.new_page()
         print(f"Navigating to the Brand Reports page: {SMARTSCOUT_URL}")
         page.goto(SMARTSCOUT_URL)
@@ -1912,23 +2183,9 @@ def download_html_only(brand_name: str, headless=False, return_result=False, htm
             
             # Look for search functionality or directly find the brand report
             # Try different search input selectors
-            search_selectors = [
-                'input[placeholder*="search" i]',
-                'input[placeholder*="brand" i]',
-                'input[type="search"]',
-                '.search-input',
-                '[data-testid*="search"]'
-            ]
-            
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = page.locator(selector).first
-                    if search_input.is_visible(timeout=2000):
-                        print(f"Found search input with selector: {selector}")
-                        break
-                except:
-                    continue
+            search_input, selector = find_visible(page, SEARCH_SELECTORS, timeout=5000)
+            if search_input:
+                print(f"Found search input with selector: {selector}")
             
             if search_input and search_input.is_visible():
                 print(f"🔍 Searching for brand: {brand_name}")
@@ -1946,32 +2203,16 @@ def download_html_only(brand_name: str, headless=False, return_result=False, htm
                 f'[data-brand="{brand_name}"]',  # Exact data attribute only
             ]
             
-            brand_link = None
-            # Try multiple times with scrolling to find brands further down
-            found = False
-            for attempt in range(5):  # Increased attempts to allow for scrolling
-                print(f"Download search attempt {attempt + 1}/5...")
-                
-                # Try to find the brand without scrolling first
-                for selector in brand_selectors:
-                    try:
-                        brand_link = page.locator(selector).first
-                        if brand_link.is_visible(timeout=2000):
-                            print(f"✅ Found brand report with selector: {selector}")
-                            found = True
-                            break
-                    except:
-                        continue
-                
-                if found:  # Exit if found
+            brand_link, selector = find_visible(page, brand_selectors, timeout=10000)
+            # If not found, scroll down to load more results, up to 4 times
+            for attempt in range(4):
+                if brand_link:
                     break
-                
-                # If not found, scroll down to load more results
-                if attempt < 4:  # Don't scroll after last attempt
-                    print(f"⏳ Brand report not found yet, scrolling down to load more results...")
-                    # Scroll to bottom of page to trigger loading more results
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    time.sleep(2)  # Wait for more results to load
+                print(f"⏳ Brand report not found yet, scrolling down to load more results ({attempt + 1}/4)...")
+                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                brand_link, selector = find_visible(page, brand_selectors, timeout=2000)
+            if brand_link:
+                print(f"✅ Found brand report with selector: {selector}")
             
             if not brand_link or not brand_link.is_visible():
                 # EXACT MATCHES ONLY - No partial matching to prevent "Solvite" matching "Solvitek"
@@ -1987,14 +2228,13 @@ def download_html_only(brand_name: str, headless=False, return_result=False, htm
                     print("Available reports on page:")
                     # Try to list available reports for debugging
                     try:
-                        reports = page.locator('a, button').all()
-                        for report in reports[:10]:
-                            try:
-                                text = report.inner_text(timeout=1000)
-                                if text and len(text.strip()) > 0:
-                                    print(f"  - {text.strip()}")
-                            except:
-                                pass
+                        # One evaluate call instead of an inner_text round-trip per element
+                        texts = page.eval_on_selector_all(
+                            "a, button",
+                            "(els) => els.slice(0, 10).map(e => (e.innerText || '').trim()).filter(Boolean)"
+                        )
+                        for text in texts:
+                            print(f"  - {text}")
                     except:
                         pass
                     result = "not_found_in_search"
@@ -2017,7 +2257,10 @@ def download_html_only(brand_name: str, headless=False, return_result=False, htm
             print(f"❌ An error occurred: {str(e)}")
             result = "error"
         finally:
-            context.close()
+            if owns_context:
+                context.close()
+            else:
+                page.close()
         
         if return_result:
             return result
@@ -2040,8 +2283,8 @@ def summarize_html(brand_name: str, model_provider: str = "gemini", model_name:
         print(f"📁 Created {summary_folder} folder")
     
     # Find HTML file and summary file paths
-    html_file = os.path.join(html_folder, f"{brand_name.replace(' ', '_').lower()}_report.html")
-    summary_file = os.path.join(summary_folder, f"{brand_name.replace(' ', '_').lower()}_analysis.txt")
+    html_file = os.path.join(html_folder, f"{_brand_slug(brand_name)}_report.html")
+    summary_file = os.path.join(summary_folder, f"{_brand_slug(brand_name)}_analysis.txt")
     
     # Check if summary already exists (unless force regenerate is enabled)
     if os.path.exists(summary_file) and not force_regenerate:
@@ -2106,13 +2349,19 @@ def summarize_html(brand_name: str, model_provider: str = "gemini", model_name:
             'content_length': len(html_content)
         }
         
+        # Keep the payload within the provider's input budget
+        extracted_metrics = fit_to_budget(extracted_metrics, model_provider, model_name)
+        
         # Generate AI summary
         print(f"\n📝 Generating AI summary of the report with {model_provider}...")
         summary = summarize_with_llm("", brand_name, extracted_metrics, model_provider, model_name)
         
         # Save summary to summary folder
-        with open(summary_file, "w", encoding="utf-8") as f:
+        # Written beside the target and renamed in, so an interrupted batch never leaves a partial summary
+        tmp_file = summary_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
             f.write(summary)
+        os.replace(tmp_file, summary_file)
         
         print(f"📄 Summary saved to: {summary_file}")
         
@@ -2125,6 +2374,143 @@ def summarize_html(brand_name: str, model_provider: str = "gemini", model_name:
         return f"❌ Error generating summary: {str(e)}"
 
 
+# Rough output size of one comprehensive analysis; bounds how many fit in one batched response
+SUMMARY_OUTPUT_TOKENS = 2500
+
+def summarize_html_batch(brand_names: list, model_provider: str = "gemini", model_name: str = None, force_regenerate: bool = False, html_folder=None, summary_folder=None, max_batch: int = 8) -> dict:
+    """
+    Summarize several brands with one LLM request where their reports fit together.
+    Brands with an existing summary, a missing report, or a report that needs chunking
+    go through summarize_html one at a time. Returns {brand_name: summary}.
+    """
+    if html_folder is None:
+        html_folder = globals().get('_html_folder', 'html')
+    if summary_folder is None:
+        summary_folder = globals().get('_summary_folder', 'summary')
+    os.makedirs(summary_folder, exist_ok=True)
+    
+    def single(brand_name):
+        return summarize_html(brand_name, model_provider, model_name, force_regenerate, html_folder, summary_folder)
+    
+    limit = LLM_SINGLE_REQUEST_LIMITS.get(model_provider, 150000)
+    # Every analysis in a group has to fit in one response, not just every report in one prompt
+    max_batch = min(max_batch, LLM_OUTPUT_TOKEN_LIMITS.get(model_provider, 4096) // SUMMARY_OUTPUT_TOKENS)
+    results = {}
+    groups = [[]]
+    group_chars = 0
+    
+    for brand_name in brand_names:
+        slug = _brand_slug(brand_name)
+        html_file = os.path.join(html_folder, f"{slug}_report.html")
+        summary_file = os.path.join(summary_folder, f"{slug}_analysis.txt")
+        
+        # summarize_html already handles reuse, staleness and missing reports
+        if not os.path.exists(html_file) or (os.path.exists(summary_file) and not force_regenerate):
+            results[brand_name] = single(brand_name)
+            continue
+        
+        try:
+            with open(html_file, "r", encoding="utf-8") as f:
+                html_content = f.read()
+            file_size = os.path.getsize(html_file)
+        except (OSError, UnicodeDecodeError) as e:
+            # Keep a bad report from failing the whole group; summarize_html reports it for this brand
+            print(f"⚠️  Could not read report for {brand_name} ({e}); summarizing it on its own")
+            results[brand_name] = single(brand_name)
+            continue
+        metrics = fit_to_budget({
+            'html_content': html_content,
+            'file_size_bytes': file_size,
+            'file_size_kb': file_size // 1024,
+            'content_length': len(html_content)
+        }, model_provider, model_name)
+        
+        content_length = len(metrics['html_content'])
+        if content_length > limit:
+            results[brand_name] = single(brand_name)
+            continue
+        
+        # Start a new request once the combined reports would overflow one
+        if groups[-1] and (group_chars + content_length > limit or len(groups[-1]) >= max_batch):
+            groups.append([])
+            group_chars = 0
+        groups[-1].append((brand_name, summary_file, metrics))
+        group_chars += content_length
+    
+    client, error = None, None
+    for group in groups:
+        if len(group) < 2:
+            for brand_name, _, _ in group:
+                results[brand_name] = single(brand_name)
+            continue
+        
+        if client is None and error is None:
+            client, error = get_llm_client(model_provider)
+        if error:
+            for brand_name, _, _ in group:
+                results[brand_name] = error
+            continue
+        
+        names = [brand_name for brand_name, _, _ in group]
+        print(f"\n📝 Generating {len(group)} summaries in one {model_provider} request: {', '.join(names)}")
+        
+        # Each report is fenced by a marker line and each analysis must start with one
+        prompt_parts = [
+            f"You will receive {len(group)} separate SmartScout brand reports. Analyze each one "
+            f"independently following the instructions given with it. Begin each analysis with a "
+            f"line of the form '=== ANALYSIS: <brand name> ===' using the exact brand name, and "
+            f"output the analyses in the order the reports are given.\n"
+        ]
+        for brand_name, _, metrics in group:
+            prompt_parts.append(f"\n=== REPORT: {brand_name} ===\n")
+            prompt_parts.append(build_analysis_prompt(brand_name, metrics['file_size_kb'], metrics['content_length']))
+            prompt_parts.append(metrics['html_content'])
+        
+        response, truncated = call_llm_api_checked(client, model_provider, "".join(prompt_parts), model_name, cap_output=True)
+        
+        sections = {}
+        if response and not response.startswith("❌"):
+            # Match the exact brand names, longest first, so a name containing "===" still splits cleanly
+            marker_re = re.compile(
+                r'^=== ANALYSIS: (' + '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True)) + r') ===[ \t]*$',
+                re.IGNORECASE | re.MULTILINE
+            )
+            markers = list(marker_re.finditer(response))
+            for marker, next_marker in zip(markers, markers[1:] + [None]):
+                end = next_marker.start() if next_marker else len(response)
+                sections[marker.group(1).lower()] = response[marker.end():end].strip()
+            if truncated and markers:
+                # The response hit its output limit, so the last analysis was cut off mid-way
+                print(f"⚠️  Batched response was truncated; '{markers[-1].group(1)}' will be summarized on its own")
+                sections.pop(markers[-1].group(1).lower(), None)
+        
+        saved_any = False
+        for brand_name, summary_file, _ in group:
+            summary = sections.get(brand_name.lower())
+            if not summary or len(summary) <= 100:
+                # Missing or garbled section: fall back to a request of its own
+                results[brand_name] = single(brand_name)
+                continue
+            
+            tmp_file = summary_file + ".tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(summary)
+                os.replace(tmp_file, summary_file)
+            except OSError as e:
+                error_msg = f"❌ Error saving summary for {brand_name}: {e.strerror or e}"
+                print(error_msg)
+                results[brand_name] = error_msg
+                continue
+            print(f"📄 Summary saved to: {summary_file}")
+            results[brand_name] = summary
+            saved_any = True
+        
+        if saved_any:
+            globals()['_summary_status'] = 'generated'
+    
+    return results
+
 def setup_session():
     """
     Opens a browser for the user to log in and save the session.
@@ -2249,49 +2635,7 @@ if __name__ == "__main__":
     
     # Check for help first
     if "--help" in sys.argv or "-h" in sys.argv:
-        print("Usage:")
-        print("  For first-time setup (to log in):")
-        print("    python smartscout_csv_downloader.py --setup")
-        print("\n  🔑 API Authentication Setup (Recommended):")
-        print("    python smartscout_csv_downloader.py --setup-api        # Setup SmartScout API key")
-        print("\n  To trigger data collection for brand(s):")
-        print("    python smartscout_csv_downloader.py --collect \"Brand Name\"")
-        print("    python smartscout_csv_downloader.py --collect \"Brand1, Brand2, Brand3\"")
-        print("    python smartscout_csv_downloader.py --collect brands.txt")
-        print("    python smartscout_csv_downloader.py --collect brands.csv --column \"Brand Name\"")
-        print("\n  To download brand report(s):")
-        print("    python smartscout_csv_downloader.py \"Brand Name\"")
-        print("    python smartscout_csv_downloader.py \"Brand1, Brand2, Brand3\"")
-        print("    python smartscout_csv_downloader.py brands.txt")
-        print("    python smartscout_csv_downloader.py brands.csv --column \"Brand Name\"")
-        print("\n  To generate AI summary from existing HTML:")
-        print("    python smartscout_csv_downloader.py --summary \"Brand Name\"")
-        print("    python smartscout_csv_downloader.py --summary \"Brand1, Brand2, Brand3\"")
-        print("    python smartscout_csv_downloader.py --summary brands.txt")
-        print("    python smartscout_csv_downloader.py --summary brands.csv")
-        print("    python smartscout_csv_downloader.py --summary results.csv               # Auto-detects 'Brand Name' column")
-        print("\n  🤖 Background Processing:")
-        print("    python smartscout_csv_downloader.py --collect data.csv --headless        # No browser windows")
-        print("    python smartscout_csv_downloader.py data.csv --headless                  # Background download")
-        print("    python smartscout_csv_downloader.py --headless \"Brand Name\"             # Single brand headless")
-        print("\n  🧠 LLM Model Options:")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model deepseek  # Use DeepSeek (cheapest)")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model openai    # Use OpenAI GPT-4")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model gemini    # Use Google Gemini")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model anthropic # Use Claude (default)")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model openai:gpt-4o  # Specific model")
-        print("\n  🔄 Force Regenerate:")
-        print("    python smartscout_csv_downloader.py --summary data.csv --force-regenerate      # Recreate existing summaries")
-        print("    python smartscout_csv_downloader.py --summary \"Brand Name\" --force-regenerate # Force single brand")
-        print("\n  📁 Custom Folder Paths:")
-        print("    python smartscout_csv_downloader.py data.csv --html-folder reports            # Custom HTML folder")
-        print("    python smartscout_csv_downloader.py --summary data.csv --summary-folder analysis # Custom summary folder")
-        print("    python smartscout_csv_downloader.py data.csv --html-folder /path/to/html --summary-folder /path/to/summaries")
-        print("\n  💰 Cost Comparison (approximate):")
-        print("    • DeepSeek: ~$0.14 per 1M tokens (cheapest)")
-        print("    • OpenAI GPT-4: ~$10-30 per 1M tokens")
-        print("    • Gemini Pro: ~$0.50 per 1M tokens")
-        print("    • Claude Sonnet: ~$3-15 per 1M tokens")
+        sys.stdout.write(HELP_TEXT)
         sys.exit(0)
     
     if "--setup" in sys.argv:
@@ -2335,50 +2679,5 @@ if __name__ == "__main__":
         else:
             download_html_only(brands_input, headless=headless)
     else:
-        print("Usage:")
-        print("  For first-time setup (to log in):")
-        print("    python smartscout_csv_downloader.py --setup")
-        print("\n  🔑 API Authentication Setup (Recommended):")
-        print("    python smartscout_csv_downloader.py --setup-api        # Setup SmartScout API key")
-        print("\n  To trigger data collection for brand(s):")
-        print("    python smartscout_csv_downloader.py --collect \"Brand Name\"")
-        print("    python smartscout_csv_downloader.py --collect \"Brand1, Brand2, Brand3\"")
-        print("    python smartscout_csv_downloader.py --collect brands.txt")
-        print("    python smartscout_csv_downloader.py --collect brands.csv --column \"Brand Name\"")
-        print("\n  To download brand report(s):")
-        print("    python smartscout_csv_downloader.py \"Brand Name\"")
-        print("    python smartscout_csv_downloader.py \"Brand1, Brand2, Brand3\"")
-        print("    python smartscout_csv_downloader.py brands.txt")
-        print("    python smartscout_csv_downloader.py brands.csv --column \"Brand Name\"")
-        print("\n  To generate AI summary from existing HTML:")
-        print("    python smartscout_csv_downloader.py --summary \"Brand Name\"")
-        print("    python smartscout_csv_downloader.py --summary \"Brand1, Brand2, Brand3\"")
-        print("    python smartscout_csv_downloader.py --summary brands.txt")
-        print("    python smartscout_csv_downloader.py --summary brands.csv --column \"Brand Name\"")
-        print("\n  📊 CSV Examples:")
-        print("    python smartscout_csv_downloader.py --collect data.csv                    # Auto-detects 'Brand Name' column")
-        print("    python smartscout_csv_downloader.py data.csv --column \"Company Name\"     # Custom column")
-        print("    python smartscout_csv_downloader.py --summary results.csv               # Auto-detects 'Brand Name' column")
-        print("\n  🤖 Background Processing:")
-        print("    python smartscout_csv_downloader.py --collect data.csv --headless        # No browser windows")
-        print("    python smartscout_csv_downloader.py data.csv --headless                  # Background download")
-        print("    python smartscout_csv_downloader.py --headless \"Brand Name\"             # Single brand headless")
-        print("\n  🧠 LLM Model Options:")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model deepseek  # Use DeepSeek (cheapest)")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model openai    # Use OpenAI GPT-4")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model gemini    # Use Google Gemini")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model anthropic # Use Claude (default)")
-        print("    python smartscout_csv_downloader.py --summary data.csv --model openai:gpt-4o  # Specific model")
-        print("\n  🔄 Force Regenerate:")
-        print("    python smartscout_csv_downloader.py --summary data.csv --force-regenerate      # Recreate existing summaries")
-        print("    python smartscout_csv_downloader.py --summary \"Brand Name\" --force-regenerate # Force single brand")
-        print("\n  📁 Custom Folder Paths:")
-        print("    python smartscout_csv_downloader.py data.csv --html-folder reports            # Custom HTML folder")
-        print("    python smartscout_csv_downloader.py --summary data.csv --summary-folder analysis # Custom summary folder")
-        print("    python smartscout_csv_downloader.py data.csv --html-folder /path/to/html --summary-folder /path/to/summaries")
-        print("\n  💰 Cost Comparison (approximate):")
-        print("    • DeepSeek: ~$0.14 per 1M tokens (cheapest)")
-        print("    • OpenAI GPT-4: ~$10-30 per 1M tokens")
-        print("    • Gemini Pro: ~$0.50 per 1M tokens")
-        print("    • Claude Sonnet: ~$3-15 per 1M tokens")
+        sys.stdout.write(HELP_TEXT)
         sys.exit(1)
@@ -30,27 +30,39 @@ Usage:
 import os
 import sys
 import json
+import csv
 import time
+import random
 import shutil
+import threading
+import functools
+import sqlite3
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from pathlib import Path
 import pandas as pd
 
-# Import existing functions from the main script
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-try:
-    from smartscout_csv_downloader import (
-        collect_brand_data,
-        download_html_only, 
-        summarize_html,
-        SMARTSCOUT_API_KEY
-    )
-except ImportError as e:
-    print(f"❌ Error importing SmartScout functions: {e}")
-    print("Make sure smartscout_csv_downloader.py is in the same directory")
-    sys.exit(1)
+# The downloader pulls in Playwright, BeautifulSoup and the LLM clients, so it
+# is imported on first use; --status and --list never need it
+_downloader_module = None
+
+
+def _downloader():
+    """Return the smartscout_csv_downloader module, importing it on first use"""
+    global _downloader_module
+    if _downloader_module is None:
+        try:
+            import smartscout_csv_downloader
+        except ImportError as e:
+            print(f"❌ Error importing SmartScout functions: {e}")
+            print("Make sure smartscout_csv_downloader.py is in the same directory")
+            raise
+        _downloader_module = smartscout_csv_downloader
+    return _downloader_module
 
 
 class BrandStatus(Enum):
@@ -69,6 +81,64 @@ class BrandStatus(Enum):
     SKIPPED = "skipped"
 
 
+# Brand column names tried in order when reading a CSV; the first column is the fallback
+BRAND_COLUMN_CANDIDATES = ('Brand Name', 'Brand', 'brand', 'name', 'Brand_Name')
+
+# Suffix of the exported CSV; the apps find results by a plain endswith() on this
+RESULT_CSV_SUFFIX = '_with_brand_data.csv'
+
+# Same naming as smartscout_csv_downloader._brand_slug, which writes the files.
+# Spaces and characters that are not allowed in file names all become underscores
+BRAND_SLUG_TABLE = str.maketrans({c: '_' for c in ' \\/:*?"<>|'})
+
+@functools.lru_cache(maxsize=4096)
+def _brand_slug(brand_name: str) -> str:
+    """
+    File name stem for a brand's report and summary, e.g. "Acme Co" -> "acme_co".
+    """
+    return brand_name.lower().translate(BRAND_SLUG_TABLE)
+
+def detect_brand_column(columns) -> str:
+    """First BRAND_COLUMN_CANDIDATES entry present in columns, else the first column"""
+    present = set(columns)
+    return next((c for c in BRAND_COLUMN_CANDIDATES if c in present), columns[0])
+
+class _StatusDisplay(dict):
+    """Status display map that labels unknown statuses instead of raising"""
+    def __missing__(self, status):
+        return f"❓ {getattr(status, 'value', status)}"
+
+
+# Status with emoji for tables and summaries
+STATUS_DISPLAY = _StatusDisplay({
+    BrandStatus.PENDING: "⏳ pending",
+    BrandStatus.COLLECTING: "🔄 collecting",
+    BrandStatus.NO_BRAND_FOUND: "❌ not found",
+    BrandStatus.COLLECTED: "✅ collected",
+    BrandStatus.ANALYZING: "⚡ analyzing",
+    BrandStatus.ANALYZED: "📊 analyzed",
+    BrandStatus.DOWNLOADING: "📥 downloading",
+    BrandStatus.DOWNLOADED: "💾 downloaded",
+    BrandStatus.SUMMARIZING: "🤖 summarizing",
+    BrandStatus.SUMMARIZED: "📋 summarized",
+    BrandStatus.FAILED: "💥 failed",
+    BrandStatus.SKIPPED: "⏭️ skipped"
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _clock_time(timestamp: str) -> str:
+    """Format an ISO timestamp as HH:MM:SS (batch phases share timestamps, so hits are common)"""
+    # Timestamps written by this module are YYYY-MM-DDTHH:MM:SS[...], so the
+    # clock time can be sliced out without parsing
+    if len(timestamp) >= 19 and timestamp[10] in 'T ' and timestamp[13] == ':' and timestamp[16] == ':':
+        return timestamp[11:19]
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime("%H:%M:%S")
+    except (AttributeError, ValueError):
+        return "Unknown"
+
+
 class StepResult(Enum):
     """Individual step execution results"""
     SUCCESS = "success"
@@ -77,7 +147,47 @@ class StepResult(Enum):
     FAIL = "fail"
 
 
-@dataclass
+class RateLimited(Exception):
+    """Raised when SmartScout throttles a request (HTTP 429)"""
+    
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__(f"rate limited (retry after {retry_after}s)" if retry_after else "rate limited")
+        self.retry_after = retry_after
+
+
+class AdaptiveBackoff:
+    """
+    Wait scheduler between retry rounds.
+    
+    Halves the wait after a productive round, multiplies it by `factor`
+    after a round with little progress, and at least doubles it (honoring
+    any Retry-After) when throttled. Each wait gets +/-20% jitter.
+    """
+    
+    def __init__(self, base: float = 300, cap: float = 3600, factor: float = 2):
+        self.base = base
+        self.cap = cap
+        self.factor = factor
+        self.wait = base
+    
+    def on_success(self):
+        self.wait = max(self.base, self.wait / 2)
+    
+    def on_no_progress(self):
+        self.wait = min(self.cap, self.wait * self.factor)
+    
+    def on_throttle(self, retry_after: Optional[float] = None):
+        self.wait = min(self.cap, max(self.wait * 2, retry_after or 0))
+    
+    def next_wait(self) -> int:
+        return int(min(self.cap, self.wait * random.uniform(0.8, 1.2)))
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class BrandState:
     """Represents the processing state of a single brand"""
     name: str
@@ -90,8 +200,17 @@ class BrandState:
     collect_result: str = None
     created_at: str = None
     updated_at: str = None
+    # Derived from the name, so they are never passed in or saved
+    html_filename: str = field(default=None, init=False, repr=False)
+    summary_filename: str = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
+        # Statuses loaded from JSON arrive as plain strings
+        if not isinstance(self.status, BrandStatus):
+            self.status = BrandStatus(self.status)
+        slug = _brand_slug(self.name)
+        self.html_filename = f"{slug}_report.html"
+        self.summary_filename = f"{slug}_analysis.txt"
         if self.attempts is None:
             self.attempts = {"collect": 0, "download": 0, "summarize": 0}
         if self.last_attempt is None:
@@ -102,7 +221,13 @@ class BrandState:
             self.results = {}
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+    
+    @classmethod
+    def make(cls, name: str, now: str) -> "BrandState":
+        """Create a fresh brand state stamped with a precomputed timestamp"""
+        return cls(name=name, created_at=now, updated_at=now)
 
 
 @dataclass 
@@ -120,11 +245,19 @@ class SessionConfig:
     model_provider: str = "gemini"
     model_name: str = None
     force_regenerate: bool = False
+    # Worker threads per batch phase. Collect/download share one persistent
+    # browser profile, which Chromium only lets a single process open, so
+    # values above 1 are clamped to 1.
+    collect_workers: int = 1
+    download_workers: int = 1
+    summarize_workers: int = 4
+    # Brands whose reports may share one LLM request
+    summarize_batch_size: int = 8
     created_at: str = None
     
     def __post_init__(self):
         if self.retry_delays is None:
-            # Exponential backoff: collect=60s, download=120s, summarize=30s
+            # Base retry delay per step; attempt n waits n times this (collect=60s, download=120s, summarize=30s)
             self.retry_delays = {
                 "collect": 60,
                 "download": 120, 
@@ -157,9 +290,44 @@ class SessionManager:
     Main session manager class that orchestrates brand processing workflow
     """
     
+    # Per-brand updates go to a SQLite store (WAL mode) next to the JSON
+    # snapshot; a full snapshot is taken at phase boundaries or every N updates
+    STORE_FILENAME = "session.db"
+    SNAPSHOT_EVERY = 500
+    
+    # Seconds a cached HTML file size stays valid for the session table
+    HTML_SIZE_TTL = 2.0
+    
+    # BrandState is slotted (no __dict__), so snapshots copy these fields
+    _BRAND_FIELDS = tuple(f.name for f in fields(BrandState) if f.init)
+    
+    # Statuses that keep the retry rounds going (frozenset: one hash lookup per check)
+    INCOMPLETE_STATUSES = frozenset({
+        BrandStatus.PENDING, BrandStatus.COLLECTING, BrandStatus.ANALYZING,
+        BrandStatus.COLLECTED, BrandStatus.FAILED
+    })
+    
     def __init__(self, session_folder: str = "sessions"):
         self.sessions_root = session_folder
         self.current_session: Optional[SessionState] = None
+        self._rate_limited_after: Optional[float] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_path: Optional[str] = None
+        self._db_entries = 0
+        # The store is shared by Streamlit's rerun threads and the batch workers
+        self._db_lock = threading.RLock()
+        # (monotonic time, display string) per brand for the session table
+        self._html_size_cache: Dict[str, Tuple[float, str]] = {}
+        # Parsed brand lists per (csv path, mtime), so re-adding the same file skips parsing
+        self._brands_cache: Dict[Tuple[str, float], List[str]] = {}
+        # One browser context reused across brands; it lives on a dedicated
+        # thread because Playwright's sync API is bound to its creating thread
+        self._browser_pool: Optional[ThreadPoolExecutor] = None
+        self._browser_thread: Optional[threading.Thread] = None
+        self._playwright = None
+        self._browser_context = None
+        # Brand names per status (dict keys keep CSV order), kept in step with brands via _set_status
+        self._by_status: Dict[BrandStatus, Dict[str, None]] = {}
         
         # Create sessions directory if it doesn't exist
         os.makedirs(self.sessions_root, exist_ok=True)
@@ -179,20 +347,29 @@ class SessionManager:
         # Use session name as the folder name directly
         session_folder = os.path.join(self.sessions_root, session_name)
         
+        # Creating the folder doubles as the existence check
+        try:
+            Path(session_folder).mkdir(parents=True)
+            is_new_folder = True
+        except FileExistsError:
+            is_new_folder = False
+        
         # Check if session already exists
-        if os.path.exists(session_folder):
+        if not is_new_folder:
             print(f"📁 Found existing session '{session_name}'")
             print("🔄 Will add new brands to existing session...")
             
             # Load existing session
             if self.load_session(session_name):
                 # Parse new brands and add to existing session
-                new_brands_list = self._parse_brands_source(brands_source)
+                new_brands_list = list(dict.fromkeys(self._parse_brands_source(brands_source)))
                 added_count = 0
+                now = datetime.now().isoformat()
                 
                 for brand_name in new_brands_list:
                     if brand_name not in self.current_session.brands:
-                        self.current_session.brands[brand_name] = BrandState(name=brand_name)
+                        self.current_session.brands[brand_name] = BrandState.make(brand_name, now)
+                        self._by_status[BrandStatus.PENDING][brand_name] = None
                         added_count += 1
                         
                 if added_count > 0:
@@ -214,13 +391,11 @@ class SessionManager:
         summary_folder = os.path.join(session_folder, "summary")
         logs_folder = os.path.join(session_folder, "logs")
         
-        os.makedirs(session_folder, exist_ok=True)
-        os.makedirs(html_folder, exist_ok=True)
-        os.makedirs(summary_folder, exist_ok=True)
-        os.makedirs(logs_folder, exist_ok=True)
+        for folder in (html_folder, summary_folder, logs_folder):
+            Path(folder).mkdir(exist_ok=True)
         
         # Parse brands from source
-        brands_list = self._parse_brands_source(brands_source)
+        brands_list = list(dict.fromkeys(self._parse_brands_source(brands_source)))
         
         # Create session configuration  
         config = SessionConfig(
@@ -234,8 +409,9 @@ class SessionManager:
         )
         
         # Initialize brand states
+        now = datetime.now().isoformat()
         brands = {
-            brand_name: BrandState(name=brand_name)
+            brand_name: BrandState.make(brand_name, now)
             for brand_name in brands_list
         }
         
@@ -245,6 +421,8 @@ class SessionManager:
             brands=brands,
             session_folder=session_folder
         )
+        self._rebuild_status_index()
+        self._publish_folders()
         
         # Save initial state
         self._save_session_state()
@@ -296,6 +474,14 @@ class SessionManager:
                 failed_brands=state_data.get('failed_brands', 0)
             )
             
+            # Apply updates recorded since the snapshot was written
+            applied = self._apply_store()
+            if applied:
+                print(f"♻️  Applied {applied} stored brand updates")
+            
+            self._rebuild_status_index()
+            self._publish_folders()
+            
             print(f"✅ Loaded session '{config.session_name}'")
             return True
             
@@ -311,21 +497,24 @@ class SessionManager:
         elif brands_source.endswith('.csv'):
             # CSV file
             try:
-                df = pd.read_csv(brands_source)
-                # Try common column names
-                for col in ['Brand Name', 'Brand', 'brand', 'name', 'Brand_Name']:
-                    if col in df.columns:
-                        return df[col].dropna().tolist()
-                # If no standard column found, use first column
-                return df.iloc[:, 0].dropna().tolist()
+                cache_key = (os.path.abspath(brands_source), os.path.getmtime(brands_source))
+                if cache_key in self._brands_cache:
+                    return list(self._brands_cache[cache_key])
+                
+                # Read only the header to pick the brand column, then parse just that column
+                columns = pd.read_csv(brands_source, nrows=0).columns
+                col = detect_brand_column(columns)  # First column if no standard one is found
+                brands = pd.read_csv(brands_source, usecols=[col], dtype=str, engine='c')[col].dropna().tolist()
+                self._brands_cache[cache_key] = brands
+                return list(brands)
             except Exception as e:
                 print(f"❌ Error reading CSV file: {e}")
                 return []
         elif brands_source.endswith('.txt'):
             # Text file (one brand per line)
             try:
-                with open(brands_source, 'r') as f:
-                    return [line.strip() for line in f if line.strip()]
+                lines = Path(brands_source).read_text().splitlines()
+                return [line.strip() for line in lines if line.strip()]
             except Exception as e:
                 print(f"❌ Error reading text file: {e}")
                 return []
@@ -340,11 +529,16 @@ class SessionManager:
             
         state_file = os.path.join(self.current_session.session_folder, "session_state.json")
         
-        # Convert session state to JSON-serializable format
+        # Convert session state to JSON-serializable format. A shallow
+        # field-by-field copy avoids asdict's recursive deep copy.
+        brand_fields = self._BRAND_FIELDS
         state_data = {
-            'config': asdict(self.current_session.config),
+            'config': vars(self.current_session.config),
             'brands': {
-                name: asdict(brand_state) 
+                name: {
+                    **{field: getattr(brand_state, field) for field in brand_fields},
+                    'status': brand_state.status.value
+                }
                 for name, brand_state in self.current_session.brands.items()
             },
             'session_folder': self.current_session.session_folder,
@@ -355,29 +549,142 @@ class SessionManager:
             'failed_brands': self.current_session.failed_brands
         }
         
-        # Convert enums to strings
-        for brand_data in state_data['brands'].values():
-            if isinstance(brand_data['status'], BrandStatus):
-                brand_data['status'] = brand_data['status'].value
-            else:
-                # Already converted to string in previous save
-                pass
-        
         try:
-            with open(state_file, 'w') as f:
-                json.dump(state_data, f, indent=2, default=str)
+            try:
+                import orjson
+                payload = orjson.dumps(
+                    state_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                )
+            except ImportError:
+                payload = json.dumps(state_data, indent=2, default=str).encode('utf-8')
+            
+            # Write to a temp file, flush it to disk, then rename over the old
+            # snapshot so a crash never leaves a half-written file behind
+            tmp_file = state_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, state_file)
         except Exception as e:
-            print(f"❌ Error saving session state: {e}")
+            print(f"❌ Error saving session state (previous snapshot kept): {e}")
+            try:
+                os.remove(state_file + ".tmp")
+            except OSError:
+                pass
+            return
+        
+        # Snapshot now covers everything in the store
+        self._clear_store()
+    
+    def _get_store(self) -> sqlite3.Connection:
+        """Open (or reuse) the session's SQLite store of per-brand updates; callers hold _db_lock"""
+        store_path = os.path.join(self.current_session.session_folder, self.STORE_FILENAME)
+        if self._db is None or self._db_path != store_path:
+            if self._db is not None:
+                self._db.close()
+            self._db = sqlite3.connect(store_path, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS brand ("
+                "name TEXT PRIMARY KEY, status TEXT NOT NULL, attempts TEXT, "
+                "last_attempt TEXT, updated_at TEXT)"
+            )
+            self._db.execute("CREATE TABLE IF NOT EXISTS config (key TEXT PRIMARY KEY, value TEXT)")
+            self._db_path = store_path
+            self._db_entries = 0
+        return self._db
+    
+    def _log_brand_update(self, brand_name: str, brand_state: BrandState):
+        """Record a single brand's state in the session store"""
+        if not self.current_session:
+            return
+        
+        with self._db_lock:
+            try:
+                db = self._get_store()
+                db.execute("BEGIN")
+                db.execute(
+                    "INSERT OR REPLACE INTO brand VALUES (?, ?, ?, ?, ?)",
+                    (
+                        brand_name,
+                        brand_state.status.value,
+                        json.dumps(brand_state.attempts),
+                        json.dumps(brand_state.last_attempt),
+                        brand_state.updated_at
+                    )
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO config VALUES (?, ?)",
+                    [
+                        ('completed_brands', str(self.current_session.completed_brands)),
+                        ('failed_brands', str(self.current_session.failed_brands))
+                    ]
+                )
+                db.execute("COMMIT")
+                self._db_entries += 1
+            except Exception as e:
+                if self._db is not None and self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+                print(f"❌ Error writing state update: {e}")
+                return
+        
+        if self._db_entries >= self.SNAPSHOT_EVERY:
+            self._save_session_state()
+    
+    def _clear_store(self):
+        """Drop per-brand updates once a snapshot covers them"""
+        with self._db_lock:
+            try:
+                db = self._get_store()
+                db.execute("BEGIN")
+                db.execute("DELETE FROM brand")
+                db.execute("DELETE FROM config")
+                db.execute("COMMIT")
+            except Exception as e:
+                if self._db is not None and self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+                print(f"⚠️  Error clearing state store: {e}")
+            self._db_entries = 0
+    
+    def _apply_store(self) -> int:
+        """Apply stored brand updates on top of the loaded snapshot"""
+        with self._db_lock:
+            db = self._get_store()
+            rows = db.execute("SELECT * FROM brand").fetchall()
+            counters = dict(db.execute("SELECT key, value FROM config"))
+        
+        applied = 0
+        for name, status, attempts, last_attempt, updated_at in rows:
+            brand_state = self.current_session.brands.get(name)
+            if brand_state is None:
+                continue
+            
+            try:
+                brand_state.status = BrandStatus(status)
+            except ValueError:
+                continue
+            brand_state.attempts = json.loads(attempts) if attempts else brand_state.attempts
+            brand_state.last_attempt = json.loads(last_attempt) if last_attempt else brand_state.last_attempt
+            brand_state.updated_at = updated_at or brand_state.updated_at
+            applied += 1
+        
+        if 'completed_brands' in counters:
+            self.current_session.completed_brands = int(counters['completed_brands'])
+        if 'failed_brands' in counters:
+            self.current_session.failed_brands = int(counters['failed_brands'])
+        
+        return applied
     
     def get_session_status(self) -> Dict:
         """Get comprehensive session status"""
         if not self.current_session:
             return {"error": "No active session"}
         
-        status_counts = {}
-        for brand_state in self.current_session.brands.values():
-            status = brand_state.status.value if isinstance(brand_state.status, BrandStatus) else brand_state.status
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = self.get_status_counts()
         
         return {
             "session_id": self.current_session.config.session_id,
@@ -428,55 +735,82 @@ class SessionManager:
             
             self.print_session_table()
             
-            # Multi-phase retry system with progressive wait times
-            retry_phases = [
-                {"wait_minutes": 5, "wait_seconds": 300, "phase_name": "PHASE 2", "description": "First retry after 5 minutes"},
-                {"wait_minutes": 10, "wait_seconds": 600, "phase_name": "PHASE 3", "description": "Second retry after 10 minutes"},
-                {"wait_minutes": 30, "wait_seconds": 1800, "phase_name": "PHASE 4", "description": "Third retry after 30 minutes"},
-                {"wait_minutes": 60, "wait_seconds": 3600, "phase_name": "PHASE 5", "description": "Final retry after 60 minutes"}
-            ]
-            
-            for phase in retry_phases:
+            # Adaptive retry rounds: the first recheck comes after ~5 minutes, the
+            # wait shrinks while brands keep becoming ready and doubles when rounds
+            # are empty or SmartScout throttles us. Rounds and total waiting are
+            # bounded by the old 5/10/30/60 minute schedule (4 rounds, 105 minutes).
+            backoff = AdaptiveBackoff(base=300, cap=3600, factor=2)
+            max_rounds = 4
+            max_total_wait = 105 * 60
+            total_waited = 0
+            round_number = 1
+            
+            while True:
                 # Check for incomplete brands
-                incomplete_brands = self._get_brands_by_status([
-                    BrandStatus.PENDING, BrandStatus.COLLECTING, BrandStatus.ANALYZING, 
-                    BrandStatus.COLLECTED, BrandStatus.FAILED
-                ])
+                # Walk BrandStatus rather than the frozenset, whose order varies between runs
+                incomplete_brands = self._get_brands_by_status(
+                    [status for status in BrandStatus if status in self.INCOMPLETE_STATUSES]
+                )
                 
-                if incomplete_brands:
-                    print(f"\n⏳ {phase['phase_name']}: {phase['description']} ({len(incomplete_brands)} brands remaining)")
-                    print("=" * 60)
-                    print(f"  Brands still processing: {', '.join(incomplete_brands[:5])}{'...' if len(incomplete_brands) > 5 else ''}")
-                    
-                    # Export progress CSV before waiting
-                    print(f"📊 Exporting progress CSV before {phase['wait_minutes']}-minute wait...")
-                    self._export_csv_results()
-                    
-                    self._wait_with_progress(phase['wait_seconds'], f"Waiting {phase['wait_minutes']} minutes for more brands to complete")
-                    
-                    print(f"  🔄 Step A: Re-checking analysis status")
-                    self._batch_recheck_all()
+                if not incomplete_brands:
+                    print(f"\n✅ All brands completed - no more retry rounds needed!")
+                    break
+                
+                wait_seconds = min(backoff.next_wait(), max_total_wait - total_waited)
+                if wait_seconds <= 0:
+                    print(f"\n⌛ Retry wait budget exhausted ({len(incomplete_brands)} brands still incomplete)")
+                    break
+                
+                round_number += 1
+                is_final_round = (total_waited + wait_seconds >= max_total_wait
+                                  or round_number - 1 >= max_rounds)
+                wait_label = f"{wait_seconds // 60}m{wait_seconds % 60:02d}s"
+                
+                print(f"\n⏳ PHASE {round_number}: Retry after {wait_label} ({len(incomplete_brands)} brands remaining)")
+                print("=" * 60)
+                print(f"  Brands still processing: {', '.join(incomplete_brands[:5])}{'...' if len(incomplete_brands) > 5 else ''}")
+                
+                # Export progress CSV before waiting
+                print(f"📊 Exporting progress CSV before {wait_label} wait...")
+                self._export_csv_results()
+                
+                self._wait_with_progress(wait_seconds, f"Waiting {wait_label} for more brands to complete")
+                total_waited += wait_seconds
+                self._rate_limited_after = None
+                
+                print(f"  🔄 Step A: Re-checking analysis status")
+                newly_ready = self._batch_recheck_all()
+                
+                print(f"  📥 Step B: Downloading newly ready reports")
+                self._batch_download_all()
+                
+                print(f"  🤖 Step C: Summarizing newly downloaded reports")
+                self._batch_summarize_all()
+                
+                # For the final round, also retry failed collections
+                if is_final_round:
+                    print(f"  🔄 Step D: Final attempt to collect remaining brands")
+                    self._batch_collect_all()
                     
-                    print(f"  📥 Step B: Downloading newly ready reports")
+                    print(f"  📥 Step E: Download any new reports")
                     self._batch_download_all()
                     
-                    print(f"  🤖 Step C: Summarizing newly downloaded reports")
+                    print(f"  🤖 Step F: Summarize any new reports")
                     self._batch_summarize_all()
-                    
-                    # For the final phase, also retry failed collections
-                    if phase['phase_name'] == "PHASE 5":
-                        print(f"  🔄 Step D: Final attempt to collect remaining brands")
-                        self._batch_collect_all()
-                        
-                        print(f"  📥 Step E: Download any new reports")
-                        self._batch_download_all()
-                        
-                        print(f"  🤖 Step F: Summarize any new reports")
-                        self._batch_summarize_all()
-                    
-                    self.print_session_table()
+                
+                # Adjust the next wait from what this round achieved
+                progress = newly_ready / max(1, len(incomplete_brands))
+                if self._rate_limited_after is not None:
+                    backoff.on_throttle(self._rate_limited_after)
+                elif progress > 0.2:
+                    backoff.on_success()
                 else:
-                    print(f"\n✅ All brands completed - skipping {phase['phase_name']}!")
+                    backoff.on_no_progress()
+                
+                self.print_session_table()
+                
+                if is_final_round:
+                    break
             
             # Mark session as completed
             self.current_session.completed_at = datetime.now().isoformat()
@@ -494,149 +828,256 @@ class SessionManager:
         except Exception as e:
             print(f"\n❌ Session error: {e}")
             self._save_session_state()
+        finally:
+            self._close_browser()
+
+    def _log(self, message: str):
+        """Print a progress line directly, so it stays in order with the downloader's own output"""
+        print(message)
+
+    def _get_browser_pool(self) -> ThreadPoolExecutor:
+        """Single-thread executor that owns the shared browser context"""
+        if self._browser_pool is None:
+            def mark_thread():
+                self._browser_thread = threading.current_thread()
+            
+            self._browser_pool = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="smartscout-browser",
+                initializer=mark_thread
+            )
+        return self._browser_pool
+
+    def _get_browser_context(self):
+        """Shared browser context, launched on first use; None off the browser thread"""
+        if threading.current_thread() is not self._browser_thread:
+            return None
+        
+        if self._browser_context is None:
+            from playwright.sync_api import sync_playwright
+            headless = self.current_session.config.headless
+            self._playwright = sync_playwright().start()
+            self._browser_context = _downloader().launch_report_context(self._playwright, headless)
+        return self._browser_context
+
+    def _close_browser(self):
+        """Close the shared browser context and its thread"""
+        if self._browser_pool is None:
+            return
+        
+        def close():
+            try:
+                if self._browser_context is not None:
+                    self._browser_context.close()
+                if self._playwright is not None:
+                    self._playwright.stop()
+            except Exception as e:
+                print(f"⚠️  Error closing browser: {e}")
+            self._browser_context = None
+            self._playwright = None
+        
+        self._browser_pool.submit(close).result()
+        self._browser_pool.shutdown()
+        self._browser_pool = None
+        self._browser_thread = None
+
+    def _browser_workers(self, requested: int) -> int:
+        """Browser steps run one at a time: Chromium lets only one process hold the profile lock"""
+        if requested > 1:
+            print(f"⚠️  {requested} browser workers requested; using 1 (the persistent profile can only be opened once)")
+        return 1
 
     def _batch_collect_all(self):
         """Collect data for all pending brands"""
         pending_brands = [
-            (name, state) for name, state in self.current_session.brands.items()
-            if state.status == BrandStatus.PENDING
+            (name, self.current_session.brands[name])
+            for name in self._get_brands_by_status([BrandStatus.PENDING])
         ]
         
         if not pending_brands:
             print("ℹ️  No brands need data collection")
             return
-            
-        print(f"🔄 Starting collection for {len(pending_brands)} brands...")
         
-        for i, (brand_name, brand_state) in enumerate(pending_brands, 1):
-            print(f"  📊 Collecting {i}/{len(pending_brands)}: {brand_name}")
-            brand_state.status = BrandStatus.COLLECTING
+        # One timestamp for the whole phase
+        now_iso = datetime.now().isoformat()
+        workers = self._browser_workers(self.current_session.config.collect_workers)
+        print(f"🔄 Starting collection for {len(pending_brands)} brands ({workers} workers)...")
+        
+        for brand_name, brand_state in pending_brands:
+            self._set_status(brand_state, BrandStatus.COLLECTING)
+        
+        # The browser thread only runs the step; brand state is updated on this thread
+        executor = self._get_browser_pool()
+        futures = {
+            executor.submit(self._collect_step_simple, brand_name): (brand_name, brand_state)
+            for brand_name, brand_state in pending_brands
+        }
+        
+        for i, future in enumerate(as_completed(futures), 1):
+            brand_name, brand_state = futures[future]
+            self._log(f"  📊 Collected {i}/{len(pending_brands)}: {brand_name}")
             
             try:
-                result = self._collect_step_simple(brand_name)
+                result = future.result()
                 
                 if result == "no_brand_found":
-                    brand_state.status = BrandStatus.NO_BRAND_FOUND
+                    self._set_status(brand_state, BrandStatus.NO_BRAND_FOUND)
                 elif result == "collected":
-                    brand_state.status = BrandStatus.COLLECTED
+                    self._set_status(brand_state, BrandStatus.COLLECTED)
                 elif result == "analyzing":
-                    brand_state.status = BrandStatus.ANALYZING
+                    self._set_status(brand_state, BrandStatus.ANALYZING)
                 elif result == "analyzed":
-                    brand_state.status = BrandStatus.ANALYZED
+                    self._set_status(brand_state, BrandStatus.ANALYZED)
                 else:
-                    brand_state.status = BrandStatus.FAILED
+                    self._set_status(brand_state, BrandStatus.FAILED)
                     
+            except RateLimited as e:
+                self._log(f"    🚦 {brand_name}: {e} - will retry")
+                self._set_status(brand_state, BrandStatus.PENDING)
+                self._note_rate_limit(e)
             except Exception as e:
-                print(f"    ❌ Error: {e}")
-                brand_state.status = BrandStatus.FAILED
+                self._log(f"    ❌ Error: {e}")
+                self._set_status(brand_state, BrandStatus.FAILED)
             
             # Update attempts and timestamp
             brand_state.attempts["collect"] = 1
-            brand_state.last_attempt["collect"] = datetime.now().isoformat()
+            brand_state.last_attempt["collect"] = now_iso
+            brand_state.updated_at = now_iso
             
-            # Save progress every 5 brands
-            if i % 5 == 0:
-                self._save_session_state()
+            # Log progress for this brand (snapshots happen periodically)
+            self._log_brand_update(brand_name, brand_state)
         
         self._save_session_state()
 
     def _batch_download_all(self):
         """Download HTML for all ready brands"""
         ready_brands = [
-            (name, state) for name, state in self.current_session.brands.items()
-            if state.status == BrandStatus.ANALYZED  # Only download when report is actually ready
+            (name, self.current_session.brands[name])
+            for name in self._get_brands_by_status([BrandStatus.ANALYZED])  # Only download when report is actually ready
         ]
         
         if not ready_brands:
             print("ℹ️  No brands ready for download")
             return
-            
-        print(f"📥 Starting download for {len(ready_brands)} brands...")
         
-        for i, (brand_name, brand_state) in enumerate(ready_brands, 1):
-            print(f"  💾 Downloading {i}/{len(ready_brands)}: {brand_name}")
-            brand_state.status = BrandStatus.DOWNLOADING
+        # One timestamp for the whole phase
+        now_iso = datetime.now().isoformat()
+        workers = self._browser_workers(self.current_session.config.download_workers)
+        print(f"📥 Starting download for {len(ready_brands)} brands ({workers} workers)...")
+        
+        for brand_name, brand_state in ready_brands:
+            self._set_status(brand_state, BrandStatus.DOWNLOADING)
+        
+        executor = self._get_browser_pool()
+        futures = {
+            executor.submit(self._download_step_simple, brand_name): (brand_name, brand_state)
+            for brand_name, brand_state in ready_brands
+        }
+        
+        for i, future in enumerate(as_completed(futures), 1):
+            brand_name, brand_state = futures[future]
+            self._log(f"  💾 Downloaded {i}/{len(ready_brands)}: {brand_name}")
             
             try:
-                result = self._download_step_simple(brand_name)
+                result = future.result()
                 
                 if result == "downloaded":
-                    brand_state.status = BrandStatus.DOWNLOADED
+                    self._set_status(brand_state, BrandStatus.DOWNLOADED)
                 elif result == "incomplete":
-                    print(f"    ⚠️  {brand_name}: File incomplete even after retry - marking as failed")
-                    brand_state.status = BrandStatus.FAILED
+                    self._log(f"    ⚠️  {brand_name}: File incomplete even after retry - marking as failed")
+                    self._set_status(brand_state, BrandStatus.FAILED)
                 else:
-                    brand_state.status = BrandStatus.FAILED
+                    self._set_status(brand_state, BrandStatus.FAILED)
                     
             except Exception as e:
-                print(f"    ❌ Error: {e}")
-                brand_state.status = BrandStatus.FAILED
+                self._log(f"    ❌ Error: {e}")
+                self._set_status(brand_state, BrandStatus.FAILED)
             
             # Update attempts and timestamp
             brand_state.attempts["download"] = 1
-            brand_state.last_attempt["download"] = datetime.now().isoformat()
+            brand_state.last_attempt["download"] = now_iso
+            brand_state.updated_at = now_iso
             
-            # Save progress every 5 brands
-            if i % 5 == 0:
-                self._save_session_state()
+            # Log progress for this brand (snapshots happen periodically)
+            self._log_brand_update(brand_name, brand_state)
         
         self._save_session_state()
 
     def _batch_summarize_all(self):
         """Generate summaries for all downloaded brands"""
         downloaded_brands = [
-            (name, state) for name, state in self.current_session.brands.items()
-            if state.status == BrandStatus.DOWNLOADED
+            (name, self.current_session.brands[name])
+            for name in self._get_brands_by_status([BrandStatus.DOWNLOADED])
         ]
         
         if not downloaded_brands:
             print("ℹ️  No brands ready for summarization")
             return
-            
-        print(f"🤖 Starting summarization for {len(downloaded_brands)} brands...")
         
-        for i, (brand_name, brand_state) in enumerate(downloaded_brands, 1):
-            print(f"  📋 Summarizing {i}/{len(downloaded_brands)}: {brand_name}")
-            brand_state.status = BrandStatus.SUMMARIZING
+        # One timestamp for the whole phase
+        now_iso = datetime.now().isoformat()
+        workers = self.current_session.config.summarize_workers
+        print(f"🤖 Starting summarization for {len(downloaded_brands)} brands ({workers} workers)...")
+        
+        for brand_name, brand_state in downloaded_brands:
+            self._set_status(brand_state, BrandStatus.SUMMARIZING)
+        
+        # Each worker summarizes a group of brands that may share one LLM request
+        batch_size = max(1, self.current_session.config.summarize_batch_size)
+        groups = [
+            downloaded_brands[start:start + batch_size]
+            for start in range(0, len(downloaded_brands), batch_size)
+        ]
+        
+        done = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._summarize_batch_simple, [name for name, _ in group]): group
+                for group in groups
+            }
             
-            try:
-                result = self._summarize_step_simple(brand_name)
+            for future in as_completed(futures):
+                group = futures[future]
                 
-                if result == "summarized":
-                    brand_state.status = BrandStatus.SUMMARIZED
-                    self.current_session.completed_brands += 1
-                else:
-                    brand_state.status = BrandStatus.FAILED
-                    self.current_session.failed_brands += 1
+                try:
+                    results = future.result()
+                except Exception as e:
+                    self._log(f"    ❌ Error: {e}")
+                    results = {}
+                
+                for brand_name, brand_state in group:
+                    done += 1
+                    self._log(f"  📋 Summarized {done}/{len(downloaded_brands)}: {brand_name}")
                     
-            except Exception as e:
-                print(f"    ❌ Error: {e}")
-                brand_state.status = BrandStatus.FAILED
-                self.current_session.failed_brands += 1
-            
-            # Update attempts and timestamp
-            brand_state.attempts["summarize"] = 1
-            brand_state.last_attempt["summarize"] = datetime.now().isoformat()
-            
-            # Save progress every 5 brands
-            if i % 5 == 0:
-                self._save_session_state()
+                    if results.get(brand_name) == "summarized":
+                        self._set_status(brand_state, BrandStatus.SUMMARIZED)
+                        self.current_session.completed_brands += 1
+                    else:
+                        self._set_status(brand_state, BrandStatus.FAILED)
+                        self.current_session.failed_brands += 1
+                    
+                    # Update attempts and timestamp
+                    brand_state.attempts["summarize"] = 1
+                    brand_state.last_attempt["summarize"] = now_iso
+                    brand_state.updated_at = now_iso
+                    
+                    # Log progress for this brand (snapshots happen periodically)
+                    self._log_brand_update(brand_name, brand_state)
         
         self._save_session_state()
 
     def _handle_resume_brands(self):
         """Handle incomplete brands from previous session - retry failed, recheck analyzing/collected"""
-        failed_brands = []
-        recheck_brands = []  # analyzing or collected brands that need status check
-        
-        for name, state in self.current_session.brands.items():
-            # Handle both enum and string status values (from JSON loading)
-            status_value = state.status.value if hasattr(state.status, 'value') else state.status
-            
-            if status_value in ['failed', 'no_brand_found']:
-                failed_brands.append((name, state))
-            elif status_value in ['analyzing', 'collected']:
-                recheck_brands.append((name, state))
+        brands = self.current_session.brands
+        failed_brands = [
+            (name, brands[name])
+            for name in self._get_brands_by_status([BrandStatus.FAILED, BrandStatus.NO_BRAND_FOUND])
+        ]
+        # analyzing or collected brands that need status check
+        recheck_brands = [
+            (name, brands[name])
+            for name in self._get_brands_by_status([BrandStatus.ANALYZING, BrandStatus.COLLECTED])
+        ]
         
         if not failed_brands and not recheck_brands:
             return  # Nothing to resume
@@ -644,31 +1085,54 @@ class SessionManager:
         print(f"\n🔄 RESUME: Handling incomplete brands from previous session")
         print("=" * 60)
         
+        # Brands whose report or summary is already on disk skip straight ahead
+        # instead of costing another SmartScout lookup
+        if not self.current_session.config.force_regenerate:
+            html_sizes = self._scan_folder_sizes(self.current_session.config.html_folder)
+            summary_sizes = self._scan_folder_sizes(self.current_session.config.summary_folder)
+            resumed = set()
+            
+            for name, state in failed_brands + recheck_brands:
+                if summary_sizes.get(state.summary_filename, 0) > 100 and self._has_valid_summary(state):
+                    print(f"   📋 {name}: summary on disk → summarized")
+                    self._leave_failed(state)
+                    self._set_status(state, BrandStatus.SUMMARIZED)
+                    self.current_session.completed_brands += 1
+                    resumed.add(name)
+                elif html_sizes.get(state.html_filename, 0) >= 300_000:  # Same completeness check as download
+                    print(f"   💾 {name}: report on disk → downloaded")
+                    self._leave_failed(state)
+                    self._set_status(state, BrandStatus.DOWNLOADED)
+                    resumed.add(name)
+            
+            if resumed:
+                failed_brands = [(n, s) for n, s in failed_brands if n not in resumed]
+                recheck_brands = [(n, s) for n, s in recheck_brands if n not in resumed]
+        
         # Reset failed and no_brand_found brands to pending for retry
         if failed_brands:
             print(f"♻️  Resetting {len(failed_brands)} failed/not-found brands to retry:")
             for name, state in failed_brands:
-                status_display = state.status.value if hasattr(state.status, 'value') else state.status
-                print(f"   📍 {name}: {status_display} → pending")
-                state.status = BrandStatus.PENDING
+                print(f"   📍 {name}: {state.status.value} → pending")
+                self._leave_failed(state)
+                self._set_status(state, BrandStatus.PENDING)
                 state.errors = []  # Clear previous errors
         
         # Re-check analyzing/collected brands (they might be ready now)
         if recheck_brands:
             print(f"🔍 Re-checking {len(recheck_brands)} incomplete brands:")
             for name, state in recheck_brands:
-                status_value = state.status.value if hasattr(state.status, 'value') else state.status
-                print(f"   📊 Checking {name} (current: {status_value})...")
+                print(f"   📊 Checking {name} (current: {state.status.value})...")
                 try:
-                    result = self._collect_step_simple(name)
+                    result = self._get_browser_pool().submit(self._collect_step_simple, name).result()
                     if result == "analyzed":
-                        state.status = BrandStatus.ANALYZED
+                        self._set_status(state, BrandStatus.ANALYZED)
                         print(f"      ✅ Ready for download!")
                     elif result == "analyzing":
-                        state.status = BrandStatus.ANALYZING
+                        self._set_status(state, BrandStatus.ANALYZING)
                         print(f"      ⏳ Still analyzing...")
                     elif result == "collected":
-                        state.status = BrandStatus.COLLECTED
+                        self._set_status(state, BrandStatus.COLLECTED)
                         print(f"      📊 Collected, waiting for analysis...")
                     else:
                         print(f"      ❓ Status: {result}")
@@ -678,24 +1142,58 @@ class SessionManager:
         self._save_session_state()
         print()
 
+    def _has_valid_summary(self, state: BrandState) -> bool:
+        """Same check the summarize step applies: a summary of more than 100 characters"""
+        path = os.path.join(self.current_session.config.summary_folder, state.summary_filename)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return len(f.read()) > 100
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def _leave_failed(self, state: BrandState):
+        """Take a FAILED brand back out of the failed count before its status changes"""
+        if state.status == BrandStatus.FAILED and self.current_session.failed_brands > 0:
+            self.current_session.failed_brands -= 1
+
+    def _scan_folder_sizes(self, folder_path: str) -> Dict[str, int]:
+        """File name -> size for one folder, from a single directory listing"""
+        try:
+            with os.scandir(folder_path) as entries:
+                return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+        except OSError:
+            return {}
+
     def _wait_with_progress(self, seconds: int, message: str):
-        """Wait with progress indicator"""
+        """Sleep between retry rounds with a progress indicator; skipped when nothing is left to retry"""
         print(f"⏳ {message} - waiting {seconds//60} minutes...")
         
-        for remaining in range(seconds, 0, -30):
-            mins, secs = divmod(remaining, 60)
-            print(f"    🕐 {mins:02d}:{secs:02d} remaining", end='\r')
-            time.sleep(30 if remaining >= 30 else remaining)
+        if not self._has_incomplete():
+            print(f"    ⏩ Nothing left to wait for           ")
+            return
+        
+        # Countdown is cosmetic, so only draw it on an interactive terminal
+        done = threading.Event()
+        if sys.stdout.isatty():
+            deadline = time.monotonic() + seconds
+            
+            def countdown():
+                while not done.wait(30):
+                    mins, secs = divmod(max(0, int(deadline - time.monotonic())), 60)
+                    print(f"    🕐 {mins:02d}:{secs:02d} remaining", end='\r')
+            
+            threading.Thread(target=countdown, daemon=True).start()
         
+        # Nothing changes brand states while the session waits, so this is a plain sleep
+        try:
+            time.sleep(seconds)
+        finally:
+            done.set()  # Stop the countdown even if the wait is interrupted
         print(f"    ✅ Wait complete!                    ")
 
     def _show_final_summary(self):
         """Show comprehensive final results"""
-        status_counts = {}
-        for brand_state in self.current_session.brands.values():
-            # Handle both enum and string status values
-            status = brand_state.status.value if hasattr(brand_state.status, 'value') else brand_state.status
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = self.get_status_counts()
         
         print(f"\n🎯 FINAL RESULTS")
         print("=" * 50)
@@ -745,71 +1243,83 @@ class SessionManager:
                 print(f"⚠️  Original CSV file not found: {original_csv}")
                 return
             
-            df = pd.read_csv(original_csv)
             print(f"📄 Reading original CSV: {original_csv}")
-            print(f"   Rows: {len(df)} | Columns: {len(df.columns)}")
             
             # Find the brand column (same logic as _parse_brands_source)
-            brand_column = None
-            for col in ['Brand Name', 'Brand', 'brand', 'name', 'Brand_Name']:
-                if col in df.columns:
-                    brand_column = col
-                    break
-            
-            if not brand_column:
-                brand_column = df.columns[0]  # Use first column as fallback
+            with open(original_csv, 'r', newline='', encoding='utf-8-sig') as f:
+                columns = csv.DictReader(f).fieldnames or []
+            if not columns:
+                print(f"⚠️  Original CSV has no header: {original_csv}")
+                return
+
+            brand_column = detect_brand_column(columns)
             
             print(f"🏷️  Using brand column: '{brand_column}'")
             
-            # Add Brand Data column if it doesn't exist
-            if "Brand Data" not in df.columns:
-                df["Brand Data"] = ""
+            # Brand Data per lowercased session brand, built once and joined onto each chunk
+            lower_to_brand = {}
+            for session_brand in self.current_session.brands:
+                lower_to_brand.setdefault(session_brand.lower(), session_brand)  # First case-insensitive match wins
             
-            # Load summaries from session and match to CSV rows
-            summaries_loaded = 0
-            for index, row in df.iterrows():
-                brand_name = str(row[brand_column]).strip()
-                if not brand_name or brand_name.lower() == 'nan':
-                    continue
-                
-                # Try to find matching brand in session (case-insensitive)
-                matching_brand = None
-                for session_brand in self.current_session.brands.keys():
-                    if session_brand.lower() == brand_name.lower():
-                        matching_brand = session_brand
-                        break
+            summary_folder = self.current_session.config.summary_folder
+            
+            def read_summary(session_brand):
+                summary_path = os.path.join(summary_folder, self.current_session.brands[session_brand].summary_filename)
+                try:
+                    with open(summary_path, 'r', encoding='utf-8') as f:
+                        return f.read().strip(), True
+                except FileNotFoundError:
+                    return None, False
+                except Exception as e:
+                    return f"Error loading summary: {e}", False
+            
+            # Summary reads are I/O bound, so overlap them on a small thread pool
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                summaries = executor.map(read_summary, lower_to_brand.values())
                 
-                if matching_brand:
-                    # Load summary file for this brand
-                    summary_filename = f"{matching_brand.replace(' ', '_').lower()}_analysis.txt"
-                    summary_path = os.path.join(self.current_session.config.summary_folder, summary_filename)
-                    
-                    if os.path.exists(summary_path):
-                        try:
-                            with open(summary_path, 'r', encoding='utf-8') as f:
-                                summary_content = f.read().strip()
-                            df.at[index, "Brand Data"] = summary_content
-                            summaries_loaded += 1
-                        except Exception as e:
-                            df.at[index, "Brand Data"] = f"Error loading summary: {e}"
+                brand_data = {}
+                summarized = set()
+                for (key, session_brand), (content, found) in zip(lower_to_brand.items(), summaries):
+                    if content is None:
+                        brand_data[key] = f"Summary Status: {self.current_session.brands[session_brand].status.value}"
                     else:
-                        # Check brand status
-                        brand_state = self.current_session.brands[matching_brand]
-                        status_value = brand_state.status.value if hasattr(brand_state.status, 'value') else brand_state.status
-                        df.at[index, "Brand Data"] = f"Summary Status: {status_value}"
-                else:
-                    df.at[index, "Brand Data"] = "Brand not processed in this session"
+                        brand_data[key] = content
+                        if found:
+                            summarized.add(key)
             
             # Save to session folder with _with_brand_data suffix
             original_filename = os.path.basename(original_csv)
-            output_filename = original_filename.replace('.csv', '_with_brand_data.csv')
+            output_filename = original_filename.replace('.csv', RESULT_CSV_SUFFIX)
             output_path = os.path.join(self.current_session.session_folder, output_filename)
             
-            df.to_csv(output_path, index=False)
+            # Stream the original CSV row by row so only one row is held at a time
+            total_rows = 0
+            summaries_loaded = 0
+            with open(original_csv, 'r', newline='', encoding='utf-8-sig') as src, \
+                 open(output_path, 'w', newline='', encoding='utf-8') as out:
+                reader = csv.DictReader(src)
+                fieldnames = list(reader.fieldnames)
+                if "Brand Data" not in fieldnames:
+                    fieldnames.append("Brand Data")
+
+                writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction='ignore')
+                writer.writeheader()
+
+                for row in reader:
+                    total_rows += 1
+                    key = (row.get(brand_column) or '').strip().lower()
+
+                    # Blank brand cells keep whatever Brand Data they already had
+                    if key and key != 'nan':
+                        row["Brand Data"] = brand_data.get(key, "Brand not processed in this session")
+                        if key in summarized:
+                            summaries_loaded += 1
+
+                    writer.writerow(row)
             
             print(f"✅ CSV export completed!")
             print(f"   📄 Output file: {output_path}")
-            print(f"   📊 Summaries loaded: {summaries_loaded}/{len(df)}")
+            print(f"   📊 Summaries loaded: {summaries_loaded}/{total_rows}")
             print(f"   💾 File size: {os.path.getsize(output_path) / 1024:.1f} KB")
             
         except Exception as e:
@@ -817,22 +1327,28 @@ class SessionManager:
 
     def _get_folder_stats(self, folder_path: str) -> tuple:
         """Get folder statistics: (size_string, file_count)"""
-        if not os.path.exists(folder_path):
-            return "0 KB", 0
-            
-        total_size = 0
-        file_count = 0
-        
-        try:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    if not file.startswith('.'):  # Skip hidden files
-                        file_path = os.path.join(root, file)
+        def walk(path):
+            # DirEntry caches type info from the directory listing, so only
+            # regular files cost a stat() call
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from walk(entry.path)
+                    elif not entry.name.startswith('.'):  # Skip hidden files
                         try:
-                            total_size += os.path.getsize(file_path)
-                            file_count += 1
+                            yield entry.stat().st_size
                         except OSError:
                             pass  # Skip files that can't be accessed
+        
+        total_size = 0
+        file_count = 0
+        try:
+            for size in walk(folder_path):
+                total_size += size
+                file_count += 1
+        except FileNotFoundError:
+            # Missing folder: scandir raises, so no separate exists() check is needed
+            return "0 KB", 0
         except OSError:
             return "Error", 0
             
@@ -849,119 +1365,177 @@ class SessionManager:
         return size_str, file_count
 
     def _get_brand_html_size(self, brand_name: str) -> str:
-        """Get HTML file size for a specific brand"""
+        """Get HTML file size for a specific brand (cached briefly across table renders)"""
         if not self.current_session or not self.current_session.config.html_folder:
             return "-"
-            
-        # Generate expected HTML filename
-        html_filename = f"{brand_name.replace(' ', '_').lower()}_report.html"
-        html_file_path = os.path.join(self.current_session.config.html_folder, html_filename)
         
+        cached = self._html_size_cache.get(brand_name)
+        if cached and time.monotonic() - cached[0] < self.HTML_SIZE_TTL:
+            return cached[1]
+        
+        size_str = self._read_brand_html_size(brand_name)
+        self._html_size_cache[brand_name] = (time.monotonic(), size_str)
+        return size_str
+
+    def _read_brand_html_size(self, brand_name: str) -> str:
+        """Stat the brand's HTML file and format its size"""
+        html_file_path = os.path.join(
+            self.current_session.config.html_folder,
+            self.current_session.brands[brand_name].html_filename
+        )
+        
+        # A single stat() both checks for the file and reads its size
         try:
-            if os.path.exists(html_file_path):
-                file_size = os.path.getsize(html_file_path)
-                
-                # Format size nicely
-                if file_size < 1024:
-                    return f"{file_size}B"
-                elif file_size < 1024 * 1024:
-                    return f"{file_size // 1024}KB"
-                elif file_size < 1024 * 1024 * 1024:
-                    return f"{file_size // (1024 * 1024)}MB"
-                else:
-                    return f"{file_size // (1024 * 1024 * 1024)}GB"
-            else:
-                return "-"
+            file_size = os.stat(html_file_path).st_size
+        except FileNotFoundError:
+            return "-"
         except OSError:
             return "Error"
+        
+        # Format size nicely
+        if file_size < 1024:
+            return f"{file_size}B"
+        elif file_size < 1024 * 1024:
+            return f"{file_size // 1024}KB"
+        elif file_size < 1024 * 1024 * 1024:
+            return f"{file_size // (1024 * 1024)}MB"
+        else:
+            return f"{file_size // (1024 * 1024 * 1024)}GB"
 
-    def _get_brands_by_status(self, statuses: list) -> list:
+    def _get_brands_by_status(self, statuses) -> list:
         """Get list of brand names with any of the given statuses"""
         return [
-            name for name, state in self.current_session.brands.items()
-            if state.status in statuses
+            name for status in statuses
+            for name in self._by_status.get(status, ())
         ]
 
-    def _batch_recheck_all(self):
-        """Re-check collect status for brands that might be ready now"""
+    def get_status_counts(self) -> Dict[str, int]:
+        """Brands per status value, read off the status index instead of counting brands"""
+        return {status.value: len(names) for status, names in self._by_status.items() if names}
+
+    def _rebuild_status_index(self):
+        """Build the status -> brand names index in one pass over brands"""
+        self._by_status = {status: {} for status in BrandStatus}
+        for name, state in self.current_session.brands.items():
+            self._by_status[state.status][name] = None
+
+    def _set_status(self, brand_state: BrandState, status: BrandStatus):
+        """Change a brand's status and keep the status index in step"""
+        self._by_status[brand_state.status].pop(brand_state.name, None)
+        brand_state.status = status
+        self._by_status[status][brand_state.name] = None
+        
+        if status == BrandStatus.DOWNLOADED:
+            self._html_size_cache.pop(brand_state.name, None)  # New file on disk
+
+    def _has_incomplete(self) -> bool:
+        """True while any brand is in an incomplete status (no list is built)"""
+        return any(self._by_status.get(status) for status in self.INCOMPLETE_STATUSES)
+
+    def _batch_recheck_all(self) -> int:
+        """Re-check collect status for brands that might be ready now; returns how many became ready"""
         recheck_brands = [
-            (name, state) for name, state in self.current_session.brands.items()
-            if state.status in [BrandStatus.ANALYZING, BrandStatus.COLLECTED]
+            (name, self.current_session.brands[name])
+            for name in self._get_brands_by_status([BrandStatus.ANALYZING, BrandStatus.COLLECTED])
         ]
         
         if not recheck_brands:
             print("ℹ️  No brands need status re-check")
-            return
-            
-        print(f"🔄 Re-checking status for {len(recheck_brands)} brands...")
+            return 0
+            
+        # Re-checks are collect calls, so they share the collect worker setting
+        workers = self._browser_workers(self.current_session.config.collect_workers)
+        print(f"🔄 Re-checking status for {len(recheck_brands)} brands ({workers} workers)...")
+        newly_ready = 0
+        now_iso = datetime.now().isoformat()
+        
+        # The browser thread only runs the step; brand state is updated on this thread
+        executor = self._get_browser_pool()
+        futures = {
+            executor.submit(self._collect_step_simple, brand_name): (brand_name, brand_state)
+            for brand_name, brand_state in recheck_brands
+        }
         
-        for i, (brand_name, brand_state) in enumerate(recheck_brands, 1):
-            print(f"  📊 Re-checking {i}/{len(recheck_brands)}: {brand_name}")
+        for i, future in enumerate(as_completed(futures), 1):
+            brand_name, brand_state = futures[future]
+            self._log(f"  📊 Re-checked {i}/{len(recheck_brands)}: {brand_name}")
             
             try:
-                result = self._collect_step_simple(brand_name)
+                result = future.result()
                 
                 if result == "analyzed":
-                    brand_state.status = BrandStatus.ANALYZED
-                    print(f"    ✅ {brand_name} is now ready for download!")
+                    self._set_status(brand_state, BrandStatus.ANALYZED)
+                    newly_ready += 1
+                    self._log(f"    ✅ {brand_name} is now ready for download!")
                 elif result == "analyzing":
-                    brand_state.status = BrandStatus.ANALYZING
-                    print(f"    ⏳ {brand_name} still analyzing...")
+                    self._set_status(brand_state, BrandStatus.ANALYZING)
+                    self._log(f"    ⏳ {brand_name} still analyzing...")
                 # Keep other statuses as they were
                     
+            except RateLimited as e:
+                self._log(f"    🚦 {brand_name}: {e}")
+                self._note_rate_limit(e)
             except Exception as e:
-                print(f"    ❌ Error re-checking {brand_name}: {e}")
+                self._log(f"    ❌ Error re-checking {brand_name}: {e}")
+            
+            brand_state.updated_at = now_iso
             
-            # Save progress every 5 brands
-            if i % 5 == 0:
-                self._save_session_state()
+            # Log progress for this brand (snapshots happen periodically)
+            self._log_brand_update(brand_name, brand_state)
         
         self._save_session_state()
+        return newly_ready
+
+    def _publish_folders(self):
+        """Expose the session folders as module globals once per session (for backward compatibility)"""
+        cfg = self.current_session.config
+        globals()['_html_folder'] = cfg.html_folder
+        globals()['_summary_folder'] = cfg.summary_folder
+
+    def _note_rate_limit(self, error: RateLimited):
+        """Remember the longest Retry-After seen during the current round"""
+        self._rate_limited_after = max(self._rate_limited_after or 0, error.retry_after or 0)
 
     def _collect_step_simple(self, brand_name: str) -> str:
         """Execute data collection step without retries"""
-        # Set global folder paths for the existing functions
-        globals()['_html_folder'] = self.current_session.config.html_folder
-        globals()['_summary_folder'] = self.current_session.config.summary_folder
-        
-        result = collect_brand_data(
+        cfg = self.current_session.config
+        result = _downloader().collect_brand_data(
             brand_name, 
             return_result=True, 
-            headless=self.current_session.config.headless
+            headless=cfg.headless,
+            context=self._get_browser_context()
         )
         
+        if result == "rate_limited":
+            raise RateLimited(getattr(_downloader(), '_last_retry_after', None))
+        
         return result
 
     def _download_step_simple(self, brand_name: str) -> str:
         """Execute HTML download step without retries"""
-        # Set global folder paths (for backward compatibility)
-        globals()['_html_folder'] = self.current_session.config.html_folder
-        globals()['_summary_folder'] = self.current_session.config.summary_folder
-        
-        result = download_html_only(
+        cfg = self.current_session.config
+        result = _downloader().download_html_only(
             brand_name,
-            headless=self.current_session.config.headless,
+            headless=cfg.headless,
             return_result=True,
-            html_folder=self.current_session.config.html_folder,
-            force_regenerate=self.current_session.config.force_regenerate
+            html_folder=cfg.html_folder,
+            force_regenerate=cfg.force_regenerate,
+            context=self._get_browser_context()
         )
         
         return result if result else "failed"
 
     def _summarize_step_simple(self, brand_name: str) -> str:
         """Execute summary generation step without retries"""
-        # Set global folder paths (for backward compatibility)
-        globals()['_html_folder'] = self.current_session.config.html_folder
-        globals()['_summary_folder'] = self.current_session.config.summary_folder
-        
+        cfg = self.current_session.config
         try:
-            summary = summarize_html(
+            summary = _downloader().summarize_html(
                 brand_name,
-                model_provider=self.current_session.config.model_provider,
-                model_name=self.current_session.config.model_name,
-                force_regenerate=self.current_session.config.force_regenerate,
-                html_folder=self.current_session.config.html_folder,
-                summary_folder=self.current_session.config.summary_folder
+                model_provider=cfg.model_provider,
+                model_name=cfg.model_name,
+                force_regenerate=cfg.force_regenerate,
+                html_folder=cfg.html_folder,
+                summary_folder=cfg.summary_folder
             )
             
             return "summarized" if summary and len(summary) > 100 else "failed"
@@ -969,29 +1543,52 @@ class SessionManager:
         except Exception as e:
             return "failed"
 
+    def _summarize_batch_simple(self, brand_names: List[str]) -> Dict[str, str]:
+        """Execute summary generation for several brands, sharing LLM requests where possible"""
+        cfg = self.current_session.config
+        try:
+            summaries = _downloader().summarize_html_batch(
+                brand_names,
+                model_provider=cfg.model_provider,
+                model_name=cfg.model_name,
+                force_regenerate=cfg.force_regenerate,
+                html_folder=cfg.html_folder,
+                summary_folder=cfg.summary_folder,
+                max_batch=cfg.summarize_batch_size
+            )
+        except Exception as e:
+            # Don't let one brand's error fail the whole group: retry each brand on its own
+            print(f"⚠️  Batched summary failed ({e}); summarizing {len(brand_names)} brands individually")
+            return {name: self._summarize_step_simple(name) for name in brand_names}
+        
+        return {
+            name: "summarized" if summary and len(summary) > 100 else "failed"
+            for name, summary in summaries.items()
+        }
+
     def _process_brand(self, brand_name: str, brand_state: BrandState):
         """Process a single brand through the complete workflow"""
         
         # Step 1: Collect data
         if brand_state.status == BrandStatus.PENDING:
-            brand_state.status = BrandStatus.COLLECTING
-            self._save_session_state()
+            self._set_status(brand_state, BrandStatus.COLLECTING)
+            self._log_brand_update(brand_name, brand_state)
             
             result = self._execute_step("collect", brand_name, brand_state)
             if result == StepResult.SUCCESS:
                 # Determine next status based on collect result
                 collect_result = getattr(brand_state, 'collect_result', 'collected')
                 if collect_result == "no_brand_found":
-                    brand_state.status = BrandStatus.NO_BRAND_FOUND
+                    self._set_status(brand_state, BrandStatus.NO_BRAND_FOUND)
                     return
                 elif collect_result == "collected":
-                    brand_state.status = BrandStatus.COLLECTED
+                    self._set_status(brand_state, BrandStatus.COLLECTED)
                 elif collect_result == "analyzing":
-                    brand_state.status = BrandStatus.ANALYZING
+                    self._set_status(brand_state, BrandStatus.ANALYZING)
                 elif collect_result == "analyzed":
-                    brand_state.status = BrandStatus.ANALYZED
+                    self._set_status(brand_state, BrandStatus.ANALYZED)
             elif result == StepResult.FAIL:
-                brand_state.status = BrandStatus.FAILED
+                self._set_status(brand_state, BrandStatus.FAILED)
                 return
         
         # Step 2: Wait for analysis completion and download HTML
@@ -1001,39 +1598,40 @@ class SessionManager:
                 print(f"   ⏳ Waiting for analysis to complete...")
                 time.sleep(30)  # Wait before checking download
             
-            brand_state.status = BrandStatus.DOWNLOADING
-            self._save_session_state()
+            self._set_status(brand_state, BrandStatus.DOWNLOADING)
+            self._log_brand_update(brand_name, brand_state)
             
             result = self._execute_step("download", brand_name, brand_state)
             if result == StepResult.SUCCESS:
-                brand_state.status = BrandStatus.DOWNLOADED
+                self._set_status(brand_state, BrandStatus.DOWNLOADED)
             elif result == StepResult.FAIL:
-                brand_state.status = BrandStatus.FAILED
+                self._set_status(brand_state, BrandStatus.FAILED)
                 return
         
         # Step 3: Generate summary
         if brand_state.status == BrandStatus.DOWNLOADED:
-            brand_state.status = BrandStatus.SUMMARIZING
-            self._save_session_state()
+            self._set_status(brand_state, BrandStatus.SUMMARIZING)
+            self._log_brand_update(brand_name, brand_state)
             
             result = self._execute_step("summarize", brand_name, brand_state)
             if result == StepResult.SUCCESS:
-                brand_state.status = BrandStatus.SUMMARIZED
+                self._set_status(brand_state, BrandStatus.SUMMARIZED)
                 self.current_session.completed_brands += 1
             elif result == StepResult.FAIL:
-                brand_state.status = BrandStatus.FAILED
+                self._set_status(brand_state, BrandStatus.FAILED)
                 self.current_session.failed_brands += 1
     
     def _execute_step(self, step: str, brand_name: str, brand_state: BrandState) -> StepResult:
         """Execute a single processing step with retry logic"""
         
-        max_retries = self.current_session.config.max_retries
-        retry_delay = self.current_session.config.retry_delays.get(step, 60)
+        cfg = self.current_session.config
+        max_retries = cfg.max_retries
+        retry_delay = cfg.retry_delays.get(step, 60)
         
         for attempt in range(max_retries + 1):
             if attempt > 0:
                 print(f"   🔄 Retry {attempt}/{max_retries} for {step}")
-                time.sleep(retry_delay * attempt)  # Exponential backoff
+                time.sleep(retry_delay * attempt)  # Linear backoff
             
             try:
                 brand_state.attempts[step] = attempt + 1
@@ -1065,15 +1663,13 @@ class SessionManager:
     
     def _collect_step(self, brand_name: str) -> StepResult:
         """Execute data collection step"""
+        cfg = self.current_session.config
         print(f"   📊 Collecting data for {brand_name}...")
         
-        # Set global folder paths for the existing functions
-        os.environ['_html_folder'] = self.current_session.config.html_folder
-        
-        result = collect_brand_data(
+        result = _downloader().collect_brand_data(
             brand_name, 
             return_result=True, 
-            headless=self.current_session.config.headless
+            headless=cfg.headless
         )
         
         # Store the collect result for status determination
@@ -1089,14 +1685,12 @@ class SessionManager:
     
     def _download_step(self, brand_name: str) -> StepResult:
         """Execute HTML download step"""
+        cfg = self.current_session.config
         print(f"   📥 Downloading HTML for {brand_name}...")
         
-        # Set global folder paths
-        globals()['_html_folder'] = self.current_session.config.html_folder
-        
-        result = download_html_only(
+        result = _downloader().download_html_only(
             brand_name,
-            headless=self.current_session.config.headless,
+            headless=cfg.headless,
             return_result=True
         )
         
@@ -1109,18 +1703,15 @@ class SessionManager:
     
     def _summarize_step(self, brand_name: str) -> StepResult:
         """Execute summary generation step"""
+        cfg = self.current_session.config
         print(f"   🤖 Generating summary for {brand_name}...")
         
-        # Set global folder paths
-        globals()['_html_folder'] = self.current_session.config.html_folder
-        globals()['_summary_folder'] = self.current_session.config.summary_folder
-        
         try:
-            summary = summarize_html(
+            summary = _downloader().summarize_html(
                 brand_name,
-                model_provider=self.current_session.config.model_provider,
-                model_name=self.current_session.config.model_name,
-                force_regenerate=self.current_session.config.force_regenerate
+                model_provider=cfg.model_provider,
+                model_name=cfg.model_name,
+                force_regenerate=cfg.force_regenerate
             )
             
             if summary and len(summary) > 100:  # Basic validation
@@ -1153,10 +1744,7 @@ class SessionManager:
             print(f"   • {status_name.title()}: {count}")
         
         # Show failed brands
-        failed_brands = [
-            name for name, brand in self.current_session.brands.items()
-            if brand.status == BrandStatus.FAILED
-        ]
+        failed_brands = self._get_brands_by_status([BrandStatus.FAILED])
         
         if failed_brands:
             print(f"\n❌ Failed Brands:")
@@ -1185,18 +1773,23 @@ class SessionManager:
         print(f"Session: {self.current_session.config.session_name} ({self.current_session.config.session_id})")
         print("-" * 95)
         
+        # One format string shared by the header and every row
+        row_format = (f"{{:<{max_brand_width}}} | "
+                      f"{{:<{status_width}}} | "
+                      f"{{:<{attempt_width}}} | "
+                      f"{{:<{attempt_width}}} | "
+                      f"{{:<{attempt_width}}} | "
+                      f"{{:<{size_width}}} | "
+                      f"{{:<{time_width}}}")
+        
         # Header row
-        header_row = (f"{'Brand Name':<{max_brand_width}} | "
-                     f"{'Status':<{status_width}} | "
-                     f"{'Collect':<{attempt_width}} | "
-                     f"{'Download':<{attempt_width}} | "
-                     f"{'Summary':<{attempt_width}} | "
-                     f"{'HTML Size':<{size_width}} | "
-                     f"{'Updated':<{time_width}}")
+        header_row = row_format.format('Brand Name', 'Status', 'Collect', 'Download', 'Summary', 'HTML Size', 'Updated')
         print(header_row)
         print("-" * len(header_row))
         
-        # Brand rows
+        # Brand rows are buffered and written in one go
+        rows = []
+        rows_append = rows.append
         for brand_name, brand_state in self.current_session.brands.items():
             # Truncate brand name if too long
             display_name = brand_name[:max_brand_width-2] + ".." if len(brand_name) > max_brand_width else brand_name
@@ -1209,14 +1802,9 @@ class SessionManager:
             # Format last updated time
             last_updated = "Never"
             if brand_state.last_attempt:
-                latest_time = max(brand_state.last_attempt.values()) if brand_state.last_attempt else None
+                latest_time = max(brand_state.last_attempt.values())
                 if latest_time:
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(latest_time.replace('Z', '+00:00'))
-                        last_updated = dt.strftime("%H:%M:%S")
-                    except:
-                        last_updated = "Unknown"
+                    last_updated = _clock_time(latest_time)
             
             # Status with emoji
             status_display = self._get_status_display(brand_state.status)
@@ -1224,22 +1812,18 @@ class SessionManager:
             # Get HTML file size
             html_size = self._get_brand_html_size(brand_name)
             
-            row = (f"{display_name:<{max_brand_width}} | "
-                  f"{status_display:<{status_width}} | "
-                  f"{collect_status:<{attempt_width}} | "
-                  f"{download_status:<{attempt_width}} | "
-                  f"{summary_status:<{attempt_width}} | "
-                  f"{html_size:<{size_width}} | "
-                  f"{last_updated:<{time_width}}")
-            print(row)
+            rows_append(row_format.format(
+                display_name, status_display, collect_status, download_status,
+                summary_status, html_size, last_updated
+            ))
+        
+        if rows:
+            sys.stdout.write("\n".join(rows))
+            sys.stdout.write("\n")
         
         # Summary footer
         print("-" * len(header_row))
-        status_counts = {}
-        for brand_state in self.current_session.brands.values():
-            # Handle both enum and string status values
-            status = brand_state.status.value if hasattr(brand_state.status, 'value') else brand_state.status
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = self.get_status_counts()
         
         summary_parts = []
         for status, count in sorted(status_counts.items()):
@@ -1248,39 +1832,9 @@ class SessionManager:
         print(f"Summary: {' | '.join(summary_parts)}")
         print("=" * 80)
 
-    def _get_status_display(self, status) -> str:
+    def _get_status_display(self, status: BrandStatus) -> str:
         """Get status with emoji for display"""
-        # Create mappings for both enum and string values
-        status_emojis = {
-            BrandStatus.PENDING: "⏳ pending",
-            "pending": "⏳ pending",
-            BrandStatus.COLLECTING: "🔄 collecting",
-            "collecting": "🔄 collecting", 
-            BrandStatus.NO_BRAND_FOUND: "❌ not found",
-            "no_brand_found": "❌ not found",
-            BrandStatus.COLLECTED: "✅ collected",
-            "collected": "✅ collected",
-            BrandStatus.ANALYZING: "⚡ analyzing",
-            "analyzing": "⚡ analyzing",
-            BrandStatus.ANALYZED: "📊 analyzed",
-            "analyzed": "📊 analyzed", 
-            BrandStatus.DOWNLOADING: "📥 downloading",
-            "downloading": "📥 downloading",
-            BrandStatus.DOWNLOADED: "💾 downloaded",
-            "downloaded": "💾 downloaded",
-            BrandStatus.SUMMARIZING: "🤖 summarizing",
-            "summarizing": "🤖 summarizing",
-            BrandStatus.SUMMARIZED: "📋 summarized",
-            "summarized": "📋 summarized",
-            BrandStatus.FAILED: "💥 failed",
-            "failed": "💥 failed",
-            BrandStatus.SKIPPED: "⏭️ skipped",
-            "skipped": "⏭️ skipped"
-        }
-        
-        # Handle both enum and string status values
-        status_value = status.value if hasattr(status, 'value') else status
-        return status_emojis.get(status, status_emojis.get(status_value, f"❓ {status_value}"))
+        return STATUS_DISPLAY[status]
 
 
 def main():
@@ -1289,65 +1843,45 @@ def main():
         print_usage()
         return
     
-    manager = SessionManager()
+    parser = argparse.ArgumentParser(prog='smartscout_session_manager', add_help=False)
+    commands = parser.add_mutually_exclusive_group(required=True)
+    commands.add_argument('--start', metavar='BRANDS_SOURCE')
+    commands.add_argument('--resume', metavar='SESSION_ID')
+    commands.add_argument('--status', metavar='SESSION_ID')
+    commands.add_argument('--list', action='store_true')
+    commands.add_argument('--help', '-h', action='store_true')
+    parser.add_argument('--session-name', default=None)
+    parser.add_argument('--headless', action='store_true')
+    parser.add_argument('--max-retries', type=int, default=3)
+    args = parser.parse_args()
     
-    command = sys.argv[1]
+    if args.help:
+        print_usage()
+        return
     
-    if command == "--start":
-        if len(sys.argv) < 3:
-            print("❌ Usage: --start <brands_source> --session-name <name> [options]")
-            return
-            
-        brands_source = sys.argv[2]
-        
-        # Parse additional arguments
-        kwargs = {}
-        if "--session-name" in sys.argv:
-            idx = sys.argv.index("--session-name")
-            if idx + 1 < len(sys.argv):
-                kwargs['session_name'] = sys.argv[idx + 1]
-            else:
-                kwargs['session_name'] = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        else:
-            kwargs['session_name'] = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        if "--headless" in sys.argv:
+    manager = SessionManager()
+    
+    if args.start:
+        kwargs = {
+            'session_name': args.session_name or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            'max_retries': args.max_retries
+        }
+        if args.headless:
             kwargs['headless'] = True
-        if "--max-retries" in sys.argv:
-            idx = sys.argv.index("--max-retries")
-            if idx + 1 < len(sys.argv):
-                kwargs['max_retries'] = int(sys.argv[idx + 1])
         
-        session_id = manager.create_session(brands_source=brands_source, **kwargs)
+        session_id = manager.create_session(brands_source=args.start, **kwargs)
         manager.run_session()
         
-    elif command == "--resume":
-        if len(sys.argv) < 3:
-            print("❌ Usage: --resume <session_id>")
-            return
-            
-        session_id = sys.argv[2]
-        if manager.load_session(session_id):
+    elif args.resume:
+        if manager.load_session(args.resume):
             manager.run_session()
     
-    elif command == "--status":
-        if len(sys.argv) < 3:
-            print("❌ Usage: --status <session_id>")
-            return
-            
-        session_id = sys.argv[2]
-        if manager.load_session(session_id):
+    elif args.status:
+        if manager.load_session(args.status):
             manager.print_session_summary()
     
-    elif command == "--list":
+    elif args.list:
         list_sessions(manager.sessions_root)
-    
-    elif command == "--help" or command == "-h":
-        print_usage()
-    
-    else:
-        print(f"❌ Unknown command: {command}")
-        print_usage()
 
 
 def list_sessions(sessions_root: str):
@@ -6,135 +6,297 @@ No complex session management, just like running the CLI tool
 
 import streamlit as st
 import os
+import json
+import hashlib
+import atexit
+import shutil
+import contextlib
 import tempfile
 from pathlib import Path
-import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
+from collections import Counter
 
-def check_smartscout_auth():
-    """Check if SmartScout is authenticated using same method as session manager"""
-    try:
+from smartscout_session_manager import SessionManager, RESULT_CSV_SUFFIX
+
+# Status emoji mapping for the session table, keyed by status value
+STATUS_EMOJI = {
+    'pending': '⏳',
+    'collecting': '🔄',
+    'no_brand_found': '❌',
+    'collected': '📊',
+    'analyzing': '⏳', 
+    'analyzed': '✅',
+    'downloading': '📥',
+    'downloaded': '📄',
+    'summarizing': '🤖',
+    'summarized': '✅',
+    'failed': '❌'
+}
+
+# Result CSVs above this size are handed to the download button as an open file
+LARGE_DOWNLOAD_BYTES = 5 * 1024 * 1024
+
+@st.cache_resource
+def get_playwright_worker():
+    """Single thread that owns one long-lived Playwright driver (sync Playwright objects are thread-bound)"""
+    driver = {}
+    
+    def start_driver():
         from playwright.sync_api import sync_playwright
-        import tempfile
-        
-        USER_DATA_DIR = "./playwright_user_data"
-        SMARTSCOUT_URL = "https://app.smartscout.com/app/tailored-report"
-        
-        with sync_playwright() as p:
-            try:
-                context = p.chromium.launch_persistent_context(
-                    USER_DATA_DIR, 
-                    headless=True,
-                    timeout=15000
-                )
-                page = context.new_page()
-                page.goto(SMARTSCOUT_URL, timeout=15000)
-                page.wait_for_load_state("domcontentloaded", timeout=10000)
-                
-                current_url = page.url
-                context.close()
-                
-                # Check if we reached the tailored-report page (authenticated)
-                return "tailored-report" in current_url
-                
-            except Exception as e:
+        driver['playwright'] = sync_playwright().start()
+    
+    executor = ThreadPoolExecutor(
+        max_workers=1,
+        thread_name_prefix="smartscout-playwright",
+        initializer=start_driver
+    )
+    
+    def stop_driver():
+        def stop():
+            if 'playwright' in driver:
+                driver.pop('playwright').stop()
+        try:
+            executor.submit(stop).result(timeout=10)
+        except Exception:
+            pass
+        executor.shutdown(wait=False)
+    
+    atexit.register(stop_driver)
+    return executor, driver
+
+def run_with_playwright(fn):
+    """Run fn(playwright) on the Playwright worker thread and return its result"""
+    executor, driver = get_playwright_worker()
+    return executor.submit(lambda: fn(driver['playwright'])).result()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def check_smartscout_auth():
+    """Check if SmartScout is authenticated using same method as session manager (cached for 5 minutes)"""
+    USER_DATA_DIR = "./playwright_user_data"
+    SMARTSCOUT_URL = "https://app.smartscout.com/app/tailored-report"
+    
+    _, driver = get_playwright_worker()
+    
+    def check(p):
+        if 'login_context' in driver:
+            return False  # Login window still open and holding the profile; 'Check Auth Status' closes it first
+        context = None
+        try:
+            context = p.chromium.launch_persistent_context(
+                USER_DATA_DIR, 
+                headless=True,
+                timeout=15000
+            )
+            page = context.new_page()
+            # Only the URL after redirects matters, so don't wait for subresources to load
+            page.goto(SMARTSCOUT_URL, wait_until="domcontentloaded", timeout=10000)
+            
+            # Check if we reached the tailored-report page (authenticated)
+            return "tailored-report" in page.url
+            
+        except Exception as e:
+            return False
+        finally:
+            if context is not None:
                 try:
                     context.close()
                 except:
                     pass
-                return False
-                
+    
+    try:
+        return run_with_playwright(check)
     except Exception as e:
         print(f"Auth check error: {e}")
         return False
 
 def open_smartscout_login():
     """Open SmartScout login page in browser for user authentication"""
+    USER_DATA_DIR = "./playwright_user_data"
+    LOGIN_URL = "https://app.smartscout.com/sessions/signin"
+    
+    # Any earlier login window still holds the profile lock
+    close_smartscout_login()
+    _, driver = get_playwright_worker()
+    
+    def open_login(p):
+        context = p.chromium.launch_persistent_context(
+            USER_DATA_DIR, 
+            headless=False,  # Show browser for login
+            slow_mo=500
+        )
+        page = context.new_page()
+        page.goto(LOGIN_URL)
+        # The driver outlives this call, so the window stays open until the user closes it
+        # or close_smartscout_login() releases the profile before the next auth check or session
+        driver['login_context'] = context
+    
     try:
-        from playwright.sync_api import sync_playwright
+        run_with_playwright(open_login)
         
-        USER_DATA_DIR = "./playwright_user_data"
-        LOGIN_URL = "https://app.smartscout.com/sessions/signin"
+        st.info("🌐 Browser opened for SmartScout login. Please log in, close the browser window, then click 'Check Auth Status'.")
         
-        with sync_playwright() as p:
-            context = p.chromium.launch_persistent_context(
-                USER_DATA_DIR, 
-                headless=False,  # Show browser for login
-                slow_mo=500
-            )
-            page = context.new_page()
-            page.goto(LOGIN_URL)
-            
-            st.info("🌐 Browser opened for SmartScout login. Please log in and then close the browser window.")
-            
-            # Keep the browser open until user closes it
-            # We don't need to wait - user will check status manually
-            
     except Exception as e:
         st.error(f"❌ Error opening browser: {e}")
 
-def display_session_table(session_manager):
-    """Display session progress table like terminal version"""
-    if not session_manager.current_session:
-        st.warning("No active session")
-        return
+def close_smartscout_login():
+    """Close the login window's persistent context, if any, so USER_DATA_DIR can be opened again"""
+    _, driver = get_playwright_worker()
     
-    session = session_manager.current_session
+    def close_login(p):
+        context = driver.pop('login_context', None)
+        if context is not None:
+            try:
+                context.close()
+            except Exception:
+                pass  # The user already closed the window
     
-    # Create table data
-    rows = []
+    try:
+        run_with_playwright(close_login)
+    except Exception as e:
+        print(f"Login browser close error: {e}")
+
+def result_scan_key(root):
+    """Latest mtime of the sessions root and its session folders, where result CSVs are written"""
+    try:
+        mtime = os.stat(root).st_mtime
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    mtime = max(mtime, entry.stat().st_mtime)
+        return mtime
+    except OSError:
+        return None
+
+def find_latest_result_csv(root):
+    """Return the newest *_with_brand_data.csv under root (one stat per match), or None"""
+    latest, latest_ctime = None, None
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(RESULT_CSV_SUFFIX):
+                        ctime = entry.stat().st_ctime
+                        if latest_ctime is None or ctime > latest_ctime:
+                            latest, latest_ctime = entry.path, ctime
+        except OSError:
+            continue
+    return latest
+
+def session_state_mtime(working_dir, session_name):
+    """Latest modification time of a session's snapshot and update store"""
+    session_folder = os.path.join(working_dir, session_name)
+    mtime = 0.0
+    for filename in ("session_state.json", "session.db", "session.db-wal"):
+        try:
+            mtime = max(mtime, os.stat(os.path.join(session_folder, filename)).st_mtime)
+        except OSError:
+            pass
+    return mtime
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_session_rows(working_dir, session_name, state_mtime):
+    """Progress table columns for a session, re-read only when state_mtime changes"""
+    session_manager = SessionManager(working_dir)
+    
+    if not session_manager.load_session(session_name):
+        return None
+    return session_table_columns(session_manager.current_session)
+
+def session_table_columns(session):
+    """Build progress table columns like terminal version"""
+    names, raw_statuses, statuses, collect, download, summary, last_update = [], [], [], [], [], [], []
     for name, state in session.brands.items():
-        # Handle both enum and string status values
-        status = state.status.value if hasattr(state.status, 'value') else state.status
+        status = state.status.value
+        attempts = state.attempts
+        last_attempt = state.last_attempt
         
-        # Status emoji mapping
-        status_emoji = {
-            'pending': '⏳',
-            'collecting': '🔄',
-            'no_brand_found': '❌',
-            'collected': '📊',
-            'analyzing': '⏳', 
-            'analyzed': '✅',
-            'downloading': '📥',
-            'downloaded': '📄',
-            'summarizing': '🤖',
-            'summarized': '✅',
-            'failed': '❌'
-        }
-        
-        rows.append({
-            'Brand': name,
-            'Status': f"{status_emoji.get(status, '❓')} {status.title().replace('_', ' ')}",
-            'Collect': '✅' if state.attempts.get('collect', 0) > 0 else '⏳',
-            'Download': '✅' if state.attempts.get('download', 0) > 0 else '⏳', 
-            'Summary': '✅' if state.attempts.get('summarize', 0) > 0 else '⏳',
-            'Last Update': state.last_attempt.get('summarize', 
-                          state.last_attempt.get('download', 
-                          state.last_attempt.get('collect', 'Never')))[:10] if state.last_attempt else 'Never'
-        })
+        names.append(name)
+        raw_statuses.append(status)
+        statuses.append(f"{STATUS_EMOJI.get(status, '❓')} {status.title().replace('_', ' ')}")
+        collect.append('✅' if attempts.get('collect', 0) > 0 else '⏳')
+        download.append('✅' if attempts.get('download', 0) > 0 else '⏳')
+        summary.append('✅' if attempts.get('summarize', 0) > 0 else '⏳')
+        last_update.append(next(
+            (last_attempt[step] for step in ('summarize', 'download', 'collect') if step in last_attempt),
+            'Never'
+        )[:10] if last_attempt else 'Never')
     
-    if rows:
-        df = pd.DataFrame(rows)
-        st.dataframe(df, use_container_width=True)
+    return {
+        'Brand': names,
+        'Status': statuses,
+        'Collect': collect,
+        'Download': download,
+        'Summary': summary,
+        'Last Update': last_update,
+        '_raw_status': raw_statuses  # For the metrics; not displayed
+    }
+
+def display_session_table(columns):
+    """Display session progress table like terminal version"""
+    statuses = columns['Status']
+    if statuses:
+        # Streamlit renders the column lists directly; no DataFrame is needed for a display-only table
+        status_counts = Counter(columns['_raw_status'])
+        st.dataframe(
+            {name: values for name, values in columns.items() if name != '_raw_status'},
+            use_container_width=True
+        )
         
         # Summary stats
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total", len(rows))
+            st.metric("Total", len(statuses))
         with col2:
-            completed = sum(1 for row in rows if 'summarized' in row['Status'].lower())
+            completed = status_counts['summarized']
             st.metric("Completed", completed)
         with col3:
-            failed = sum(1 for row in rows if 'failed' in row['Status'].lower() or 'not found' in row['Status'].lower())
+            failed = status_counts['failed'] + status_counts['no_brand_found']
             st.metric("Failed", failed)
         with col4:
-            in_progress = len(rows) - completed - failed
+            in_progress = len(statuses) - completed - failed
             st.metric("In Progress", in_progress)
     else:
         st.info("No brands in session yet")
 
+@st.cache_resource
+def get_session_executor():
+    """Single background worker for session runs (they share one browser profile)"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="smartscout-session")
+
+@st.fragment(run_every=2)
+def show_processing_progress(session_name):
+    """Progress view for the running session; reruns on its own every 2 seconds"""
+    future = st.session_state.get('processor_future')
+    if not (future and not future.done()):
+        # Processing finished - rerun the full script to show the results section
+        st.rerun()
+        return
+    
+    st.info("⏳ Processing in progress... Check terminal for detailed logs.")
+    
+    # Try to show progress table if session exists; unchanged sessions come from the cache
+    if st.session_state.get('_sm_load_disabled'):
+        return
+    
+    try:
+        working_dir = os.path.join(tempfile.gettempdir(), "smartscout_sessions")
+        state_mtime = session_state_mtime(working_dir, session_name)
+        rows = load_session_rows(working_dir, session_name, state_mtime) if state_mtime else None
+        
+        if rows is not None:
+            st.subheader("📊 Progress Table")
+            display_session_table(rows)
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass  # Session files are mid-write; try again on the next refresh
+    except Exception as e:
+        # Anything else will keep failing, so stop retrying for the rest of this run
+        print(f"⚠️  Progress table disabled for this run: {e}")
+        st.session_state['_sm_load_disabled'] = True
+
 def main():
     st.title("🎯 SmartScout Brand Analyzer")
     st.markdown("Simple interface - works exactly like the terminal version")
@@ -179,6 +341,13 @@ def main():
         # Options
         headless = st.checkbox("Headless Mode", value=True, help="Run browser in background")
         force_regenerate = st.checkbox("Force Regenerate", value=False, help="Overwrite existing files")
+        concurrency = st.number_input(
+            "Summary Concurrency",
+            min_value=1,
+            max_value=16,
+            value=8,
+            help="Summary batches generated in parallel. Browser steps always share one browser profile."
+        )
 
     # File Upload Section
     st.header("📁 Input")
@@ -223,6 +392,9 @@ def main():
                 open_smartscout_login()
         with col2:
             if st.button("🔄 Check Auth Status", type="secondary"):
+                # The login window must release the profile before the check can open it
+                close_smartscout_login()
+                check_smartscout_auth.clear()
                 st.rerun()
     
     # Validation and Start
@@ -252,8 +424,8 @@ def main():
         # Initialize session state for this execution
         if 'processor_started' not in st.session_state:
             st.session_state.processor_started = False
-        if 'processor_thread' not in st.session_state:
-            st.session_state.processor_thread = None
+        if 'processor_future' not in st.session_state:
+            st.session_state.processor_future = None
         
         # Start button
         if not st.session_state.processor_started:
@@ -267,47 +439,43 @@ def main():
                 # Save CSV to temp file if uploaded
                 csv_path = None
                 if uploaded_file:
-                    temp_dir = tempfile.mkdtemp()
-                    csv_path = os.path.join(temp_dir, f"{session_name}.csv")
-                    with open(csv_path, 'wb') as f:
-                        f.write(uploaded_file.read())
+                    # An identical re-upload for the same session name reuses the file already on disk
+                    with uploaded_file.getbuffer() as buf:
+                        upload_key = (hashlib.blake2b(buf, digest_size=16).hexdigest(), session_name)
+                    
+                    last_key, last_path = st.session_state.get('_last_csv_upload', (None, None))
+                    if last_key == upload_key and last_path and os.path.exists(last_path):
+                        csv_path = last_path
+                    else:
+                        temp_dir = tempfile.mkdtemp()
+                        csv_path = os.path.join(temp_dir, f"{session_name}.csv")
+                        uploaded_file.seek(0)
+                        with open(csv_path, 'wb') as f:
+                            shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)  # 1 MiB chunks
+                        st.session_state['_last_csv_upload'] = (upload_key, csv_path)
                 
-                # Start processing in background thread
-                st.session_state.processor_thread = threading.Thread(
-                    target=run_session_manager,
-                    args=(session_name, csv_path, ai_provider, headless, force_regenerate, resume_mode)
+                # Start processing on the background session worker; it opens the browser profile itself
+                close_smartscout_login()
+                st.session_state.processor_future = get_session_executor().submit(
+                    run_session_manager,
+                    session_name, csv_path, ai_provider, headless, force_regenerate, resume_mode,
+                    int(concurrency)
                 )
-                st.session_state.processor_thread.start()
                 st.session_state.processor_started = True
+                st.session_state['_sm_load_disabled'] = False
                 st.rerun()
         
         # Processing status
         if st.session_state.processor_started:
             st.subheader("🔄 Processing Status")
             
-            # Check if thread is still running
-            is_running = (st.session_state.processor_thread and 
-                         st.session_state.processor_thread.is_alive())
+            # Check if the session is still running
+            is_running = (st.session_state.processor_future is not None and
+                          not st.session_state.processor_future.done())
             
             if is_running:
-                st.info("⏳ Processing in progress... Check terminal for detailed logs.")
-                
-                # Try to show progress table if session exists
-                try:
-                    from smartscout_session_manager import SessionManager
-                    working_dir = os.path.join(tempfile.gettempdir(), "smartscout_sessions")
-                    session_manager = SessionManager(working_dir)
-                    
-                    # Try to load current session to show progress
-                    if session_manager.load_session(session_name):
-                        st.subheader("📊 Progress Table")
-                        display_session_table(session_manager)
-                except:
-                    pass  # Don't break if we can't load session
-                
-                # Auto-refresh every 5 seconds while processing
-                time.sleep(2)  # Small delay to avoid too frequent refreshes
-                st.rerun()
+                # Only the progress fragment refreshes on its timer, not the whole script
+                show_processing_progress(session_name)
                 
             else:
                 st.success("✅ Processing completed! Check terminal for results.")
@@ -315,31 +483,36 @@ def main():
                 # Look for result CSV
                 working_dir = Path(tempfile.gettempdir()) / "smartscout_sessions"
                 if working_dir.exists():
-                    import glob
-                    csv_pattern = str(working_dir / "**" / "*_with_brand_data.csv")
-                    csv_files = glob.glob(csv_pattern, recursive=True)
+                    # Find the most recent result CSV, re-walking only when a session folder changed
+                    scan_key = result_scan_key(str(working_dir))
+                    if st.session_state.get('_csv_scan_key') != scan_key:
+                        st.session_state['_csv_scan_result'] = find_latest_result_csv(str(working_dir))
+                        st.session_state['_csv_scan_key'] = scan_key
+                    latest_csv = st.session_state['_csv_scan_result']
                     
-                    if csv_files:
-                        # Find the most recent CSV file
-                        latest_csv = max(csv_files, key=os.path.getctime)
-                        
+                    if latest_csv:
                         st.subheader("📥 Download Results")
                         
                         try:
-                            with open(latest_csv, 'rb') as f:
-                                csv_data = f.read()
-                            
                             filename = os.path.basename(latest_csv)
-                            file_size_kb = len(csv_data) / 1024
+                            file_size = os.path.getsize(latest_csv)
+                            file_size_kb = file_size / 1024
                             
-                            st.download_button(
-                                "📥 Download Results CSV",
-                                data=csv_data,
-                                file_name=filename,
-                                mime='text/csv',
-                                type="primary",
-                                use_container_width=True
-                            )
+                            # Small files are read directly; large ones are passed as a file object
+                            with contextlib.ExitStack() as stack:
+                                if file_size < LARGE_DOWNLOAD_BYTES:
+                                    csv_data = Path(latest_csv).read_bytes()
+                                else:
+                                    csv_data = stack.enter_context(open(latest_csv, 'rb'))
+                                
+                                st.download_button(
+                                    "📥 Download Results CSV",
+                                    data=csv_data,
+                                    file_name=filename,
+                                    mime='text/csv',
+                                    type="primary",
+                                    use_container_width=True
+                                )
                             
                             st.info(f"✅ File ready: {filename} ({file_size_kb:.1f} KB)")
                             
@@ -352,15 +525,13 @@ def main():
                 if st.button("🔄 Process New File", type="secondary"):
                     # Clear session state to start fresh
                     st.session_state.processor_started = False
-                    st.session_state.processor_thread = None
+                    st.session_state.processor_future = None
                     st.rerun()
 
 
-def run_session_manager(session_name, csv_path, ai_provider, headless, force_regenerate, resume_mode):
+def run_session_manager(session_name, csv_path, ai_provider, headless, force_regenerate, resume_mode, concurrency=4):
     """Run the session manager in background thread"""
     try:
-        from smartscout_session_manager import SessionManager
-        
         # Initialize session manager
         working_dir = os.path.join(tempfile.gettempdir(), "smartscout_sessions")
         session_manager = SessionManager(working_dir)
@@ -380,7 +551,8 @@ def run_session_manager(session_name, csv_path, ai_provider, headless, force_reg
                 brands_source=csv_path,
                 headless=headless,
                 model_provider=ai_provider,
-                force_regenerate=force_regenerate
+                force_regenerate=force_regenerate,
+                summarize_workers=concurrency
             )
             print(f"📁 Session created: {session_id}")
         
@@ -8,18 +8,61 @@ import streamlit as st
 import pandas as pd
 import hashlib
 import os
+import math
+import atexit
+import shutil
+import contextlib
+import functools
 import time
+import sqlite3
 import webbrowser
 from pathlib import Path
 from datetime import datetime
 import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
 # Import existing session manager
-from smartscout_session_manager import SessionManager
+from smartscout_session_manager import SessionManager, BrandStatus, RESULT_CSV_SUFFIX, detect_brand_column
 from smartscout_csv_downloader import collect_brand_data
 
+# Status emoji mapping for the progress table
+STATUS_EMOJI = {
+    BrandStatus.PENDING: '⏳',
+    BrandStatus.COLLECTING: '🔄',
+    BrandStatus.COLLECTED: '✅',
+    BrandStatus.ANALYZING: '⚡',
+    BrandStatus.ANALYZED: '✅',
+    BrandStatus.DOWNLOADING: '📥',
+    BrandStatus.DOWNLOADED: '📄',
+    BrandStatus.SUMMARIZING: '🤖',
+    BrandStatus.SUMMARIZED: '✅',
+    BrandStatus.FAILED: '❌'
+}
+
+# "<emoji> <Status>" labels for the progress table, built once per BrandStatus
+STATUS_LABELS = {status: f"{STATUS_EMOJI.get(status, '❓')} {status.value.title()}" for status in BrandStatus}
+
+# Result CSVs above this size are handed to the download button as an open file
+LARGE_DOWNLOAD_BYTES = 5 * 1024 * 1024
+
+# Rows per page in the brand progress table
+PROGRESS_PAGE_SIZE = 100
+
+# Debug lines in the UI cost a websocket message each per rerun, so they're opt-in
+DEBUG_UI = bool(os.environ.get("SMARTSCOUT_DEBUG"))
+
+def debug_write(*args):
+    """st.write only when SMARTSCOUT_DEBUG is set"""
+    if DEBUG_UI:
+        st.write(*args)
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="SmartScout Brand Analyzer",
@@ -28,6 +71,51 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def scan_csv_brands(_csv_file, file_hash: str, file_name: str, file_size: int) -> tuple:
+    """Read only the brand column once per content hash: (rows, columns, brand column, unique brand count)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa = None
+    
+    if pa is not None:
+        # Arrow's multithreaded reader, materializing just the brand column
+        try:
+            # The streaming reader only parses the first block to get the header
+            columns = pa_csv.open_csv(pa.BufferReader(_csv_file.getbuffer())).schema.names
+            brand_column = detect_brand_column(columns)
+            table = pa_csv.read_csv(
+                pa.BufferReader(_csv_file.getbuffer()),  # Zero-copy view of the upload
+                read_options=pa_csv.ReadOptions(use_threads=True),
+                convert_options=pa_csv.ConvertOptions(include_columns=[brand_column], strings_can_be_null=True)
+            )
+            # Counted in Arrow's hash kernel without materializing the unique values
+            unique_brand_count = pc.count_distinct(table.column(brand_column), mode='only_valid').as_py()
+            return table.num_rows, len(columns), brand_column, unique_brand_count
+        except pa.ArrowException:
+            pass  # Fall back to pandas, which tolerates more malformed input
+    
+    _csv_file.seek(0)
+    columns = list(pd.read_csv(_csv_file, nrows=0).columns)
+    _csv_file.seek(0)
+    brand_column = detect_brand_column(columns)
+    brands = pd.read_csv(_csv_file, usecols=[brand_column])[brand_column].to_numpy()
+    _csv_file.seek(0)
+    
+    unique_brand_count = len(pd.unique(brands[pd.notna(brands)]))
+    return len(brands), len(columns), brand_column, unique_brand_count
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def parse_csv_head(_csv_file, file_hash: str, n: int = 10) -> pd.DataFrame:
+    """First n rows of an upload for the preview table"""
+    _csv_file.seek(0)
+    head = pd.read_csv(_csv_file, nrows=n)
+    _csv_file.seek(0)
+    return head
+
 class StreamlitSessionManager:
     """Wrapper around the existing SessionManager for Streamlit UI"""
     
@@ -42,15 +130,28 @@ class StreamlitSessionManager:
         if csv_file is None:
             return f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create hash from file content for consistency
-        file_content = csv_file.read()
-        csv_file.seek(0)  # Reset file pointer
-        
-        file_hash = hashlib.md5(file_content).hexdigest()[:8]
+        file_hash = self.get_file_hash(csv_file)
         filename = csv_file.name.replace('.csv', '').replace(' ', '_')
         
         return f"{filename}_{file_hash}"
     
+    def get_file_hash(self, csv_file) -> str:
+        """Short content hash of an uploaded file, cached across reruns"""
+        # Create hash from file content for consistency; reruns reuse the digest
+        hash_cache = st.session_state.setdefault("_csv_hash_cache", {})
+        cache_key = (csv_file.name, getattr(csv_file, "size", None))
+        file_hash = hash_cache.get(cache_key)
+        if file_hash is None:
+            # MD5 is kept so names of existing sessions still match; fed in 1 MiB chunks
+            h = hashlib.md5()
+            csv_file.seek(0)
+            while chunk := csv_file.read(1 << 20):
+                h.update(chunk)
+            csv_file.seek(0)  # Reset file pointer
+            file_hash = hash_cache[cache_key] = h.hexdigest()[:8]
+        
+        return file_hash
+    
     def check_existing_session(self, session_name: str) -> Optional[Dict[str, Any]]:
         """Check if session already exists and return its status"""
         session_folder = self.working_dir / session_name
@@ -68,154 +169,516 @@ class StreamlitSessionManager:
             return {}
         
         session = self.session_manager.current_session
-        status_counts = {}
-        
-        for brand_state in session.brands.values():
-            status = brand_state.status.value if hasattr(brand_state.status, 'value') else brand_state.status
-            status_counts[status] = status_counts.get(status, 0) + 1
         
         return {
             'session_name': session.config.session_name,
             'total_brands': session.total_brands,
-            'status_counts': status_counts,
+            'status_counts': self.session_manager.get_status_counts(),
             'brands': session.brands,
             'completed_at': session.completed_at
         }
 
+# Cookie names containing one of these are treated as SmartScout login cookies
+AUTH_COOKIE_HINTS = ('session', 'auth', 'token', 'identity')
+
+def quick_auth_check(user_data_dir: str = "./playwright_user_data") -> Optional[bool]:
+    """Check the browser profile's cookie store for a live SmartScout login cookie without launching Chromium.
+    
+    Returns None when the cookie store can't be read, so callers can fall back to the browser check.
+    """
+    # Newer Chromium keeps cookies under Network/; older builds keep them next to the profile
+    for relative_path in (("Default", "Network", "Cookies"), ("Default", "Cookies")):
+        cookie_db = os.path.join(user_data_dir, *relative_path)
+        if os.path.exists(cookie_db):
+            break
+    else:
+        return None
+    
+    # Chromium stores expiry as microseconds since 1601-01-01 (0 for session cookies)
+    now_chromium = int((time.time() + 11644473600) * 1_000_000)
+    
+    try:
+        db = sqlite3.connect(f"file:{Path(cookie_db).resolve().as_posix()}?mode=ro&immutable=1", uri=True)
+        try:
+            rows = db.execute(
+                "SELECT name, expires_utc FROM cookies WHERE host_key LIKE '%smartscout.com'"
+            ).fetchall()
+        finally:
+            db.close()
+    except sqlite3.Error:
+        return None
+    
+    return any(
+        (expires == 0 or expires > now_chromium) and any(hint in name.lower() for hint in AUTH_COOKIE_HINTS)
+        for name, expires in rows
+    )
+
+@st.cache_resource
+def get_playwright_worker():
+    """Single thread that owns one long-lived Playwright driver (sync Playwright objects are thread-bound)"""
+    driver = {}
+    
+    def start_driver():
+        driver['playwright'] = sync_playwright().start()
+    
+    executor = ThreadPoolExecutor(
+        max_workers=1,
+        thread_name_prefix="smartscout-playwright",
+        initializer=start_driver
+    )
+    
+    def stop_driver():
+        def stop():
+            if 'playwright' in driver:
+                driver.pop('playwright').stop()
+        try:
+            executor.submit(stop).result(timeout=10)
+        except Exception:
+            pass
+        executor.shutdown(wait=False)
+    
+    atexit.register(stop_driver)
+    return executor, driver
+
+def run_with_playwright(fn):
+    """Run fn(playwright) on the Playwright worker thread and return its result"""
+    if sync_playwright is None:
+        raise ImportError("playwright is not installed")
+    executor, driver = get_playwright_worker()
+    return executor.submit(lambda: fn(driver['playwright'])).result()
+
 def check_smartscout_authentication() -> bool:
     """Check if user is authenticated with SmartScout"""
-    try:
-        from playwright.sync_api import sync_playwright
-        import os
-        
-        # Use same browser data directory as CLI version
-        user_data_dir = "./playwright_user_data"
-        
-        # Check if browser data directory exists (basic check)
-        if not os.path.exists(user_data_dir):
-            print("Browser data directory not found - user needs to login")
-            return False
-        
-        with sync_playwright() as p:
-            browser = p.chromium.launch_persistent_context(
-                user_data_dir,
-                headless=True,
-                args=['--no-sandbox', '--disable-web-security']
-            )
+    # Use same browser data directory as CLI version
+    user_data_dir = "./playwright_user_data"
+    
+    # Check if browser data directory exists (basic check)
+    if not os.path.exists(user_data_dir):
+        print("Browser data directory not found - user needs to login")
+        return False
+    
+    def check(p):
+        # The context is closed after each check so processing can take the profile lock
+        browser = p.chromium.launch_persistent_context(
+            user_data_dir,
+            headless=True,
+            args=['--no-sandbox', '--disable-web-security']
+        )
+        try:
+            print("Checking SmartScout authentication...")
+            # No live login cookie means signed out, so skip loading the app
+            now = time.time()
+            cookies = browser.cookies("https://app.smartscout.com")
+            if not any(
+                (cookie.get('expires', -1) == -1 or cookie['expires'] > now)
+                and any(hint in cookie['name'].lower() for hint in AUTH_COOKIE_HINTS)
+                for cookie in cookies
+            ):
+                print("No live SmartScout session cookie - not authenticated")
+                return False
+            
+            # A cookie can still be expired server-side, so load the app and watch for a redirect
             page = browser.new_page()
+            # Only the URL after redirects matters, so don't wait for subresources to load
+            page.goto("https://app.smartscout.com/app/tailored-report", wait_until="domcontentloaded", timeout=10000)
             
-            try:
-                # Try to navigate to SmartScout app
-                print("Checking SmartScout authentication...")
-                page.goto("https://app.smartscout.com/app/tailored-report", timeout=20000)
-                page.wait_for_load_state("domcontentloaded", timeout=15000)
-                
-                current_url = page.url
-                print(f"Current URL: {current_url}")
-                
-                # Check if we're redirected to signin page
-                if "signin" in current_url.lower() or "login" in current_url.lower():
-                    print("Redirected to signin page - not authenticated")
-                    browser.close()
-                    return False
-                
-                # If we're on the tailored-report page, we're likely authenticated
-                if "tailored-report" in current_url:
-                    print("Successfully reached tailored-report page")
-                    browser.close()
-                    return True
-                    
-                print(f"Unexpected URL: {current_url}")
-                browser.close()
-                return False
-                
-            except Exception as e:
-                print(f"Error during auth check: {e}")
-                browser.close()
+            current_url = page.url
+            print(f"Current URL: {current_url}")
+            
+            # Check if we're redirected to signin page
+            if "signin" in current_url.lower() or "login" in current_url.lower():
+                print("Redirected to signin page - not authenticated")
                 return False
+            
+            # If we're on the tailored-report page, we're likely authenticated
+            if "tailored-report" in current_url:
+                print("Successfully reached tailored-report page")
+                return True
                 
+            print(f"Unexpected URL: {current_url}")
+            return False
+            
+        except Exception as e:
+            print(f"Error during auth check: {e}")
+            return False
+        finally:
+            browser.close()
+    
+    try:
+        return run_with_playwright(check)
     except Exception as e:
         print(f"Auth check failed: {e}")
         return False
 
 def open_smartscout_login():
     """Open SmartScout login page for user authentication"""
-    import webbrowser
     webbrowser.open("https://app.smartscout.com/sessions/signin")
 
 def setup_smartscout_authentication():
     """Setup SmartScout authentication using Playwright browser"""
-    try:
-        from playwright.sync_api import sync_playwright
-        
-        user_data_dir = "./playwright_user_data"
-        
-        with sync_playwright() as p:
-            print("Opening browser for SmartScout authentication...")
-            browser = p.chromium.launch_persistent_context(
-                user_data_dir,
-                headless=False,  # Always show browser for login
-                args=['--no-sandbox', '--disable-web-security']
-            )
+    user_data_dir = "./playwright_user_data"
+    
+    def login(p):
+        print("Opening browser for SmartScout authentication...")
+        browser = p.chromium.launch_persistent_context(
+            user_data_dir,
+            headless=False,  # Always show browser for login
+            args=['--no-sandbox', '--disable-web-security']
+        )
+        try:
             page = browser.new_page()
             
             # Navigate to SmartScout signin
             page.goto("https://app.smartscout.com/sessions/signin", timeout=20000)
             
-            # Keep browser open for user to login
-            st.info("🌐 Browser opened! Please login to SmartScout, then close the browser window when done.")
-            st.info("After logging in, click 'Recheck Auth' to verify your authentication.")
-            
             # Wait for user to navigate to the app (indicating successful login)
             try:
-                # Wait for either successful navigation or timeout
                 page.wait_for_url("**/app/**", timeout=60000)  # 1 minute timeout
-                st.success("✅ Login detected! You can now close the browser.")
+                return True
             except:
-                st.warning("⚠️ Login timeout reached. Please close the browser manually after logging in.")
-            
+                return False
+        finally:
             browser.close()
-            return True
+    
+    try:
+        # Keep browser open for user to login
+        st.info("🌐 Browser opened! Please login to SmartScout, then close the browser window when done.")
+        st.info("After logging in, click 'Recheck Auth' to verify your authentication.")
+        
+        if run_with_playwright(login):
+            st.success("✅ Login detected! You can now close the browser.")
+        else:
+            st.warning("⚠️ Login timeout reached. Please close the browser manually after logging in.")
+        return True
             
     except Exception as e:
         st.error(f"❌ Setup failed: {e}")
         return False
 
-def display_progress_table(brands_dict: Dict):
-    """Display the progress table similar to session manager"""
+def find_result_csv(root: str) -> Optional[str]:
+    """First *_with_brand_data.csv in root or one of its session folders, or None"""
+    try:
+        with os.scandir(root) as entries:
+            session_dirs = []
+            for entry in entries:
+                if entry.name.endswith(RESULT_CSV_SUFFIX) and entry.is_file():
+                    return entry.path
+                if entry.is_dir(follow_symlinks=False):
+                    session_dirs.append(entry.path)
+    except OSError:
+        return None
+    
+    for session_dir in session_dirs:
+        try:
+            with os.scandir(session_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(RESULT_CSV_SUFFIX) and entry.is_file():
+                        return entry.path
+        except OSError:
+            continue
+    return None
+
+def cached_result_csv(root: str) -> Optional[str]:
+    """find_result_csv(root), re-scanned only when root or a session folder's mtime changes"""
+    try:
+        scan_key = os.stat(root).st_mtime
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    scan_key = max(scan_key, entry.stat().st_mtime)
+    except OSError:
+        return None
+    
+    scan_key = (str(root), st.session_state.get('session_name'), scan_key)
+    if st.session_state.get('_result_csv_key') != scan_key:
+        st.session_state._result_csv_path = find_result_csv(root)
+        st.session_state._result_csv_key = scan_key
+    return st.session_state._result_csv_path
+
+@st.cache_data(ttl=3600, max_entries=4, show_spinner=False)
+def load_result_csv_bytes(path: str, mtime: float) -> bytes:
+    """Result CSV bytes for the download button, re-read only when the file's mtime changes"""
+    return Path(path).read_bytes()
+
+@functools.lru_cache(maxsize=8)
+def _stat_in_epoch(path: str, epoch: int) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def cached_stat(path: Optional[str]) -> Optional[os.stat_result]:
+    """os.stat(path), or None if it's missing; reused for up to 2 seconds across reruns"""
+    if not path:
+        return None
+    return _stat_in_epoch(path, int(time.time() / 2))
+
+def render_result_download(csv_path: Optional[str], key: Optional[str] = None) -> bool:
+    """Download button and size note for a result CSV; False if there is no file to offer"""
+    # One stat both checks the file is there and gives its size and mtime
+    stat = cached_stat(csv_path)
+    if stat is None:
+        return False
+    
+    try:
+        result_filename = os.path.basename(csv_path)
+        
+        # Small files come from the mtime-keyed cache; large ones are handed over as a file object
+        with contextlib.ExitStack() as stack:
+            if stat.st_size < LARGE_DOWNLOAD_BYTES:
+                csv_data = load_result_csv_bytes(csv_path, stat.st_mtime)
+            else:
+                csv_data = stack.enter_context(open(csv_path, 'rb'))
+            
+            st.download_button(
+                "📥 Download Results CSV",
+                data=csv_data,
+                file_name=result_filename,
+                mime='text/csv',
+                type="primary",
+                key=key
+            )
+        
+        file_size_kb = stat.st_size / 1024
+        st.info(f"✅ CSV ready: {result_filename} ({file_size_kb:.1f} KB)")
+        
+    except Exception as e:
+        st.error(f"❌ Error reading CSV file: {e}")
+    return True
+
+def build_progress_frame(brands_dict: Dict) -> tuple:
+    """Progress table DataFrame plus the set of status labels present in it"""
+    # Build the table column by column in a single pass over the brands
+    n = len(brands_dict)
+    names = [None] * n
+    statuses = [None] * n
+    collect = [None] * n
+    download = [None] * n
+    summary = [None] * n
+    updated = [None] * n
+    for i, (name, state) in enumerate(brands_dict.items()):
+        attempts = state.attempts
+        last_attempt = state.last_attempt
+        names[i] = name
+        statuses[i] = STATUS_LABELS[state.status]
+        collect[i] = '✅' if attempts.get('collect', 0) > 0 else '⏳'
+        download[i] = '✅' if attempts.get('download', 0) > 0 else '⏳'
+        summary[i] = '✅' if attempts.get('summarize', 0) > 0 else '⏳'
+        if last_attempt:
+            updated[i] = (last_attempt.get('summarize') or last_attempt.get('download')
+                          or last_attempt.get('collect') or 'Never')[:8]
+        else:
+            updated[i] = 'Never'
+    
+    df = pd.DataFrame({
+        'Brand': names,
+        'Status': statuses,
+        'Collect': collect,
+        'Download': download,
+        'Summary': summary,
+        'Updated': updated
+    }, copy=False)
+    return df, set(statuses)
+
+def display_progress_table(brands_dict: Dict, signature: Optional[tuple] = None):
+    """Display the progress table similar to session manager.
+    
+    With a signature, the built DataFrame is reused until the signature changes."""
     if not brands_dict:
         return
     
-    # Create dataframe for display
-    rows = []
-    for name, state in brands_dict.items():
-        status = state.status.value if hasattr(state.status, 'value') else state.status
-        
-        # Status emoji mapping
-        status_emoji = {
-            'pending': '⏳',
-            'collecting': '🔄', 
-            'collected': '✅',
-            'analyzing': '⚡',
-            'analyzed': '✅',
-            'downloading': '📥',
-            'downloaded': '📄',
-            'summarizing': '🤖',
-            'summarized': '✅',
-            'failed': '❌'
-        }
+    if signature is not None and st.session_state.get('_progress_table_sig') == signature:
+        df, present = st.session_state._progress_table
+    else:
+        df, present = build_progress_frame(brands_dict)
+        if signature is not None:
+            st.session_state._progress_table = (df, present)
+            st.session_state._progress_table_sig = signature
+    
+    # Filter before paging so pending rows don't bury the interesting ones
+    status_filter = st.multiselect(
+        "Filter status",
+        [label for label in STATUS_LABELS.values() if label in present],
+        key="brand_status_filter"
+    )
+    if status_filter:
+        df = df[df['Status'].isin(status_filter)]
+    
+    # Only the current page goes to the browser on each rerun
+    n_pages = max(1, math.ceil(len(df) / PROGRESS_PAGE_SIZE))
+    if st.session_state.get('brand_page', 1) > n_pages:
+        st.session_state.brand_page = n_pages
+    page = st.number_input("Page", 1, n_pages, 1, key="brand_page") if n_pages > 1 else 1
+    start = (page - 1) * PROGRESS_PAGE_SIZE
+    st.dataframe(df.iloc[start:start + PROGRESS_PAGE_SIZE], width="stretch")
+    if n_pages > 1:
+        st.caption(f"Showing {start + 1}-{min(start + PROGRESS_PAGE_SIZE, len(df))} of {len(df)} brands")
+
+@st.fragment(run_every=60)
+def auth_status_panel():
+    """SmartScout auth status and login buttons; reruns on its own every 60 seconds"""
+    # Cache auth status to avoid blocking UI
+    if 'auth_status' not in st.session_state:
+        st.session_state.auth_status = None
+        st.session_state.auth_last_check = 0
+    
+    previous_status = st.session_state.auth_status
+    
+    # Check auth status periodically (not every refresh) - but not during processing
+    current_time = time.time()
+    should_check_auth = (st.session_state.auth_status is None or 
+                       current_time - st.session_state.auth_last_check > 60)  # Check every 60 seconds
+    
+    # Don't check auth during processing to avoid conflicts
+    if should_check_auth and not st.session_state.processing:
+        # The periodic check reads the cookie store; only a user recheck launches the browser
+        quick_status = None
+        if not st.session_state.get('auth_full_check', False):
+            quick_status = quick_auth_check()
+        
+        if quick_status is not None:
+            st.session_state.auth_status = quick_status
+        else:
+            with st.spinner("Checking authentication..."):
+                st.session_state.auth_status = check_smartscout_authentication()
+        st.session_state.auth_last_check = current_time
+        st.session_state.auth_full_check = False
+    
+    auth_status = st.session_state.auth_status
+    
+    # A status change seen on a timed run has to reach the Start button outside this fragment
+    if previous_status is not None and auth_status != previous_status:
+        st.rerun()
+    
+    if auth_status:
+        st.success("✅ SmartScout session active")
+        if st.button("🔄 Recheck Authentication"):
+            # Force a fresh auth check
+            st.session_state.auth_status = None
+            st.session_state.auth_full_check = True
+            st.rerun()
+    else:
+        st.error("❌ SmartScout authentication needed")
+        st.info("💡 Your authentication cookies may have expired. Use 'Setup Auth' to login again.")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("🔧 Setup Auth"):
+                setup_smartscout_authentication()
+        with col2:
+            if st.button("🌐 Open Login"):
+                open_smartscout_login()
+                st.info("Login manually, then recheck")
+        with col3:
+            if st.button("🔄 Recheck"):
+                # Force fresh auth check
+                st.session_state.auth_status = None
+                st.session_state.auth_full_check = True
+                st.rerun()
+
+@st.cache_resource
+def get_status_executor() -> ThreadPoolExecutor:
+    """Single worker that reads processor status off the script thread"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="status-poll")
+
+def poll_processing_status(processor, min_interval: float = 1.0) -> tuple:
+    """(is_processing, status) from the status worker; returns the last result while a poll is in flight"""
+    future = st.session_state.get('_poll_inflight')
+    
+    # Only start the next poll once the previous one resolved and min_interval has passed
+    elapsed = time.time() - st.session_state.get('_poll_completed_at', 0)
+    if future is None and ('_last_status' not in st.session_state or elapsed >= min_interval):
+        future = get_status_executor().submit(
+            lambda: (processor.is_processing(), processor.get_processing_status())
+        )
+        st.session_state._poll_inflight = future
+    
+    # Nothing cached yet on the first poll of a run, so wait for that one
+    if future is not None and (future.done() or '_last_status' not in st.session_state):
+        try:
+            st.session_state._last_status = future.result()
+        except Exception as e:
+            print(f"⚠️ Status poll failed: {e}")
+            st.session_state._last_status = (True, {})
+        st.session_state._poll_inflight = None
+        st.session_state._poll_completed_at = time.time()
+    
+    return st.session_state._last_status
+
+def progress_poll_interval(status: Dict) -> int:
+    """Seconds between progress refreshes for the processor's current phase"""
+    if status and status.get('phase') in ('idle', 'completed', 'error'):
+        return 30
+    # One rate for the whole run: current_brand flips between every brand, and each
+    # interval change costs a full-app rerun to rebuild the fragment
+    return 2
+
+def processing_progress_panel():
+    """Live processing status and brand table; main() runs it as a fragment on progress_interval"""
+    processor = st.session_state.processor
+    is_processing, status = poll_processing_status(processor)
+    
+    # Once the worker stops, the full app has to rerun to show the results
+    if not is_processing:
+        st.session_state.processing = False
+        st.session_state.pop('_last_status', None)
+        st.rerun(scope="app")
+    
+    # Current status
+    debug_write("🐛 DEBUG: Processing active, status:", status)  # Debug line
+    
+    # run_every is bound when main() builds the fragment, so a new interval needs a full rerun
+    interval = progress_poll_interval(status)
+    if interval != st.session_state.get('progress_interval'):
+        st.session_state.progress_interval = interval
+        st.rerun(scope="app")
+    if status:
+        
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            if status.get('current_brand'):
+                st.info(f"🔄 Processing: **{status['current_brand']}** ({status.get('current_stage', 'unknown')})")
+            else:
+                st.info(f"🔄 Phase: {status.get('phase', 'unknown').title()}")
+        
+        with col2:
+            completed = status.get('completed_brands', 0)
+            total = status.get('total_brands', 1)
+            st.metric("Completed", f"{completed}/{total}")
         
-        rows.append({
-            'Brand': name,
-            'Status': f"{status_emoji.get(status, '❓')} {status.title()}",
-            'Collect': '✅' if state.attempts.get('collect', 0) > 0 else '⏳',
-            'Download': '✅' if state.attempts.get('download', 0) > 0 else '⏳',
-            'Summary': '✅' if state.attempts.get('summarize', 0) > 0 else '⏳',
-            'Updated': state.last_attempt.get('summarize', state.last_attempt.get('download', state.last_attempt.get('collect', 'Never')))[:8] if state.last_attempt else 'Never'
-        })
+        with col3:
+            progress_pct = status.get('progress', 0) * 100
+            st.metric("Progress", f"{progress_pct:.0f}%")
+        
+        # Progress bar
+        overall_progress = completed / total if total > 0 else 0
+        st.progress(overall_progress)
+        
+        # Last update time
+        if status.get('last_update'):
+            st.caption(f"Last update: {status['last_update'][11:19]}")
     
-    df = pd.DataFrame(rows)
-    st.dataframe(df, width="stretch")
+    # Session status table (updated every few seconds)
+    if processor.session_manager.current_session:
+        session_status = processor.get_session_status()
+        
+        if session_status.get('brands'):
+            st.subheader("📊 Brand Progress Table")
+            # Unchanged polls reuse the last table instead of rebuilding it
+            status_counts = session_status.get('status_counts', {})
+            signature = (
+                status.get('phase'), status.get('completed_brands'), status.get('failed_brands'),
+                status.get('current_brand'), status.get('current_stage'), status.get('last_update'),
+                tuple(status_counts.items())
+            ) if status else None
+            display_progress_table(session_status['brands'], signature=signature)
+            
+            # Status summary
+            if status_counts:
+                cols = st.columns(len(status_counts))
+                for i, (status, count) in enumerate(status_counts.items()):
+                    with cols[i]:
+                        st.metric(status.title(), count)
 
 def main():
     st.title("🎯 SmartScout Brand Analyzer")
@@ -257,49 +720,9 @@ def main():
         # SmartScout authentication status
         st.header("SmartScout Authentication")
         
-        # Cache auth status to avoid blocking UI
-        if 'auth_status' not in st.session_state:
-            st.session_state.auth_status = None
-            st.session_state.auth_last_check = 0
-        
-        # Check auth status periodically (not every refresh) - but not during processing
-        import time
-        current_time = time.time()
-        should_check_auth = (st.session_state.auth_status is None or 
-                           current_time - st.session_state.auth_last_check > 60)  # Check every 60 seconds
-        
-        # Don't check auth during processing to avoid conflicts
-        if should_check_auth and not st.session_state.processing:
-            with st.spinner("Checking authentication..."):
-                st.session_state.auth_status = check_smartscout_authentication()
-                st.session_state.auth_last_check = current_time
-        
+        auth_status_panel()
         auth_status = st.session_state.auth_status
         
-        if auth_status:
-            st.success("✅ SmartScout session active")
-            if st.button("🔄 Recheck Authentication"):
-                # Force a fresh auth check
-                st.session_state.auth_status = None
-                st.rerun()
-        else:
-            st.error("❌ SmartScout authentication needed")
-            st.info("💡 Your authentication cookies may have expired. Use 'Setup Auth' to login again.")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                if st.button("🔧 Setup Auth"):
-                    setup_smartscout_authentication()
-            with col2:
-                if st.button("🌐 Open Login"):
-                    open_smartscout_login()
-                    st.info("Login manually, then recheck")
-            with col3:
-                if st.button("🔄 Recheck"):
-                    # Force fresh auth check
-                    st.session_state.auth_status = None
-                    st.rerun()
-        
         # Processing options
         st.header("Processing Options") 
         headless_mode = st.checkbox("Headless Mode", value=True, help="Run browser in background")
@@ -308,16 +731,14 @@ def main():
         # Session management
         st.header("Session Management")
         if st.button("🗑️ Clear All Sessions", help="Delete all session data and start fresh"):
-            import shutil
-            import tempfile
             
             # Clear temp sessions
             temp_sessions = Path(tempfile.gettempdir()) / "smartscout_sessions"
             if temp_sessions.exists():
                 try:
                     shutil.rmtree(temp_sessions)
-                    st.success("✅ All sessions cleared!")
-                    time.sleep(1)
+                    # Toasts survive the rerun, so there's no need to pause for the user to read it
+                    st.toast("✅ All sessions cleared!", icon="🗑️")
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Error clearing sessions: {e}")
@@ -365,25 +786,22 @@ def main():
                 
             # Show CSV preview
             try:
-                df = pd.read_csv(uploaded_file)
+                # Scanned once per upload; reruns hit the cache
+                file_hash = st.session_state.session_manager.get_file_hash(uploaded_file)
+                row_count, column_count, brand_column, unique_brand_count = scan_csv_brands(
+                    uploaded_file,
+                    file_hash,
+                    uploaded_file.name,
+                    getattr(uploaded_file, "size", None)
+                )
                 st.subheader("📊 CSV Preview")
-                st.write(f"**Rows:** {len(df)} | **Columns:** {len(df.columns)}")
-                st.dataframe(df.head(), width="stretch")
-                
-                # Detect brand column
-                brand_column = None
-                for col in ['Brand Name', 'Brand', 'brand', 'name', 'Brand_Name']:
-                    if col in df.columns:
-                        brand_column = col
-                        break
-                if not brand_column:
-                    brand_column = df.columns[0]
+                st.write(f"**Rows:** {row_count} | **Columns:** {column_count}")
+                with st.expander("First rows", expanded=False):
+                    # Reads only the first few rows, not the whole upload
+                    st.dataframe(parse_csv_head(uploaded_file, file_hash), width="stretch")
                 
                 st.info(f"🏷️ Using brand column: **{brand_column}**")
-                
-                # Extract unique brands
-                unique_brands = df[brand_column].dropna().unique()
-                st.write(f"📈 **{len(unique_brands)} unique brands** found")
+                st.write(f"📈 **{unique_brand_count} unique brands** found")
                 
             except Exception as e:
                 st.error(f"Error reading CSV: {e}")
@@ -455,41 +873,18 @@ def main():
             result_csv_path = processor.get_result_csv_path()
             if not result_csv_path:
                 # Fallback search
-                import glob
-                csv_pattern = os.path.join(processor.working_dir, "**", "*_with_brand_data.csv")
-                csv_files = glob.glob(csv_pattern, recursive=True)
-                result_csv_path = csv_files[0] if csv_files else None
+                result_csv_path = cached_result_csv(processor.working_dir)
             
-            if result_csv_path and os.path.exists(result_csv_path):
-                try:
-                    with open(result_csv_path, 'rb') as f:
-                        csv_data = f.read()
-                    
-                    result_filename = os.path.basename(result_csv_path)
-                    
-                    st.download_button(
-                        "📥 Download Results CSV",
-                        data=csv_data,
-                        file_name=result_filename,
-                        mime='text/csv',
-                        type="primary"
-                    )
-                    
-                    file_size_kb = len(csv_data) / 1024
-                    st.info(f"✅ CSV ready: {result_filename} ({file_size_kb:.1f} KB)")
-                    
-                    # Show session stats
-                    session_status = processor.get_session_status()
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Total Brands", session_status.get('total_brands', 0))
-                    with col2:
-                        st.metric("Completed", session_status.get('completed_brands', 0))
-                    with col3:
-                        st.metric("Failed", session_status.get('failed_brands', 0))
-                    
-                except Exception as e:
-                    st.error(f"❌ Error reading CSV file: {e}")
+            if render_result_download(result_csv_path):
+                # Show session stats
+                session_status = processor.get_session_status()
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total Brands", session_status.get('total_brands', 0))
+                with col2:
+                    st.metric("Completed", session_status.get('completed_brands', 0))
+                with col3:
+                    st.metric("Failed", session_status.get('failed_brands', 0))
             else:
                 st.warning("⚠️ CSV file not found.")
             
@@ -531,112 +926,35 @@ def main():
         
         # Display real-time status
         if processor.is_processing():
-            # Current status
-            status = processor.get_processing_status()
-            st.write("🐛 DEBUG: Processing active, status:", status)  # Debug line
-            if status:
-                
-                col1, col2, col3 = st.columns([2, 1, 1])
-                with col1:
-                    if status.get('current_brand'):
-                        st.info(f"🔄 Processing: **{status['current_brand']}** ({status.get('current_stage', 'unknown')})")
-                    else:
-                        st.info(f"🔄 Phase: {status.get('phase', 'unknown').title()}")
-                
-                with col2:
-                    completed = status.get('completed_brands', 0)
-                    total = status.get('total_brands', 1)
-                    st.metric("Completed", f"{completed}/{total}")
-                
-                with col3:
-                    progress_pct = status.get('progress', 0) * 100
-                    st.metric("Progress", f"{progress_pct:.0f}%")
-                
-                # Progress bar
-                overall_progress = completed / total if total > 0 else 0
-                st.progress(overall_progress)
-                
-                # Last update time
-                if status.get('last_update'):
-                    st.caption(f"Last update: {status['last_update'][11:19]}")
-            
-            # Session status table (updated every few seconds)
-            if processor.session_manager.current_session:
-                session_status = processor.get_session_status()
-                
-                if session_status.get('brands'):
-                    st.subheader("📊 Brand Progress Table")
-                    display_progress_table(session_status['brands'])
-                    
-                    # Status summary
-                    status_counts = session_status.get('status_counts', {})
-                    if status_counts:
-                        cols = st.columns(len(status_counts))
-                        for i, (status, count) in enumerate(status_counts.items()):
-                            with cols[i]:
-                                st.metric(status.title(), count)
-            
-            # Auto-refresh only if still processing (non-blocking)
-            if st.session_state.processing and processor.is_processing():
-                # Add a small delay to prevent excessive CPU usage
-                # But use a progress bar instead of blocking sleep
-                progress_container = st.empty()
-                with progress_container.container():
-                    st.info("🔄 Processing in progress... Page will auto-update")
-                
-                # Trigger refresh without blocking
-                st.rerun()
-            elif st.session_state.processing and not processor.is_processing():
-                # Processing finished, update state
-                st.write("🐛 DEBUG: Thread finished, updating processing state to False")
-                st.session_state.processing = False
-                st.rerun()
+            interval = st.session_state.get('progress_interval', 3)
+            st.fragment(processing_progress_panel, run_every=interval)()
             
         else:
             # Processing completed or stopped
             status = processor.get_processing_status()
-            st.write("🐛 DEBUG: Not processing, status:", status)  # Debug line
-            st.write("🐛 DEBUG: Session state processing:", st.session_state.processing)  # Debug line
+            download_shown = False  # One download button per run, whichever check finds the file first
+            debug_write("🐛 DEBUG: Not processing, status:", status)  # Debug line
+            debug_write("🐛 DEBUG: Session state processing:", st.session_state.processing)  # Debug line
             
             # Force show completion if processing should be done
             if not status and processor.session_manager.current_session:
                 session_status = processor.get_session_status()
                 if session_status.get('completed_at'):
                     st.success("✅ Processing completed (detected from session)!")
-                    st.write("🐛 DEBUG: Forced completion detection")
+                    debug_write("🐛 DEBUG: Forced completion detection")
                     
                     # Show download section even without proper status
-                    st.subheader("📥 Download Results")
-                    result_csv_path = processor.get_result_csv_path()
-                    
-                    if result_csv_path and os.path.exists(result_csv_path):
-                        try:
-                            with open(result_csv_path, 'rb') as f:
-                                csv_data = f.read()
-                            
-                            result_filename = os.path.basename(result_csv_path)
-                            
-                            st.download_button(
-                                "📥 Download Results CSV",
-                                data=csv_data,
-                                file_name=result_filename,
-                                mime='text/csv',
-                                type="primary"
-                            )
-                            
-                            file_size_kb = len(csv_data) / 1024
-                            st.info(f"✅ CSV ready: {result_filename} ({file_size_kb:.1f} KB)")
-                            
-                        except Exception as e:
-                            st.error(f"❌ Error reading CSV file: {e}")
-                    else:
-                        st.warning("⚠️ CSV file not found. Check the processing logs.")
+                    if not download_shown:
+                        st.subheader("📥 Download Results")
+                        download_shown = render_result_download(processor.get_result_csv_path())
+                        if not download_shown:
+                            st.warning("⚠️ CSV file not found. Check the processing logs.")
             
             # Fallback completion check - if processing stopped and session has completion timestamp
             if not processor.is_processing() and processor.session_manager.current_session:
                 session_status = processor.get_session_status()
                 if session_status.get('completed_at') and not status.get('phase') == 'completed':
-                    st.write("🐛 DEBUG: Fallback completion detection triggered")
+                    debug_write("🐛 DEBUG: Fallback completion detection triggered")
                     
                     st.success("✅ Processing completed successfully!")
                     
@@ -650,94 +968,44 @@ def main():
                         st.metric("Failed", session_status.get('failed_brands', 0))
                     
                     # Download results
-                    st.subheader("📥 Download Results")
-                    result_csv_path = processor.get_result_csv_path()
-                    
-                    if result_csv_path and os.path.exists(result_csv_path):
-                        try:
-                            with open(result_csv_path, 'rb') as f:
-                                csv_data = f.read()
-                            
-                            result_filename = os.path.basename(result_csv_path)
-                            
-                            st.download_button(
-                                "📥 Download Results CSV",
-                                data=csv_data,
-                                file_name=result_filename,
-                                mime='text/csv',
-                                type="primary"
-                            )
-                            
-                            file_size_kb = len(csv_data) / 1024
-                            st.info(f"✅ CSV ready: {result_filename} ({file_size_kb:.1f} KB)")
-                            
-                        except Exception as e:
-                            st.error(f"❌ Error reading CSV file: {e}")
-                    else:
-                        st.warning("⚠️ CSV file not found. Check the processing logs.")
+                    if not download_shown:
+                        st.subheader("📥 Download Results")
+                        download_shown = render_result_download(processor.get_result_csv_path())
+                        if not download_shown:
+                            st.warning("⚠️ CSV file not found. Check the processing logs.")
             
             # Ultimate fallback - just check if CSV exists and processing isn't active
-            if not processor.is_processing():
+            if not download_shown and not processor.is_processing():
                 result_csv_path = processor.get_result_csv_path()
-                st.write(f"🐛 DEBUG: Processing: {processor.is_processing()}, CSV Path: {result_csv_path}")
-                st.write(f"🐛 DEBUG: Path exists: {os.path.exists(result_csv_path) if result_csv_path else 'No path'}")
-                
-                # Also check temp directory directly for any CSV files (including subdirectories)
-                import glob
-                temp_csv_pattern = os.path.join(processor.working_dir, "*_with_brand_data.csv")
-                temp_csv_files = glob.glob(temp_csv_pattern)
-                
-                # Also search in session subdirectories  
-                session_csv_pattern = os.path.join(processor.working_dir, "**", "*_with_brand_data.csv")
-                session_csv_files = glob.glob(session_csv_pattern, recursive=True)
+                if DEBUG_UI:
+                    debug_write(f"🐛 DEBUG: Processing: {processor.is_processing()}, CSV Path: {result_csv_path}")
+                    debug_write(f"🐛 DEBUG: Path exists: {os.path.exists(result_csv_path) if result_csv_path else 'No path'}")
                 
-                st.write(f"🐛 DEBUG: Temp CSV pattern: {temp_csv_pattern}")
-                st.write(f"🐛 DEBUG: Temp CSV files: {temp_csv_files}")
-                st.write(f"🐛 DEBUG: Session CSV pattern: {session_csv_pattern}")
-                st.write(f"🐛 DEBUG: Session CSV files: {session_csv_files}")
+                # Prefer the session manager's path; only scan the temp directory and its
+                # session folders when that file isn't there
+                if cached_stat(result_csv_path) is not None:
+                    csv_file_to_use = result_csv_path
+                else:
+                    csv_file_to_use = cached_result_csv(processor.working_dir)
+                    debug_write("🐛 DEBUG: Found CSV file:", csv_file_to_use)
                 
-                # Combine all found CSV files
-                all_csv_files = temp_csv_files + session_csv_files
-                
-                # Use either method to find CSV - prefer session manager, then any found CSV
-                csv_file_to_use = result_csv_path if (result_csv_path and os.path.exists(result_csv_path)) else (all_csv_files[0] if all_csv_files else None)
-                
-                st.write(f"🐛 DEBUG: Selected CSV file: {csv_file_to_use}")
+                debug_write("🐛 DEBUG: Selected CSV file:", csv_file_to_use)
                 
                 if csv_file_to_use:
-                    st.write("🐛 DEBUG: Ultimate fallback - CSV file found, showing download")
+                    debug_write("🐛 DEBUG: Ultimate fallback - CSV file found, showing download")
                     
                     st.subheader("📥 Download Results (File Detected)")
                     
-                    try:
-                        with open(csv_file_to_use, 'rb') as f:
-                            csv_data = f.read()
-                        
-                        result_filename = os.path.basename(csv_file_to_use)
-                        
-                        st.download_button(
-                            "📥 Download Results CSV",
-                            data=csv_data,
-                            file_name=result_filename,
-                            mime='text/csv',
-                            type="primary",
-                            key="ultimate_fallback_download"  # Unique key to avoid conflicts
-                        )
-                        
-                        file_size_kb = len(csv_data) / 1024
-                        st.info(f"✅ CSV ready: {result_filename} ({file_size_kb:.1f} KB)")
-                        
-                    except Exception as e:
-                        st.error(f"❌ Error reading CSV file: {e}")
+                    download_shown = render_result_download(csv_file_to_use, key="ultimate_fallback_download")  # Unique key to avoid conflicts
             
             if status:
-                # Debug: Show current status
-                st.write(f"🐛 DEBUG: Current status - Phase: {status.get('phase')}, Processing: {processor.is_processing()}")
-                st.write(f"🐛 DEBUG: Full status object: {status}")
-                
-                # Also check processor's internal status
-                processor_status = processor.get_processing_status()
-                st.write(f"🐛 DEBUG: Processor status: {processor_status}")
+                # Debug: Show current status, without formatting anything unless debugging is on
+                if DEBUG_UI:
+                    debug_write(f"🐛 DEBUG: Current status - Phase: {status.get('phase')}, Processing: {processor.is_processing()}")
+                    debug_write("🐛 DEBUG: Full status object:", status)
+                    
+                    # Also check processor's internal status
+                    debug_write("🐛 DEBUG: Processor status:", processor.get_processing_status())
                 
                 if status.get('phase') == 'completed':
                     st.success("✅ Processing completed successfully!")
@@ -760,33 +1028,11 @@ def main():
                             display_progress_table(session_status['brands'])
                     
                     # Download results
-                    st.subheader("📥 Download Results")
-                    result_csv_path = processor.get_result_csv_path()
-                    
-                    if result_csv_path and os.path.exists(result_csv_path):
-                        try:
-                            with open(result_csv_path, 'rb') as f:
-                                csv_data = f.read()
-                            
-                            # Get just the filename for download
-                            result_filename = os.path.basename(result_csv_path)
-                            
-                            st.download_button(
-                                "📥 Download Results CSV",
-                                data=csv_data,
-                                file_name=result_filename,
-                                mime='text/csv',
-                                type="primary"
-                            )
-                            
-                            # Show file info
-                            file_size_kb = len(csv_data) / 1024
-                            st.info(f"✅ CSV ready: {result_filename} ({file_size_kb:.1f} KB)")
-                            
-                        except Exception as e:
-                            st.error(f"❌ Error reading CSV file: {e}")
-                    else:
-                        st.warning("⚠️ CSV file not found. Check the processing logs.")
+                    if not download_shown:
+                        st.subheader("📥 Download Results")
+                        download_shown = render_result_download(processor.get_result_csv_path())
+                        if not download_shown:
+                            st.warning("⚠️ CSV file not found. Check the processing logs.")
                     
                     # Reset button for new processing
                     if st.button("🔄 Process New File", type="secondary"):
@@ -11,7 +11,7 @@ log in manually just once.
 **Prerequisites:**
 1. Python 3.7+ installed.
 2. Required packages installed:
-   pip install playwright beautifulsoup4 anthropic pdfplumber pytesseract pdf2image
+   pip install playwright beautifulsoup4 lxml anthropic pdfplumber pytesseract pdf2image
    playwright install
 3. Anthropic API key set as environment variable:
    export ANTHROPIC_API_KEY="your-api-key-here"
@@ -31,15 +31,233 @@ log in manually just once.
 """
 import os
 import sys
+import csv
+import re
 import time
+import contextlib
+import functools
+import gzip
+import json
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from playwright.sync_api import sync_playwright, expect
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml's C parser is several times faster than html.parser on full report pages
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# selectolax's Lexbor parser is much faster again when only the text is needed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Report data lives in <body>; skipping <head> avoids building its inline styles and scripts
+REPORT_BODY = SoupStrainer('body')
+
+def parse_report_body(html_content: str) -> BeautifulSoup:
+    """
+    Parse only the <body> of a report page, falling back to the whole document if there isn't one.
+    """
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=REPORT_BODY)
+    if not soup.contents:
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+    return soup
+
+# extract_metrics_from_html and extract_text_from_html both need the text of the same page; parse it once
+@functools.lru_cache(maxsize=2)
+def report_text(html_content: str) -> str:
+    """
+    Text of a report page's <body> with scripts and styles removed, via selectolax when available.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html_content)
+        for node in tree.css('script, style'):
+            node.decompose()
+        root = tree.body or tree.root
+        return root.text() if root is not None else ''
+    
+    soup = parse_report_body(html_content)
+    for script in soup(["script", "style"]):
+        script.decompose()
+    return soup.get_text()
+
+# --- Report text patterns ---
+# Compiled once at import; the extractors below run them over every report's full text
+DOLLAR_RE = re.compile(r'\$[\d,]+(?:\.\d{2})?')
+PERCENT_RE = re.compile(r'[+-]?[\d.]+%')
+WHITESPACE_RE = re.compile(r'\s+')
+BRAND_SHARE_RE = re.compile(r'([A-Z][A-Z\s&]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)', re.MULTILINE)
+CATEGORY_SHARE_RE = re.compile(r'([A-Z][a-z\s]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)', re.MULTILINE)
+WEEKLY_REVENUE_RE = re.compile(r'Weekly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?)\s*(?:.*?([+-]?\$?[\d,]+(?:\.\d{2})?)\s*or\s*([+-]?[\d.]+%)|.*?([+-][\d.]+%))?', re.IGNORECASE | re.DOTALL)
+ASIN_RE = re.compile(r'ASIN:?\s*([A-Z0-9]{10})\s*.*?Title:?\s*([^\n]+).*?(?:Sales Rank:?\s*#?([\d,]+))?.*?(?:Monthly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?))?.*?(?:([+-]?[\d.]+%))?', re.IGNORECASE | re.DOTALL)
+SEARCH_TERM_RE = re.compile(r'"([^"]+)"\s*\(#?(\d+),?\s*([\d,]+)\s*searches?\)', re.IGNORECASE)
+KEYWORD_METRICS_RE = re.compile(r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s+([\d,]+|[\d.]+%)', re.IGNORECASE)
+# Looser variants for the DOM's report text, where the rank/searches suffix and colon are optional
+DOM_SEARCH_TERM_RE = re.compile(r'"([^"]+)"\s*\(?#?(\d+)(?:,\s*([\d,]+)\s*searches?)?\)?', re.IGNORECASE)
+DOM_KEYWORD_METRICS_RE = re.compile(r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s*:?\s*([\d,]+|[\d.]+%)', re.IGNORECASE)
+
+# (metrics key, patterns) pairs used by extract_metrics_from_html
+METRIC_PATTERN_GROUPS = [
+    # Revenue patterns
+    ('revenue_data', [
+        r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|M|thousand|K|billion|B))?',
+        r'Revenue:?\s*\$[\d,]+',
+        r'Monthly.*?\$[\d,]+',
+        r'Sales:?\s*\$[\d,]+'
+    ]),
+    # Growth patterns
+    ('growth_data', [
+        r'[+\-]?\d+(?:\.\d+)?%\s*(?:growth|increase|decrease|change)',
+        r'(?:up|down|grew|declined)\s*\d+(?:\.\d+)?%',
+        r'Growth:?\s*[+\-]?\d+(?:\.\d+)?%'
+    ]),
+    # Ranking patterns
+    ('rankings', [
+        r'#\d+(?:\s*(?:rank|position|place))?',
+        r'Rank(?:ed)?:?\s*#?\d+',
+        r'Position:?\s*#?\d+',
+        r'Top\s*\d+'
+    ]),
+    # Score patterns
+    ('scores', [
+        r'Score:?\s*\d+(?:\.\d+)?(?:\s*/\s*\d+)?',
+        r'Rating:?\s*\d+(?:\.\d+)?',
+        r'\d+(?:\.\d+)?\s*(?:out of|/)\s*\d+'
+    ]),
+    # Competition patterns
+    ('competition_data', [
+        r'\d+(?:,\d{3})*\s*(?:sellers|competitors|brands)',
+        r'Competition:?\s*\d+',
+        r'Market share:?\s*\d+(?:\.\d+)?%'
+    ]),
+    # Product count patterns
+    ('product_counts', [
+        r'\d+(?:,\d{3})*\s*(?:products|items|SKUs|listings)',
+        r'Products:?\s*\d+(?:,\d{3})*'
+    ]),
+    # General percentage patterns
+    ('percentages', [
+        r'\d+(?:\.\d+)?%(?!\s*(?:growth|increase|decrease))'
+    ])
+]
+
+# Compiled once; each pattern keeps its own scan because matches overlap
+# (e.g. 'ranked #2' and '#2 position'), which an alternation would drop
+METRIC_PATTERNS = [
+    (key, [re.compile(p, re.IGNORECASE) for p in patterns]) for key, patterns in METRIC_PATTERN_GROUPS
+]
+
+OTHER_FINANCIAL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'\$[\d,]+(?:\.\d{2})?(?!\s*(?:million|thousand|billion))',
+    r'Cost:?\s*\$[\d,]+',
+    r'Price:?\s*\$[\d,]+'
+]]
+
+# Unique matches kept per metrics key
+METRIC_LIMIT = 10
+
+def _first_unique(matches, limit):
+    # First `limit` distinct match strings, in order; stops the scan as soon as the cap is hit
+    found = {}
+    for match in matches:
+        found[match.group()] = None
+        if len(found) >= limit:
+            break
+    return list(found)
+
+def _collect_metric(patterns, text, per_pattern):
+    # Up to `per_pattern` matches from each pattern, deduped in order and capped at METRIC_LIMIT
+    found = {}
+    for pattern in patterns:
+        for match in islice(pattern.finditer(text), per_pattern):
+            found[match.group()] = None
+            if len(found) >= METRIC_LIMIT:
+                return list(found)
+    return list(found)
+
+# Rows kept per table (ASINs, search terms, brand and category shares) in extract_smartscout_data
+STRUCTURED_ROW_LIMIT = 50
+
+def _first_groups(pattern, text: str, limit: int) -> list:
+    # Like pattern.findall(text)[:limit], but the scan stops once `limit` matches are found
+    return [match.groups('') for match in islice(pattern.finditer(text), limit)]
+
+# Spaces and characters that are not allowed in file names all become underscores
+BRAND_SLUG_TABLE = str.maketrans({c: '_' for c in ' \\/:*?"<>|'})
+
+@functools.lru_cache(maxsize=4096)
+def _brand_slug(brand_name: str) -> str:
+    """
+    File name stem for a brand's report and summary, e.g. "Acme Co" -> "acme_co".
+    """
+    return brand_name.lower().translate(BRAND_SLUG_TABLE)
 
 # --- Configuration ---
 # The directory where your browser session data will be stored.
 # This allows you to stay logged in between runs.
 USER_DATA_DIR = "./playwright_user_data"
 SMARTSCOUT_URL = "https://app.smartscout.com/app/tailored-report"
+# Search box on the Brand Reports page, most specific first
+SEARCH_SELECTORS = (
+    'input[placeholder*="search" i]',
+    'input[placeholder*="brand" i]',
+    'input[type="search"]',
+    '.search-input',
+    '[data-testid*="search"]',
+)
+# Concurrent Claude requests when analysing a chunked report
+LLM_CHUNK_WORKERS = 5
+# Brands summarized at once by a summary batch; each may also run LLM_CHUNK_WORKERS chunk requests
+SUMMARY_WORKERS = 4
+# Cheaper model that compresses each chunk's analysis before the final synthesis
+CHUNK_COMPACTION_MODEL = "claude-3-5-haiku-latest"
+# Send chunk prompts through the cheaper, asynchronous Message Batches API (set by the --batch-api flag)
+LLM_BATCH_API = False
+# Longest wait for a Message Batch before it is cancelled and the chunks run synchronously instead
+BATCH_API_MAX_WAIT = 30 * 60
+# Save downloaded reports as gzip-compressed .html.gz (set by the --gzip flag)
+GZIP_HTML = False
+# Run the automation browser without a window (cleared by the --headed flag); --setup always shows one
+HEADLESS = True
+# Resource types the saved HTML never needs; aborting them lets the report settle sooner
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+# Report PDFs are plain text pages: 150 DPI grayscale is plenty for Tesseract and far fewer pixels than the default
+OCR_DPI = 150
+# LSTM engine only, and treat each page as one uniform block instead of running page-segmentation analysis
+TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+def rasterize_pdf(pdf_path: str) -> list:
+    """
+    Render PDF pages to grayscale images for OCR, letting poppler rasterize several pages at once.
+    """
+    from pdf2image import convert_from_path
+    
+    return convert_from_path(pdf_path, dpi=OCR_DPI, grayscale=True, thread_count=min(4, os.cpu_count() or 1))
+
+def ocr_pages(images) -> list:
+    """
+    OCR page images concurrently, returning their text in page order.
+    """
+    import pytesseract
+    
+    if not images:
+        return []
+    # Each image_to_string call waits on its own tesseract process, so threads are enough to use every core
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(images))) as executor:
+        return list(executor.map(lambda image: pytesseract.image_to_string(image, config=TESSERACT_CONFIG), images))
 
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
@@ -48,14 +266,16 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     try:
         import pdfplumber
         
-        text_content = ""
+        # Page texts are collected and joined once; += on the whole document is quadratic
+        text_parts = []
         
         # First try regular text extraction
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text_content += page_text + "\n"
+                    text_parts.append(page_text)
+        text_content = "\n".join(text_parts)
         
         # If no text found, try OCR approach
         if not text_content.strip():
@@ -65,14 +285,11 @@ def extract_text_from_pdf(pdf_path: str) -> str:
                 from pdf2image import convert_from_path
                 
                 # Convert PDF pages to images
-                images = convert_from_path(pdf_path)
+                images = rasterize_pdf(pdf_path)
                 
-                for i, image in enumerate(images):
-                    print(f"🔍 Processing page {i+1} with OCR...")
-                    # Extract text from image using OCR
-                    page_text = pytesseract.image_to_string(image)
-                    if page_text:
-                        text_content += page_text + "\n"
+                print(f"🔍 Processing {len(images)} pages with OCR...")
+                # Extract text from the page images using OCR
+                text_content = "\n".join(page_text for page_text in ocr_pages(images) if page_text)
                 
                 print(f"✓ OCR completed on {len(images)} pages")
                 
@@ -124,7 +341,6 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
     
     # Fallback to legacy extraction
     print("⚠ Using legacy DOM extraction - consider updating to enhanced version")
-    import re
     
     data = {
         'weekly_revenue': None,
@@ -147,7 +363,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
         # Try to find weekly/monthly revenue
         for revenue in page_data['revenue_elements']:
             # Clean and extract dollar amounts
-            dollar_match = re.search(r'\$[\d,]+(?:\.\d{2})?', revenue)
+            dollar_match = DOLLAR_RE.search(revenue)
             if dollar_match and not data['weekly_revenue']:
                 data['weekly_revenue'] = dollar_match.group()
     
@@ -177,8 +393,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
         text = page_data['report_text']
         
         # Extract search terms from the text
-        search_term_pattern = r'"([^"]+)"\s*\(?#?(\d+)(?:,\s*([\d,]+)\s*searches?)?\)?'
-        search_matches = re.findall(search_term_pattern, text, re.IGNORECASE)
+        search_matches = DOM_SEARCH_TERM_RE.findall(text)
         for match in search_matches:
             data['search_terms'].append({
                 'term': match[0],
@@ -187,8 +402,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
             })
         
         # Extract brand data from tables in the text
-        brand_pattern = r'([A-Z][A-Z\s&]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)'
-        brand_matches = re.findall(brand_pattern, text, re.MULTILINE)
+        brand_matches = BRAND_SHARE_RE.findall(text)
         for match in brand_matches:
             data['brand_data'].append({
                 'brand': match[0].strip(),
@@ -197,8 +411,7 @@ def extract_smartscout_data_from_dom(page_data: dict) -> dict:
             })
         
         # Extract keyword metrics
-        keyword_metrics_pattern = r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s*:?\s*([\d,]+|[\d.]+%)'
-        keyword_matches = re.findall(keyword_metrics_pattern, text, re.IGNORECASE)
+        keyword_matches = DOM_KEYWORD_METRICS_RE.findall(text)
         for match in keyword_matches:
             data['keyword_metrics'][match[0]] = match[1]
     
@@ -208,8 +421,6 @@ def extract_smartscout_data(text_content: str) -> dict:
     """
     Extract specific SmartScout data structures from text content.
     """
-    import re
-    
     data = {
         'weekly_revenue': None,
         'revenue_change': None,
@@ -223,16 +434,14 @@ def extract_smartscout_data(text_content: str) -> dict:
     }
     
     # Weekly Revenue pattern
-    weekly_rev_pattern = r'Weekly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?)\s*(?:.*?([+-]?\$?[\d,]+(?:\.\d{2})?)\s*or\s*([+-]?[\d.]+%)|.*?([+-][\d.]+%))?'
-    match = re.search(weekly_rev_pattern, text_content, re.IGNORECASE | re.DOTALL)
+    match = WEEKLY_REVENUE_RE.search(text_content)
     if match:
         data['weekly_revenue'] = f"${match.group(1)}"
         if match.group(2):
             data['revenue_change'] = f"{match.group(2)} or {match.group(3)}" if match.group(3) else match.group(4)
     
     # ASIN data extraction
-    asin_pattern = r'ASIN:?\s*([A-Z0-9]{10})\s*.*?Title:?\s*([^\n]+).*?(?:Sales Rank:?\s*#?([\d,]+))?.*?(?:Monthly Revenue:?\s*\$?([\d,]+(?:\.\d{2})?))?.*?(?:([+-]?[\d.]+%))?'
-    asin_matches = re.findall(asin_pattern, text_content, re.IGNORECASE | re.DOTALL)
+    asin_matches = _first_groups(ASIN_RE, text_content, STRUCTURED_ROW_LIMIT)
     for match in asin_matches:
         asin_data = {
             'asin': match[0],
@@ -244,8 +453,7 @@ def extract_smartscout_data(text_content: str) -> dict:
         data['asin_data'].append(asin_data)
     
     # Search terms extraction
-    search_term_pattern = r'"([^"]+)"\s*\(#?(\d+),?\s*([\d,]+)\s*searches?\)'
-    search_matches = re.findall(search_term_pattern, text_content, re.IGNORECASE)
+    search_matches = _first_groups(SEARCH_TERM_RE, text_content, STRUCTURED_ROW_LIMIT)
     for match in search_matches:
         data['search_terms'].append({
             'term': match[0],
@@ -254,8 +462,7 @@ def extract_smartscout_data(text_content: str) -> dict:
         })
     
     # Brand market share data
-    brand_pattern = r'([A-Z][A-Z\s&]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)'
-    brand_matches = re.findall(brand_pattern, text_content, re.MULTILINE)
+    brand_matches = _first_groups(BRAND_SHARE_RE, text_content, STRUCTURED_ROW_LIMIT)
     for match in brand_matches:
         data['brand_data'].append({
             'brand': match[0].strip(),
@@ -264,10 +471,10 @@ def extract_smartscout_data(text_content: str) -> dict:
         })
     
     # Category market share
-    category_pattern = r'([A-Z][a-z\s]+)\s+([\d.]+%)\s+([+-]?[\d.]+%)'
-    category_matches = re.findall(category_pattern, text_content, re.MULTILINE)
+    category_matches = _first_groups(CATEGORY_SHARE_RE, text_content, STRUCTURED_ROW_LIMIT)
+    brand_names = {b['brand'] for b in data['brand_data']}
     for match in category_matches:
-        if match[0].strip() not in [b['brand'] for b in data['brand_data']]:
+        if match[0].strip() not in brand_names:
             data['market_categories'].append({
                 'category': match[0].strip(),
                 'share': match[1],
@@ -275,20 +482,15 @@ def extract_smartscout_data(text_content: str) -> dict:
             })
     
     # Keyword metrics
-    keyword_metrics_pattern = r'(Unique Keywords|Organic Win Rate|Sponsored Win Rate|Shared Keywords)\s+([\d,]+|[\d.]+%)'
-    keyword_matches = re.findall(keyword_metrics_pattern, text_content, re.IGNORECASE)
+    keyword_matches = KEYWORD_METRICS_RE.findall(text_content)
     for match in keyword_matches:
         data['keyword_metrics'][match[0]] = match[1]
     
     # Revenue numbers (general)
-    revenue_pattern = r'\$[\d,]+(?:\.\d{2})?'
-    revenue_matches = re.findall(revenue_pattern, text_content)
-    data['all_revenue_figures'] = list(set(revenue_matches))[:10]  # Top 10 unique
+    data['all_revenue_figures'] = _first_unique(DOLLAR_RE.finditer(text_content), 10)  # First 10 unique
     
     # Percentage changes (general)
-    percent_pattern = r'[+-]?[\d.]+%'
-    percent_matches = re.findall(percent_pattern, text_content)
-    data['all_percentages'] = list(set(percent_matches))[:15]  # Top 15 unique
+    data['all_percentages'] = _first_unique(PERCENT_RE.finditer(text_content), 15)  # First 15 unique
     
     return data
 
@@ -311,8 +513,8 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
             'other_financial': []
         }
         
-        text_content = ""
-        tables_data = []
+        text_parts = []
+        table_parts = []
         
         # First try regular text extraction
         with pdfplumber.open(pdf_path) as pdf:
@@ -320,12 +522,13 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
                 # Extract text
                 page_text = page.extract_text()
                 if page_text:
-                    text_content += page_text + "\n"
+                    text_parts.append(page_text)
                 
-                # Extract tables (PDFs often have structured data in tables)
-                tables = page.extract_tables()
-                for table in tables:
-                    tables_data.extend([cell for row in table for cell in row if cell])
+                # Extract tables (PDFs often have structured data in tables), one string of cells per page
+                table_text = " ".join(str(cell) for table in page.extract_tables() for row in table for cell in row if cell)
+                if table_text:
+                    table_parts.append(table_text)
+        text_content = "\n".join(text_parts)
         
         # If no text found, try OCR approach
         if not text_content.strip():
@@ -334,13 +537,10 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
                 from pdf2image import convert_from_path
                 
                 # Convert PDF pages to images
-                images = convert_from_path(pdf_path)
+                images = rasterize_pdf(pdf_path)
                 
-                for image in images:
-                    # Extract text from image using OCR
-                    page_text = pytesseract.image_to_string(image)
-                    if page_text:
-                        text_content += page_text + "\n"
+                # Extract text from the page images using OCR
+                text_content = "\n".join(page_text for page_text in ocr_pages(images) if page_text)
                         
             except ImportError:
                 pass  # OCR libraries not available
@@ -348,7 +548,7 @@ def extract_metrics_from_pdf(pdf_path: str) -> dict:
                 pass  # OCR failed
         
         # Combine text and table data for pattern matching
-        all_content = text_content + " " + " ".join(str(item) for item in tables_data if item)
+        all_content = text_content + " " + " ".join(table_parts)
         
         # Use the new structured extraction
         if all_content.strip():
@@ -377,106 +577,14 @@ def extract_metrics_from_html(html_content: str) -> dict:
     """
     Extract specific metrics from SmartScout report HTML.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-    
-    metrics = {
-        'revenue_data': [],
-        'growth_data': [],
-        'rankings': [],
-        'scores': [],
-        'competition_data': [],
-        'product_counts': [],
-        'percentages': [],
-        'other_financial': []
-    }
-    
-    # Get all text content
-    text = soup.get_text()
-    
-    import re
-    
-    # Revenue patterns
-    revenue_patterns = [
-        r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|M|thousand|K|billion|B))?',
-        r'Revenue:?\s*\$[\d,]+',
-        r'Monthly.*?\$[\d,]+',
-        r'Sales:?\s*\$[\d,]+'
-    ]
-    
-    # Growth patterns  
-    growth_patterns = [
-        r'[+\-]?\d+(?:\.\d+)?%\s*(?:growth|increase|decrease|change)',
-        r'(?:up|down|grew|declined)\s*\d+(?:\.\d+)?%',
-        r'Growth:?\s*[+\-]?\d+(?:\.\d+)?%'
-    ]
-    
-    # Ranking patterns
-    ranking_patterns = [
-        r'#\d+(?:\s*(?:rank|position|place))?',
-        r'Rank(?:ed)?:?\s*#?\d+',
-        r'Position:?\s*#?\d+',
-        r'Top\s*\d+'
-    ]
-    
-    # Score patterns
-    score_patterns = [
-        r'Score:?\s*\d+(?:\.\d+)?(?:\s*/\s*\d+)?',
-        r'Rating:?\s*\d+(?:\.\d+)?',
-        r'\d+(?:\.\d+)?\s*(?:out of|/)\s*\d+'
-    ]
-    
-    # Competition patterns
-    competition_patterns = [
-        r'\d+(?:,\d{3})*\s*(?:sellers|competitors|brands)',
-        r'Competition:?\s*\d+',
-        r'Market share:?\s*\d+(?:\.\d+)?%'
-    ]
-    
-    # Product count patterns
-    product_patterns = [
-        r'\d+(?:,\d{3})*\s*(?:products|items|SKUs|listings)',
-        r'Products:?\s*\d+(?:,\d{3})*'
-    ]
-    
-    # General percentage patterns
-    percentage_patterns = [
-        r'\d+(?:\.\d+)?%(?!\s*(?:growth|increase|decrease))'
-    ]
-    
-    # Extract metrics using patterns
-    pattern_groups = [
-        (revenue_patterns, 'revenue_data'),
-        (growth_patterns, 'growth_data'), 
-        (ranking_patterns, 'rankings'),
-        (score_patterns, 'scores'),
-        (competition_patterns, 'competition_data'),
-        (product_patterns, 'product_counts'),
-        (percentage_patterns, 'percentages')
-    ]
+    # Get all text content (scripts and styles stripped)
+    text = report_text(html_content)
     
-    for patterns, key in pattern_groups:
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            metrics[key].extend(matches[:10])  # Limit matches per pattern
+    # Extract metrics using patterns; each scan stops once its caps are reached
+    metrics = {key: _collect_metric(patterns, text, METRIC_LIMIT) for key, patterns in METRIC_PATTERNS}
     
     # Look for other financial data
-    other_financial_patterns = [
-        r'\$[\d,]+(?:\.\d{2})?(?!\s*(?:million|thousand|billion))',
-        r'Cost:?\s*\$[\d,]+',
-        r'Price:?\s*\$[\d,]+'
-    ]
-    
-    for pattern in other_financial_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        metrics['other_financial'].extend(matches[:5])
-    
-    # Remove duplicates and clean up
-    for key in metrics:
-        metrics[key] = list(set(metrics[key]))[:10]  # Remove dupes, limit to 10
+    metrics['other_financial'] = _collect_metric(OTHER_FINANCIAL_PATTERNS, text, 5)
     
     return metrics
 
@@ -484,69 +592,92 @@ def extract_text_from_html(html_content: str) -> str:
     """
     Extract readable text from HTML content, focusing on report data.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Get text content, scripts and styles stripped
+    text = report_text(html_content)
     
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
+    # Clean up text - collapse every whitespace run (newlines included) to one space
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+# Markup that carries no report data: scripts, styles, comments, head links/meta, inline styles, base64 blobs
+NON_CONTENT_HTML_RE = re.compile(
+    r'<(script|style|noscript)\b[^>]*>.*?</\1\s*>'
+    r'|<!--.*?-->'
+    r'|<(?:link|meta)\b[^>]*>'
+    r'|\sstyle\s*=\s*(?:"[^"]*"|\'[^\']*\')'
+    r'|data:[\w/+.-]+;base64,[A-Za-z0-9+/=]+',
+    re.IGNORECASE | re.DOTALL,
+)
+HORIZONTAL_SPACE_RE = re.compile(r'[ \t\r\f\v]+')
+BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+
+def _shrink_html(html_content: str) -> str:
+    """
+    Drop markup the LLM never needs before the report is sent to it.
+    Line breaks are kept so split_html_chunks can still break between elements.
+    """
+    html_content = NON_CONTENT_HTML_RE.sub('', html_content)
+    html_content = HORIZONTAL_SPACE_RE.sub(' ', html_content)
+    return BLANK_LINES_RE.sub('\n', html_content).strip()
+
+# Closing tags that make a good place to end a chunk
+CHUNK_BREAK_MARKERS = ('</table>', '</div>', '</section>')
+
+def split_html_chunks(html_content: str, chunk_size: int) -> list:
+    """
+    Split HTML into chunks of about chunk_size characters, preferring to break after a closing table/div/section.
+    """
+    chunks = []
+    # Lines are buffered and joined once per chunk; repeated += on a growing string is quadratic
+    buf = []
+    buf_len = 0
+    buf_has_text = False
+    # Past this size any line is an acceptable break point
+    break_len = chunk_size * 0.8
     
-    # Get text content
-    text = soup.get_text()
+    for line in html_content.split('\n'):
+        # If adding this line would exceed chunk size and we have content
+        if buf_len + len(line) > chunk_size and buf_has_text:
+            # Break if the chunk is already big enough, otherwise only at a good breaking point
+            if buf_len > break_len or any(marker in line.lower() for marker in CHUNK_BREAK_MARKERS):
+                chunks.append(''.join(buf).strip())
+                buf = []
+                buf_len = 0
+                buf_has_text = False
+        
+        buf.append(line + '\n')
+        buf_len += len(line) + 1
+        buf_has_text = buf_has_text or bool(line.strip())
     
-    # Clean up text - remove extra whitespace and normalize
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = ' '.join(chunk for chunk in chunks if chunk)
+    # Add remaining content
+    if buf_has_text:
+        chunks.append(''.join(buf).strip())
     
-    return text
+    return chunks
 
-def process_with_smart_chunking(client, html_content: str, brand_name: str) -> str:
+def _call_claude(client, prompt: str, max_tokens: int = 4000, attempts: int = 3, model: str = "claude-sonnet-4-0") -> str:
     """
-    Process large HTML content with intelligent chunking that preserves structure.
+    Send one prompt to Claude, backing off and retrying on rate limits (429) and server errors (5xx).
     """
-    try:
-        # Extract key sections that should stay together
-        chunk_size = 120000  # Conservative size to stay under token limits
-        chunks = []
-        
-        # Try to split on logical HTML boundaries
-        section_markers = [
-            '<table', '</table>',
-            '<div class="brand-report', '</div>',
-            '<section', '</section>',
-            'class="keyword', 'class="product',
-            'class="competitor', 'class="search-term'
-        ]
-        
-        current_chunk = ""
-        lines = html_content.split('\n')
-        
-        for line in lines:
-            # If adding this line would exceed chunk size and we have content
-            if len(current_chunk + line) > chunk_size and current_chunk.strip():
-                # Check if we're at a good breaking point
-                is_good_break = any(marker in line.lower() for marker in ['</table>', '</div>', '</section>'])
-                
-                if is_good_break or len(current_chunk) > chunk_size * 0.8:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = line + '\n'
-                else:
-                    current_chunk += line + '\n'
+    for attempt in range(attempts):
+        try:
+            response = client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=0.3,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return response.content[0].text
+        except Exception as e:
+            status = getattr(e, 'status_code', None)
+            if attempt + 1 < attempts and status is not None and (status == 429 or status >= 500):
+                wait = 2 ** attempt
+                print(f"⏳ Claude returned {status}, retrying in {wait}s...")
+                time.sleep(wait)
             else:
-                current_chunk += line + '\n'
-        
-        # Add remaining content
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
-        
-        print(f"📄 Split into {len(chunks)} intelligent chunks")
-        
-        # Process each chunk
-        chunk_results = []
-        for i, chunk in enumerate(chunks):
-            print(f"🔍 Processing chunk {i+1}/{len(chunks)} ({len(chunk)} chars)...")
-            
-            chunk_prompt = f"""Analyze this SmartScout data chunk for "{brand_name}" and extract ALL product/keyword data:
+                raise
+
+def _chunk_prompt(brand_name: str, chunk: str, i: int, total: int) -> str:
+    return f"""Analyze this SmartScout data chunk for "{brand_name}" and extract ALL product/keyword data:
 
 **EXTRACT FROM THIS CHUNK:**
 1. **Product names/titles** with their keywords and search volumes
@@ -567,22 +698,125 @@ def process_with_smart_chunking(client, html_content: str, brand_name: str) -> s
 
 Format findings clearly. Extract ALL data - don't summarize or skip details.
 
-Chunk {i+1}/{len(chunks)}:
+Chunk {i+1}/{total}:
 {chunk}"""
-            
+
+def _compact_chunk_result(client, result: str, i: int) -> str:
+    """
+    Compress one chunk's analysis with a cheap model so the synthesis prompt stays small; falls back to the full text.
+    """
+    prompt = f"""Compress this analysis to bullet points. Preserve ALL numbers, product names, brand names, keywords, search volumes, ranks and percentages exactly:
+
+{result}"""
+    try:
+        return _call_claude(client, prompt, max_tokens=1500, model=CHUNK_COMPACTION_MODEL)
+    except Exception as e:
+        print(f"⚠ Could not compact chunk {i+1}, using full result: {e}")
+        return result
+
+def _analyze_chunk(client, brand_name: str, chunk: str, i: int, total: int) -> str:
+    """
+    Extract the product/keyword data from one chunk; errors are returned as text so the synthesis still runs.
+    """
+    print(f"🔍 Processing chunk {i+1}/{total} ({len(chunk)} chars)...")
+    
+    try:
+        result = _call_claude(client, _chunk_prompt(brand_name, chunk, i, total))
+        print(f"✅ Processed chunk {i+1}/{total}")
+        return _compact_chunk_result(client, result, i)
+    except Exception as e:
+        print(f"⚠ Error processing chunk {i+1}: {e}")
+        return f"Error processing chunk {i+1}: {e}"
+
+def _analyze_chunks_batch(client, brand_name: str, chunks: list, poll_interval: int = 15, max_wait: int = None) -> list:
+    """
+    Run every chunk prompt through the Message Batches API (half the cost, asynchronous) and return results in chunk order.
+    Returns None, after cancelling the batch, if it has not ended within max_wait seconds (BATCH_API_MAX_WAIT).
+    """
+    if max_wait is None:
+        max_wait = BATCH_API_MAX_WAIT
+    total = len(chunks)
+    batch = client.messages.batches.create(requests=[
+        {
+            "custom_id": f"chunk-{i}",
+            "params": {
+                "model": "claude-sonnet-4-0",
+                "max_tokens": 4000,
+                "temperature": 0.3,
+                "messages": [{"role": "user", "content": _chunk_prompt(brand_name, chunk, i, total)}]
+            }
+        }
+        for i, chunk in enumerate(chunks)
+    ])
+    print(f"📦 Submitted batch {batch.id} with {total} chunks, waiting for results...")
+    
+    started = time.monotonic()
+    last_report = started
+    while batch.processing_status != "ended":
+        elapsed = time.monotonic() - started
+        if elapsed >= max_wait:
+            print(f"⌛ Batch {batch.id} still running after {int(elapsed) // 60} minutes, cancelling it")
             try:
-                response = client.messages.create(
-                    model="claude-sonnet-4-0",
-                    max_tokens=4000,
-                    temperature=0.3,
-                    messages=[{"role": "user", "content": chunk_prompt}]
-                )
-                chunk_results.append(response.content[0].text)
-                print(f"✅ Processed chunk {i+1}/{len(chunks)}")
-                
+                client.messages.batches.cancel(batch.id)
             except Exception as e:
-                print(f"⚠ Error processing chunk {i+1}: {e}")
-                chunk_results.append(f"Error processing chunk {i+1}: {e}")
+                print(f"⚠ Could not cancel batch {batch.id}: {e}")
+            return None
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+        if time.monotonic() - last_report >= 60:
+            counts = batch.request_counts
+            print(f"⏳ Batch {batch.id} for '{brand_name}': {counts.succeeded + counts.errored}/{total} chunks done "
+                  f"({int(time.monotonic() - started) // 60} min elapsed)")
+            last_report = time.monotonic()
+    
+    results = {}
+    succeeded = {}
+    for entry in client.messages.batches.results(batch.id):
+        i = int(entry.custom_id.rsplit('-', 1)[1])
+        if entry.result.type == "succeeded":
+            succeeded[i] = entry.result.message.content[0].text
+            print(f"✅ Processed chunk {i+1}/{total}")
+        else:
+            print(f"⚠ Error processing chunk {i+1}: {entry.result.type}")
+            results[i] = f"Error processing chunk {i+1}: {entry.result.type}"
+    
+    # Compact the successful results, as the synchronous path does per chunk
+    with ThreadPoolExecutor(max_workers=max(1, min(LLM_CHUNK_WORKERS, len(succeeded)))) as executor:
+        futures = {i: executor.submit(_compact_chunk_result, client, text, i) for i, text in succeeded.items()}
+        results.update({i: future.result() for i, future in futures.items()})
+    
+    return [results.get(i, f"Error processing chunk {i+1}: no result") for i in range(total)]
+
+def process_with_smart_chunking(client, html_content: str, brand_name: str, use_batch_api: bool = False) -> str:
+    """
+    Process large HTML content with intelligent chunking that preserves structure.
+    """
+    try:
+        # Extract key sections that should stay together
+        chunk_size = 120000  # Conservative size to stay under token limits
+        
+        # Try to split on logical HTML boundaries
+        section_markers = [
+            '<table', '</table>',
+            '<div class="brand-report', '</div>',
+            '<section', '</section>',
+            'class="keyword', 'class="product',
+            'class="competitor', 'class="search-term'
+        ]
+        
+        chunks = split_html_chunks(html_content, chunk_size)
+        
+        print(f"📄 Split into {len(chunks)} intelligent chunks")
+        
+        chunk_results = _analyze_chunks_batch(client, brand_name, chunks) if use_batch_api else None
+        if chunk_results is None:
+            if use_batch_api:
+                print("🔁 Falling back to synchronous chunk requests")
+            # Process chunks concurrently; results stay in chunk order for the synthesis
+            with ThreadPoolExecutor(max_workers=max(1, min(LLM_CHUNK_WORKERS, len(chunks)))) as executor:
+                futures = [executor.submit(_analyze_chunk, client, brand_name, chunk, i, len(chunks))
+                           for i, chunk in enumerate(chunks)]
+                chunk_results = [future.result() for future in futures]
         
         # Final synthesis
         print("🔄 Synthesizing all chunk results...")
@@ -656,9 +890,10 @@ Combine ALL data from chunks below - don't lose any details:
     except Exception as e:
         return f"❌ Error in smart chunking: {str(e)}"
 
-def summarize_with_llm(text_content: str, brand_name: str, metrics: dict) -> str:
+def summarize_with_llm(text_content: str, brand_name: str, metrics: dict, use_batch_api: bool = False) -> str:
     """
     Summarize the report content using Anthropic's Claude API with entire HTML in one request.
+    With use_batch_api, chunks of a large report go through the Message Batches API instead.
     """
     try:
         import anthropic
@@ -683,7 +918,7 @@ def summarize_with_llm(text_content: str, brand_name: str, metrics: dict) -> str
         # Check if content is too large for single request (approx 200K token limit = ~150K characters)
         if len(content_to_analyze) > 150000:
             print("📄 Content too large, using intelligent chunking...")
-            return process_with_smart_chunking(client, content_to_analyze, brand_name)
+            return process_with_smart_chunking(client, content_to_analyze, brand_name, use_batch_api)
         
         # Single request for smaller content
         prompt = f"""Please analyze this complete SmartScout brand report for "{brand_name}" and create a COMPREHENSIVE PRODUCT COMPARISON ANALYSIS:
@@ -765,6 +1000,135 @@ Complete HTML content:
     except Exception as e:
         return f"❌ Error generating summary: {str(e)}"
 
+def find_visible(page, selectors: list, timeout: int = 5000):
+    """
+    Wait once for any of the selectors to be visible, then return (locator, selector) for the first
+    visible one in list order, or (None, None) if none shows up within timeout ms.
+    """
+    try:
+        # A selector list is matched by the DOM engine in one query, so this is a single wait
+        page.locator(f"{', '.join(selectors)} >> visible=true").first.wait_for(state="visible", timeout=timeout)
+    except Exception:
+        return None, None
+    for selector in selectors:
+        locator = page.locator(f"{selector} >> visible=true").first
+        if locator.is_visible():
+            return locator, selector
+    return None, None
+
+@contextlib.contextmanager
+def browser_context(enabled=True):
+    """
+    Launch the logged-in browser context once, or yield None when enabled is False.
+    """
+    if not enabled:
+        yield None
+        return
+    with sync_playwright() as p:
+        context = p.chromium.launch_persistent_context(
+            USER_DATA_DIR,
+            headless=HEADLESS,
+            args=["--disable-dev-shm-usage", "--no-sandbox"]
+        )
+        context.route("**/*", _block_heavy_resources)
+        try:
+            yield context
+        finally:
+            context.close()
+
+@contextlib.contextmanager
+def brand_page(context=None):
+    """
+    New page in an existing context, or in a browser launched just for this brand.
+    """
+    if context is None:
+        with browser_context() as context:
+            yield context.new_page()
+        return
+    page = context.new_page()
+    try:
+        yield page
+    finally:
+        page.close()
+
+BRAND_URL_CACHE_FILE = os.path.join("html", ".brand_url_cache.json")
+_brand_url_cache = None
+
+def load_brand_url_cache() -> dict:
+    """
+    Brand name -> report URL from earlier runs, read from disk once per process.
+    Delete html/.brand_url_cache.json to force the search flow again.
+    """
+    global _brand_url_cache
+    if _brand_url_cache is None:
+        try:
+            with open(BRAND_URL_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _brand_url_cache = json.load(f)
+        except (FileNotFoundError, ValueError):
+            _brand_url_cache = {}
+    return _brand_url_cache
+
+def _save_brand_url_cache(cache: dict):
+    # Written beside the cache file and renamed in, so a crash never leaves it half-written
+    os.makedirs(os.path.dirname(BRAND_URL_CACHE_FILE), exist_ok=True)
+    tmp_file = BRAND_URL_CACHE_FILE + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_file, BRAND_URL_CACHE_FILE)
+
+def _is_report_url(url: str) -> bool:
+    """
+    True for a single report under the Brand Reports page; the list page itself,
+    sign-in redirects and other sites are never cached.
+    """
+    report_root = urlsplit(SMARTSCOUT_URL)
+    parts = urlsplit(url)
+    prefix = report_root.path.rstrip('/') + '/'
+    return (parts.netloc == report_root.netloc
+            and parts.path.startswith(prefix) and len(parts.path.rstrip('/')) > len(prefix))
+
+def remember_brand_url(brand_name: str, url: str):
+    """
+    Record the report URL a brand landed on and rewrite the cache file atomically.
+    """
+    if not _is_report_url(url):
+        print(f"⚠️  Not caching '{url}' for '{brand_name}': not a brand report URL")
+        return
+    cache = load_brand_url_cache()
+    if cache.get(brand_name) == url:
+        return
+    cache[brand_name] = url
+    _save_brand_url_cache(cache)
+
+def forget_brand_url(brand_name: str):
+    """
+    Drop a brand's cached URL so the next lookup goes through the search again.
+    """
+    cache = load_brand_url_cache()
+    if cache.pop(brand_name, None) is not None:
+        _save_brand_url_cache(cache)
+
+def open_cached_brand_page(page, brand_name: str) -> bool:
+    """
+    Open the brand's cached report URL and check that it really shows that brand.
+    Returns False (and forgets the entry) on a miss, a sign-in redirect or any other page.
+    """
+    cached_url = load_brand_url_cache().get(brand_name)
+    if not cached_url:
+        return False
+    print(f"🔗 Navigating to cached brand page: {cached_url}")
+    try:
+        page.goto(cached_url)
+        page.wait_for_load_state("domcontentloaded", timeout=30000)
+        if _is_report_url(page.url):
+            page.get_by_text(brand_name, exact=False).first.wait_for(state="visible", timeout=10000)
+            return True
+    except Exception:
+        pass
+    print(f"⚠️  Cached page for '{brand_name}' did not show the brand (landed on {page.url}), searching instead")
+    forget_brand_url(brand_name)
+    return False
+
 def process_brand_list(brands_input: str, action_type: str):
     """
     Process multiple brands from a comma-separated list or file.
@@ -774,13 +1138,10 @@ def process_brand_list(brands_input: str, action_type: str):
     # Check if it's a file path
     if brands_input.endswith('.txt') or brands_input.endswith('.csv'):
         try:
-            with open(brands_input, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                # Handle both comma-separated and line-separated formats
-                if ',' in content:
-                    brands = [brand.strip() for brand in content.split(',') if brand.strip()]
-                else:
-                    brands = [brand.strip() for brand in content.split('\n') if brand.strip()]
+            with open(brands_input, 'r', encoding='utf-8', newline='') as f:
+                # Read row by row; handles both comma-separated and line-separated formats,
+                # and quoted names that contain commas. Repeats are dropped, first occurrence kept.
+                brands = list(dict.fromkeys(brand.strip() for row in csv.reader(f) for brand in row if brand.strip()))
             print(f"📄 Loaded {len(brands)} brands from file: {brands_input}")
         except FileNotFoundError:
             print(f"❌ File not found: {brands_input}")
@@ -790,12 +1151,13 @@ def process_brand_list(brands_input: str, action_type: str):
             return
     else:
         # Treat as comma-separated list
-        brands = [brand.strip() for brand in brands_input.split(',') if brand.strip()]
+        brands = list(dict.fromkeys(brand.strip() for brand in brands_input.split(',') if brand.strip()))
         print(f"📝 Processing {len(brands)} brands from list")
     
     if not brands:
         print("❌ No brands found to process")
         return
+    total = len(brands)
     
     print(f"🚀 Starting batch {action_type} for brands:")
     for i, brand in enumerate(brands, 1):
@@ -805,66 +1167,82 @@ def process_brand_list(brands_input: str, action_type: str):
     # Process each brand and track results for collect operations
     collect_results = {"collected": [], "no_button": [], "not_found_in_search": [], "error": []} if action_type == "collect" else None
     
-    for i, brand in enumerate(brands, 1):
-        print(f"{'='*60}")
-        print(f"Processing {i}/{len(brands)}: {brand}")
-        print(f"{'='*60}")
+    if action_type == "summary":
+        # Summaries only wait on the LLM API and never touch the browser, so several run at once
+        with ThreadPoolExecutor(max_workers=max(1, min(SUMMARY_WORKERS, total))) as executor:
+            futures = [(brand, executor.submit(summarize_html, brand)) for brand in brands]
+            for brand, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error processing {brand}: {e}")
+    else:
+        # One browser for the whole batch; each brand gets its own page in it
+        with browser_context() as context:
+            for i, brand in enumerate(brands, 1):
+                print(f"{'='*60}")
+                print(f"Processing {i}/{total}: {brand}")
+                print(f"{'='*60}")
         
-        try:
-            if action_type == "collect":
-                result = collect_brand_data(brand, return_result=True)
-                if result:
-                    collect_results[result].append(brand)
-            elif action_type == "download": 
-                download_html_only(brand)
-            elif action_type == "summary":
-                summarize_html(brand)
+                try:
+                    if action_type == "collect":
+                        result = collect_brand_data(brand, return_result=True, context=context)
+                        if result:
+                            collect_results[result].append(brand)
+                    elif action_type == "download": 
+                        download_html_only(brand, context=context)
+                    elif action_type == "both":
+                        # Summarize straight from the downloaded page instead of reading the file back
+                        html_content = download_html_only(brand, context=context)
+                        if html_content:
+                            summarize_html(brand, html_content)
                 
-            # Small delay between brands to avoid overwhelming the server
-            if i < len(brands):
-                print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
-                time.sleep(3)
+                    # Small delay between brands to avoid overwhelming the server
+                    if i < total:
+                        print(f"\n⏳ Waiting 3 seconds before processing next brand...\n")
+                        time.sleep(3)
                 
-        except Exception as e:
-            print(f"❌ Error processing {brand}: {e}")
-            if action_type == "collect":
-                collect_results["error"].append(brand)
-            continue
+                except Exception as e:
+                    print(f"❌ Error processing {brand}: {e}")
+                    if action_type == "collect":
+                        collect_results["error"].append(brand)
+                    continue
     
     print(f"{'='*60}")
-    print(f"✅ Batch {action_type} completed for {len(brands)} brands")
+    print(f"✅ Batch {action_type} completed for {total} brands")
     
     # Special summary for collect operations
     if action_type == "collect" and collect_results:
         print(f"\n📊 COLLECT DATA SUMMARY:")
         print(f"{'='*60}")
-        print(f"✅ Data Collection Triggered: {len(collect_results['collected'])} brands")
-        if collect_results['collected']:
-            for brand in collect_results['collected']:
-                print(f"   • {brand}")
+        collected = collect_results['collected']
+        no_button = collect_results['no_button']
+        not_found = collect_results['not_found_in_search']
+        errors = collect_results['error']
+        print(f"✅ Data Collection Triggered: {len(collected)} brands")
+        if collected:
+            print("\n".join(f"   • {brand}" for brand in collected))
         
-        print(f"\nℹ️  No Button Found (Already Exists): {len(collect_results['no_button'])} brands") 
-        if collect_results['no_button']:
-            for brand in collect_results['no_button']:
-                print(f"   • {brand}")
+        print(f"\nℹ️  No Button Found (Already Exists): {len(no_button)} brands") 
+        if no_button:
+            print("\n".join(f"   • {brand}" for brand in no_button))
                 
-        print(f"\n🔍 Not Found in Search: {len(collect_results['not_found_in_search'])} brands")
-        if collect_results['not_found_in_search']:
-            for brand in collect_results['not_found_in_search']:
-                print(f"   • {brand}")
+        print(f"\n🔍 Not Found in Search: {len(not_found)} brands")
+        if not_found:
+            print("\n".join(f"   • {brand}" for brand in not_found))
                 
-        print(f"\n❌ Errors: {len(collect_results['error'])} brands")
-        if collect_results['error']:
-            for brand in collect_results['error']:
-                print(f"   • {brand}")
+        print(f"\n❌ Errors: {len(errors)} brands")
+        if errors:
+            print("\n".join(f"   • {brand}" for brand in errors))
                 
-        print(f"\n📈 Success Rate: {len(collect_results['collected'])}/{len(brands)} ({len(collect_results['collected'])/len(brands)*100:.1f}%)")
+        print(f"\n📈 Success Rate: {len(collected)}/{total} ({len(collected)/total*100:.1f}%)")
     
     print(f"{'='*60}")
 
-def collect_brand_data(brand_name: str, return_result=False):
+def collect_brand_data(brand_name: str, return_result=False, context=None):
     """
     Look for and click 'Collect {Brand Name}'s Data Now' button without downloading report.
+    Pass an open browser context to reuse it instead of launching a new browser.
     """
     # Create html folder if it doesn't exist (for consistency)
     html_folder = "html"
@@ -872,99 +1250,69 @@ def collect_brand_data(brand_name: str, return_result=False):
         os.makedirs(html_folder)
         print(f"📁 Created {html_folder} folder")
     
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(USER_DATA_DIR, headless=False, slow_mo=500)
-        page = context.new_page()
-        print(f"Navigating to the Brand Reports page: {SMARTSCOUT_URL}")
-        page.goto(SMARTSCOUT_URL)
+    with brand_page(context) as page:
+        from_cache = open_cached_brand_page(page, brand_name)
+        if not from_cache:
+            print(f"Navigating to the Brand Reports page: {SMARTSCOUT_URL}")
+            page.goto(SMARTSCOUT_URL)
         try:
-            # 1. Search for the brand in existing reports
-            print(f"Searching for brand: '{brand_name}'")
-            
-            # Wait for page to load
-            page.wait_for_load_state("domcontentloaded", timeout=30000)
-            time.sleep(2)
+            # A verified cached report URL skips the search box and results entirely
+            if not from_cache:
+                # 1. Search for the brand in existing reports
+                print(f"Searching for brand: '{brand_name}'")
             
-            # Look for search functionality
-            search_selectors = [
-                'input[placeholder*="search" i]',
-                'input[placeholder*="brand" i]',
-                'input[type="search"]',
-                '.search-input',
-                '[data-testid*="search"]'
-            ]
+                # Wait for page to load
+                page.wait_for_load_state("domcontentloaded", timeout=30000)
+                time.sleep(2)
             
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = page.locator(selector).first
-                    if search_input.is_visible(timeout=2000):
-                        print(f"Found search input with selector: {selector}")
-                        break
-                except:
-                    continue
+                # Look for search functionality
+                search_input, selector = find_visible(page, SEARCH_SELECTORS, timeout=5000)
+                if search_input:
+                    print(f"Found search input with selector: {selector}")
             
-            if search_input and search_input.is_visible():
-                print(f"🔍 Searching for brand: {brand_name}")
-                search_input.fill(brand_name)
-                search_input.press("Enter")
+                if search_input and search_input.is_visible():
+                    print(f"🔍 Searching for brand: {brand_name}")
+                    search_input.fill(brand_name)
+                    search_input.press("Enter")
                 
-                # Wait for search results
-                print(f"Waiting for search results...")
-                time.sleep(5)  # Simple 5-second wait for results to appear
+                    # Wait for the brand name to show up in search results
+                    print(f"Looking for '{brand_name}' in search results...")
+                    brand_selectors = [
+                        f'a:has-text("{brand_name}")',
+                        f'button:has-text("{brand_name}")',  
+                        f'[title*="{brand_name}" i]',
+                        f':text-is("{brand_name}")',
+                        f':text("{brand_name}")',
+                    ]
                 
-                # Look for the brand name in search results
-                print(f"Looking for '{brand_name}' in search results...")
-                brand_selectors = [
-                    f'a:has-text("{brand_name}")',
-                    f'button:has-text("{brand_name}")',  
-                    f'[title*="{brand_name}" i]',
-                    f':text-is("{brand_name}")',
-                    f':text("{brand_name}")',
-                ]
-                
-                brand_link = None
-                # Try multiple times with increasing timeouts
-                found = False
-                for attempt in range(3):
-                    print(f"Search attempt {attempt + 1}/3...")
-                    for selector in brand_selectors:
-                        try:
-                            brand_link = page.locator(selector).first
-                            if brand_link.is_visible(timeout=3000):
-                                print(f"✅ Found brand link with selector: {selector}")
-                                found = True
-                                break
-                        except:
-                            continue
-                    
-                    if found:  # Exit outer loop if found
-                        break
-                    
-                    if attempt < 2:  # Don't wait after last attempt
-                        print(f"⏳ Brand not found yet, waiting 2 more seconds...")
-                        time.sleep(2)
+                    brand_link, selector = find_visible(page, brand_selectors, timeout=10000)
+                    if brand_link:
+                        print(f"✅ Found brand link with selector: {selector}")
                 
-                if brand_link and brand_link.is_visible():
-                    print(f"📊 Clicking on '{brand_name}' to open brand page...")
-                    brand_link.click()
+                    if brand_link and brand_link.is_visible():
+                        print(f"📊 Clicking on '{brand_name}' to open brand page...")
+                        brand_link.click()
                     
-                    # Wait for brand page to load
-                    print("⏳ Waiting for brand page to load...")
-                    page.wait_for_load_state("domcontentloaded", timeout=30000)
-                    time.sleep(3)
+                        # Wait for brand page to load and its requests to settle
+                        print("⏳ Waiting for brand page to load...")
+                        page.wait_for_load_state("domcontentloaded", timeout=30000)
+                        try:
+                            page.wait_for_load_state("networkidle", timeout=10000)
+                        except Exception:
+                            pass  # Page keeps polling; the button lookup below still waits for it
+                    else:
+                        print(f"❌ Could not find '{brand_name}' in search results")
+                        result = "not_found_in_search"
+                        if return_result:
+                            return result
+                        return
                 else:
-                    print(f"❌ Could not find '{brand_name}' in search results")
-                    result = "not_found_in_search"
+                    print("❌ Could not find search input")
+                    result = "error"
                     if return_result:
                         return result
                     return
-            else:
-                print("❌ Could not find search input")
-                result = "error"
-                if return_result:
-                    return result
-                return
+                remember_brand_url(brand_name, page.url)
             
             # 3. Now look for the 'Collect Brand Data Now' button on the brand page
             print(f"Looking for 'Collect {brand_name}'s Data Now' button on brand page...")
@@ -987,15 +1335,9 @@ def collect_brand_data(brand_name: str, return_result=False):
                 '[class*="collect"]'
             ]
             
-            collect_button = None
-            for selector in collect_button_selectors:
-                try:
-                    collect_button = page.locator(selector).first
-                    if collect_button.is_visible(timeout=2000):
-                        print(f"✅ Found collect data button with selector: {selector}")
-                        break
-                except:
-                    continue
+            collect_button, selector = find_visible(page, collect_button_selectors, timeout=3000)
+            if collect_button:
+                print(f"✅ Found collect data button with selector: {selector}")
             
             if collect_button and collect_button.is_visible():
                 print(f"🎯 Clicking 'Collect {brand_name}'s Data Now' button...")
@@ -1012,15 +1354,15 @@ def collect_brand_data(brand_name: str, return_result=False):
         except Exception as e:
             print(f"❌ An error occurred: {str(e)}")
             result = "error"
-        finally:
-            context.close()
         
         if return_result:
             return result
 
-def download_html_only(brand_name: str):
+def download_html_only(brand_name: str, context=None):
     """
     Download HTML report and save to html folder without summarizing.
+    Pass an open browser context to reuse it instead of launching a new browser.
+    Returns the saved HTML, or None if nothing was saved.
     """
     # Create html folder if it doesn't exist
     html_folder = "html"
@@ -1028,153 +1370,166 @@ def download_html_only(brand_name: str):
         os.makedirs(html_folder)
         print(f"📁 Created {html_folder} folder")
     
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(USER_DATA_DIR, headless=False, slow_mo=500)
-        page = context.new_page()
-        print(f"Navigating to the Brand Reports page: {SMARTSCOUT_URL}")
-        page.goto(SMARTSCOUT_URL)
+    with brand_page(context) as page:
+        from_cache = open_cached_brand_page(page, brand_name)
+        if not from_cache:
+            print(f"Navigating to the Brand Reports page: {SMARTSCOUT_URL}")
+            page.goto(SMARTSCOUT_URL)
         try:
-            # 1. Search for the brand in existing reports
-            print(f"Searching for existing brand report: '{brand_name}'")
+            # A verified cached report URL skips the search box and results entirely
+            if not from_cache:
+                # 1. Search for the brand in existing reports
+                print(f"Searching for existing brand report: '{brand_name}'")
             
-            # Wait for page to load
-            page.wait_for_load_state("domcontentloaded", timeout=30000)
-            time.sleep(2)
+                # Wait for page to load
+                page.wait_for_load_state("domcontentloaded", timeout=30000)
+                time.sleep(2)
             
-            # Look for search functionality or directly find the brand report
-            # Try different search input selectors
-            search_selectors = [
-                'input[placeholder*="search" i]',
-                'input[placeholder*="brand" i]',
-                'input[type="search"]',
-                '.search-input',
-                '[data-testid*="search"]'
-            ]
+                # Look for search functionality or directly find the brand report
+                # Try different search input selectors
+                search_input, selector = find_visible(page, SEARCH_SELECTORS, timeout=5000)
+                if search_input:
+                    print(f"Found search input with selector: {selector}")
             
-            search_input = None
-            for selector in search_selectors:
-                try:
-                    search_input = page.locator(selector).first
-                    if search_input.is_visible(timeout=2000):
-                        print(f"Found search input with selector: {selector}")
-                        break
-                except:
-                    continue
-            
-            if search_input and search_input.is_visible():
-                print(f"🔍 Searching for brand: {brand_name}")
-                search_input.fill(brand_name)
-                search_input.press("Enter")
-                time.sleep(3)
+                if search_input and search_input.is_visible():
+                    print(f"🔍 Searching for brand: {brand_name}")
+                    search_input.fill(brand_name)
+                    search_input.press("Enter")
+                    time.sleep(3)
             
-            # 2. Look for the specific brand report link
-            print(f"Looking for '{brand_name}' report link...")
+                # 2. Look for the specific brand report link
+                print(f"Looking for '{brand_name}' report link...")
             
-            # Try to find a link or button that contains the brand name
-            brand_selectors = [
-                f'a:has-text("{brand_name}")',
-                f'button:has-text("{brand_name}")',
-                f'[title*="{brand_name}" i]',
-                f'[data-brand*="{brand_name}" i]',
-                f':text-is("{brand_name}")',
-                f':text("{brand_name}")',
-            ]
+                # Try to find a link or button that contains the brand name
+                brand_selectors = [
+                    f'a:has-text("{brand_name}")',
+                    f'button:has-text("{brand_name}")',
+                    f'[title*="{brand_name}" i]',
+                    f'[data-brand*="{brand_name}" i]',
+                    f':text-is("{brand_name}")',
+                    f':text("{brand_name}")',
+                ]
             
-            brand_link = None
-            for selector in brand_selectors:
-                try:
-                    brand_link = page.locator(selector).first
-                    if brand_link.is_visible(timeout=2000):
-                        print(f"Found brand report with selector: {selector}")
-                        break
-                except:
-                    continue
+                brand_link, selector = find_visible(page, brand_selectors, timeout=5000)
+                if brand_link:
+                    print(f"Found brand report with selector: {selector}")
             
-            if not brand_link or not brand_link.is_visible():
-                # Try a more general approach - look for any clickable element containing brand name
-                try:
-                    brand_link = page.get_by_text(brand_name, exact=False).first
-                    if brand_link.is_visible(timeout=2000):
-                        print("Found brand report using text search")
-                except:
-                    print(f"❌ Could not find brand report for '{brand_name}'")
-                    print("Available reports on page:")
-                    # Try to list available reports
+                if not brand_link or not brand_link.is_visible():
+                    # Try a more general approach - look for any clickable element containing brand name
                     try:
-                        reports = page.locator('a, button').all()
-                        for report in reports[:10]:
-                            try:
-                                text = report.inner_text(timeout=1000)
-                                if text and len(text.strip()) > 0:
-                                    print(f"  - {text.strip()}")
-                            except:
-                                pass
+                        brand_link = page.get_by_text(brand_name, exact=False).first
+                        if brand_link.is_visible(timeout=2000):
+                            print("Found brand report using text search")
                     except:
-                        pass
-                    return
+                        print(f"❌ Could not find brand report for '{brand_name}'")
+                        print("Available reports on page:")
+                        # Try to list available reports
+                        try:
+                            # One evaluate call instead of an inner_text round-trip per element
+                            texts = page.eval_on_selector_all(
+                                "a, button",
+                                "(els) => els.slice(0, 10).map(e => (e.innerText || '').trim()).filter(Boolean)"
+                            )
+                            for text in texts:
+                                print(f"  - {text}")
+                        except:
+                            pass
+                        return
             
-            # 3. Click on the brand report
-            print(f"📊 Opening '{brand_name}' report...")
-            brand_link.click()
+                # 3. Click on the brand report
+                print(f"📊 Opening '{brand_name}' report...")
+                brand_link.click()
             
             # Wait for the report to load
             print("⏳ Waiting for report to load...")
             page.wait_for_load_state("domcontentloaded", timeout=60000)
             time.sleep(5)
+            if not from_cache:
+                remember_brand_url(brand_name, page.url)
             
             # 4. Save HTML content
             print("💾 Saving HTML content...")
+            # The whole document is kept: the metric extractors and the size check read all of it
             html_content = page.content()
-            html_file = os.path.join(html_folder, f"{brand_name.replace(' ', '_').lower()}_report.html")
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            if not html_content or not html_content.strip():
+                print(f"❌ Report page for '{brand_name}' came back empty, nothing saved")
+                return
+            html_file = os.path.join(html_folder, f"{_brand_slug(brand_name)}_report.html")
+            # Encoded once and renamed into place, so a crash never leaves a partial report
+            data = html_content.encode("utf-8")
+            if GZIP_HTML:
+                # Level 3 keeps most of the size win on markup at a fraction of level 9's CPU
+                html_file += ".gz"
+                data = gzip.compress(data, compresslevel=3)
+            tmp_file = html_file + ".tmp"
+            with open(tmp_file, "wb", buffering=1 << 20) as f:
+                f.write(data)
+            os.replace(tmp_file, html_file)
+            # Drop the other variant so a summary never reads an older copy of this report
+            stale_file = html_file[:-3] if GZIP_HTML else html_file + ".gz"
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(stale_file)
             print(f"📄 HTML saved as: {html_file}")
             print(f"✅ Download completed! Use --summary to generate analysis.")
+            return html_content
             
         except Exception as e:
             print(f"❌ An error occurred: {str(e)}")
-        finally:
-            context.close()
 
-def summarize_html(brand_name: str):
+def summarize_html(brand_name: str, html_content: str = None):
     """
-    Generate LLM summary from existing HTML file.
+    Generate LLM summary from existing HTML file, or from html_content when the report was just downloaded.
     """
     html_folder = "html"
     summary_folder = "summary"
     
     # Create summary folder if it doesn't exist
     if not os.path.exists(summary_folder):
-        os.makedirs(summary_folder)
+        os.makedirs(summary_folder, exist_ok=True)  # A parallel summary may create it first
         print(f"📁 Created {summary_folder} folder")
     
-    # Find HTML file
-    html_file = os.path.join(html_folder, f"{brand_name.replace(' ', '_').lower()}_report.html")
-    
-    if not os.path.exists(html_file):
-        print(f"❌ HTML file not found: {html_file}")
-        print(f"💡 Run 'python smartscout_downloader.py \"{brand_name}\"' first to download the report")
-        return
+    if html_content is None:
+        # Find HTML file
+        html_file = os.path.join(html_folder, f"{_brand_slug(brand_name)}_report.html")
+        # Saved with --gzip; when both variants exist the newer one is the current report
+        try:
+            if os.path.getmtime(html_file + ".gz") >= os.path.getmtime(html_file):
+                html_file += ".gz"
+        except FileNotFoundError:
+            if os.path.exists(html_file + ".gz"):
+                html_file += ".gz"
+        
+        if not os.path.exists(html_file):
+            print(f"❌ HTML file not found: {html_file}")
+            print(f"💡 Run 'python smartscout_downloader.py \"{brand_name}\"' first to download the report")
+            return
     
     try:
-        # Read HTML content
-        with open(html_file, "r", encoding="utf-8") as f:
-            html_content = f.read()
-        
-        print(f"📄 Found HTML file: {html_file}")
-        print(f"📊 Processing {len(html_content)} characters of HTML content")
+        if html_content is None:
+            # Read HTML content
+            opener = gzip.open if html_file.endswith(".gz") else open
+            with opener(html_file, "rt", encoding="utf-8") as f:
+                html_content = f.read()
+            
+            print(f"📄 Found HTML file: {html_file}")
+        raw_length = len(html_content)
+        html_content = _shrink_html(html_content)
+        print(f"📊 Processing {len(html_content)} characters of HTML content ({raw_length} before stripping scripts and styles)")
         
         # Extract metrics with HTML content
         extracted_metrics = {'html_content': html_content}
         
         # Generate AI summary
         print("\n📝 Generating AI summary of the report...")
-        summary = summarize_with_llm("", brand_name, extracted_metrics)
+        summary = summarize_with_llm("", brand_name, extracted_metrics, use_batch_api=LLM_BATCH_API)
         
         # Save summary to summary folder
-        summary_file = os.path.join(summary_folder, f"{brand_name.replace(' ', '_').lower()}_analysis.txt")
-        with open(summary_file, "w", encoding="utf-8") as f:
+        summary_file = os.path.join(summary_folder, f"{_brand_slug(brand_name)}_analysis.txt")
+        # Written beside the target and renamed in, so an interrupted batch never leaves a partial summary
+        tmp_file = summary_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
             f.write(summary)
+        os.replace(tmp_file, summary_file)
         
         print(f"📄 Summary saved to: {summary_file}")
         print("="*60)
@@ -1190,7 +1545,7 @@ def run_automation(brand_name: str):
     Main function to run the browser automation.
     """
     with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(USER_DATA_DIR, headless=False, slow_mo=500)
+        context = p.chromium.launch_persistent_context(USER_DATA_DIR, headless=HEADLESS)
         page = context.new_page()
         print(f"Navigating to the Brand Reports page: {SMARTSCOUT_URL}")
         page.goto(SMARTSCOUT_URL)
@@ -1319,6 +1674,16 @@ def setup_session():
     print("You can now run the script with a brand name to generate reports.")
 
 if __name__ == "__main__":
+    if "--gzip" in sys.argv:
+        sys.argv.remove("--gzip")
+        GZIP_HTML = True
+    if "--batch-api" in sys.argv:
+        sys.argv.remove("--batch-api")
+        LLM_BATCH_API = True
+    if "--headed" in sys.argv:
+        sys.argv.remove("--headed")
+        HEADLESS = False
+    
     if "--setup" in sys.argv:
         setup_session()
     elif "--collect" in sys.argv:
@@ -1349,6 +1714,22 @@ if __name__ == "__main__":
             print("   or: python smartscout_downloader.py --summary \"Brand1, Brand2, Brand3\"")
             print("   or: python smartscout_downloader.py --summary brands.txt")
             sys.exit(1)
+    elif "--both" in sys.argv:
+        if len(sys.argv) > 2:
+            brands_input = sys.argv[2]
+            # Check if it's a list (contains comma) or file (ends with .txt/.csv)
+            if ',' in brands_input or brands_input.endswith(('.txt', '.csv')):
+                process_brand_list(brands_input, "both")
+            else:
+                html_content = download_html_only(brands_input)
+                if html_content:
+                    summarize_html(brands_input, html_content)
+        else:
+            print("❌ Brand name(s) required for --both option")
+            print("Usage: python smartscout_downloader.py --both \"Brand Name\"")
+            print("   or: python smartscout_downloader.py --both \"Brand1, Brand2, Brand3\"")
+            print("   or: python smartscout_downloader.py --both brands.txt")
+            sys.exit(1)
     elif len(sys.argv) > 1:
         brands_input = sys.argv[1]
         # Check if it's a list (contains comma) or file (ends with .txt/.csv)
@@ -1368,8 +1749,14 @@ if __name__ == "__main__":
         print("    python smartscout_downloader.py \"Brand Name\"")
         print("    python smartscout_downloader.py \"Brand1, Brand2, Brand3\"")
         print("    python smartscout_downloader.py brands.txt")
+        print("    (add --gzip to save reports as compressed .html.gz)")
+        print("    (add --headed to watch the browser while it works)")
         print("\n  To generate AI summary from existing HTML:")
         print("    python smartscout_downloader.py --summary \"Brand Name\"")
         print("    python smartscout_downloader.py --summary \"Brand1, Brand2, Brand3\"")
         print("    python smartscout_downloader.py --summary brands.txt")
+        print("    (add --batch-api to analyse large reports via the Message Batches API)")
+        print("\n  To download brand report(s) and summarize them in one pass:")
+        print("    python smartscout_downloader.py --both \"Brand Name\"")
+        print("    python smartscout_downloader.py --both brands.txt")
         sys.exit(1)